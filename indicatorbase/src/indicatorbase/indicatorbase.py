@@ -40,12 +40,14 @@ References
 '''
 
 
+import codecs
 import datetime
 import email.policy
 import gettext
 import json
 import logging.handlers
 import pickle
+import re
 import shutil
 import signal
 import socket
@@ -57,11 +59,12 @@ import webbrowser
 
 from abc import ABC, abstractmethod
 from bisect import bisect_right
+from http import HTTPStatus
 from importlib import metadata
 from pathlib import Path, PosixPath
 from threading import Lock
 from urllib.error import HTTPError, URLError
-from urllib.request import urlopen
+from urllib.request import Request, urlopen
 from zipfile import ZipFile
 
 import gi
@@ -108,6 +111,12 @@ class IndicatorBase( ABC ):
 
     _CACHE_DATE_TIME_FORMAT_YYYYMMDDHHMMSS = "%Y%m%d%H%M%S"
 
+    # The response of the version check is kept in the cache so that the next
+    # check is conditional and the releases are only retrieved when changed.
+    # Once checked, the responses of any previous checks are flushed.
+    _CACHE_RELEASES_BASENAME = "releases-"
+    _CACHE_RELEASES_MAXIMUM_AGE_HOURS = 1
+
     _CONFIG_CHECK_LATEST_VERSION = "checklatestversion"
     _CONFIG_VERSION = "version"
 
@@ -147,10 +156,20 @@ class IndicatorBase( ABC ):
 
     _EXTENSION_JSON = ".json"
 
+    # Validators (ETag, Last-Modified) of a response saved to a file in the
+    # cache are kept in a file named as the file but with the validators
+    # extension.  The validators extension sorts before the extension of the
+    # file, so the file remains the newest in the cache, and the validators
+    # are flushed along with the file as both share the same timestamp.
+    _EXTENSION_VALIDATORS = ".http"
+
     # From (approximately) GNOME Shell version 46, the text in a radiomenuitem
     # is out of alignment with respect to text in a menuitem.
     _GNOME_SHELL_VERSION_FOR_RADIOMENUITEM_WORKAROUND = 46.0
 
+    # Bytes read at a time when reading a JSON array from a URL.
+    _JSON_ARRAY_CHUNK_SIZE = 64 * 1024
+
     _LOGGING_INITIALISED = False
 
     _TERMINALS_AND_EXECUTION_FLAGS = [ [ "gnome-terminal", "--" ] ]
@@ -377,7 +396,15 @@ class IndicatorBase( ABC ):
         data_json, error_network, error_timeout = (
             self.get_json(
                 self.get_project_url_releases_api(),
-                ignore_failure = True ) )
+                ignore_failure = True,
+                filename =
+                    self.get_cache_filename_with_timestamp(
+                        IndicatorBase._CACHE_RELEASES_BASENAME,
+                        IndicatorBase._EXTENSION_JSON ) ) )
+
+        self.flush_cache(
+            IndicatorBase._CACHE_RELEASES_BASENAME,
+            IndicatorBase._CACHE_RELEASES_MAXIMUM_AGE_HOURS )
 
         version_github = ""
         if data_json:
@@ -410,13 +437,18 @@ class IndicatorBase( ABC ):
     def get_json(
         url,
         data = None,
-        ignore_failure = False ):
+        ignore_failure = False,
+        filename = None ):
         '''
         Retrieves the JSON content from a URL.
 
         If data is not None, this request is treated as a POST
         and the data is serialised to a JSON object.
 
+        If filename is not None, the JSON content is also saved to the file, as
+        per download(), and is not retrieved again if unchanged since the
+        previous file for the URL was saved.
+
         On success, returns a tuple of the JSON and two booleans set to false.
 
         On exception (timeout, network error) returns a tuple with None for the
@@ -432,21 +464,37 @@ class IndicatorBase( ABC ):
         '''
         error_network = False
         error_timeout = False
-        try:
-            data_ = data
-            if data:
-                data_ = json.dumps( data ).encode( "utf-8" ) # Convert to bytes.
+        request, filename_previous = (
+            IndicatorBase._get_request( url, data, filename ) )
 
-            with (
-                urlopen(
-                    url,
-                    data = data_,
-                    timeout = IndicatorBase.TIMEOUT_IN_SECONDS ) ) as f:
+        try:
+            with urlopen( request, timeout = IndicatorBase.TIMEOUT_IN_SECONDS ) as f:
+                text = f.read().decode( "utf-8" )
+                if filename:
+                    IndicatorBase.write_text_file( filename, text )
+                    IndicatorBase._write_validators( url, filename, f.headers )
 
-                json_ = json.loads( f.read().decode( "utf-8" ) )
+            json_ = json.loads( text )
 
         except ( HTTPError, URLError ) as e:
-            if not ignore_failure:
+            json_ = None
+            not_modified = (
+                isinstance( e, HTTPError )
+                and
+                e.code == HTTPStatus.NOT_MODIFIED
+                and
+                filename_previous is not None )
+
+            restamped = (
+                not_modified
+                and
+                IndicatorBase._restamp_cache_file(
+                    url, filename_previous, filename, e.headers ) )
+
+            if restamped:
+                json_ = json.loads( ''.join( IndicatorBase.read_text_file( filename ) ) )
+
+            elif not ignore_failure:
                 if isinstance( e.reason, socket.timeout ):
                     error_timeout = True
 
@@ -457,8 +505,6 @@ class IndicatorBase( ABC ):
                     logging.error( f"Problem with { url }" )
                     logging.exception( e )
 
-            json_ = None
-
         except socket.timeout as e:
             if not ignore_failure:
                 error_timeout = True
@@ -471,6 +517,121 @@ class IndicatorBase( ABC ):
         return json_, error_network, error_timeout
 
 
+    @staticmethod
+    def get_json_array(
+        url,
+        key,
+        function,
+        data = None ):
+        '''
+        Retrieves the JSON content from a URL, as per get_json(), but rather
+        than returning the JSON, calls the function on each element of the
+        (first) array with the given key, as each element is read.
+
+        Only the element being read is held in memory, which for a large
+        response is a fraction of the memory to hold the JSON.
+
+        On success, returns a tuple of True and two booleans set to False.
+
+        If the array is not found or is incomplete, returns a tuple of False
+        and two booleans set to False.
+
+        On exception (timeout, network error) returns a tuple of False
+        followed by two booleans, one of which will be set to True.
+        The first boolean indicates a network error and the second boolean
+        indicates a timeout.
+        '''
+        found = False
+        error_network = False
+        error_timeout = False
+        try:
+            data_ = data
+            if data:
+                data_ = json.dumps( data ).encode( "utf-8" ) # Convert to bytes.
+
+            with (
+                urlopen(
+                    url,
+                    data = data_,
+                    timeout = IndicatorBase.TIMEOUT_IN_SECONDS ) ) as f:
+
+                found = IndicatorBase._read_json_array( f, key, function )
+
+        except ( HTTPError, URLError ) as e:
+            if isinstance( e.reason, socket.timeout ):
+                error_timeout = True
+
+            else:
+                error_network = True
+
+            if IndicatorBase._LOGGING_INITIALISED:
+                logging.error( f"Problem with { url }" )
+                logging.exception( e )
+
+        except socket.timeout as e:
+            error_timeout = True
+            if IndicatorBase._LOGGING_INITIALISED:
+                logging.error( f"Problem with { url }" )
+                logging.exception( e )
+
+        return found, error_network, error_timeout
+
+
+    @staticmethod
+    def _read_json_array(
+        f,
+        key,
+        function ):
+        '''
+        Read JSON from the binary stream a chunk at a time, calling the
+        function on each element of the (first) array with the given key.
+
+        Each element must be an object, array or string; a number or literal
+        split across chunks would otherwise be decoded as complete.
+
+        Returns True if the array is read to the end; False otherwise.
+        '''
+        decoder = json.JSONDecoder()
+        utf8_decoder = codecs.getincrementaldecoder( "utf-8" )()
+        array_start = re.compile( '"' + re.escape( key ) + r'"\s*:\s*\[' )
+        whitespace_and_comma = re.compile( r"[\s,]*" )
+
+        text = ""
+        index = None # Index into text; None until the array is found.
+        found = False
+        end_of_stream = False
+        while not found and not end_of_stream:
+            chunk = f.read( IndicatorBase._JSON_ARRAY_CHUNK_SIZE )
+            end_of_stream = not chunk
+            text = text[ index or 0 : ] + utf8_decoder.decode( chunk, end_of_stream )
+            index = None if index is None else 0
+
+            if index is None:
+                match = array_start.search( text )
+                if match:
+                    index = match.end()
+
+            while index is not None and not found:
+                index = whitespace_and_comma.match( text, index ).end()
+                if index == len( text ):
+                    break # Need more text.
+
+                if text[ index ] == ']':
+                    found = True
+                    break
+
+                try:
+                    element, index_ = decoder.raw_decode( text, index )
+
+                except json.JSONDecodeError:
+                    break # Element is incomplete; need more text.
+
+                function( element )
+                index = index_
+
+        return found
+
+
     @staticmethod
     def get_project_metadata(
         indicator_name ):
@@ -3146,14 +3307,46 @@ class IndicatorBase( ABC ):
     def download(
         url,
         filename ):
-        ''' Download the contents of the given URL and save to file. '''
+        '''
+        Download the contents of the given URL and save to file.
+
+        The filename is expected to be of the form
+            basenameCACHE_DATE_TIME_FORMAT_YYYYMMDDHHMMSSextension
+
+        Any validators (ETag, Last-Modified) in the response are saved
+        alongside the file and sent when the URL is next downloaded.  If the
+        contents are unchanged (304 Not Modified), the previous file is
+        re-stamped as the given filename in lieu of a download.
+
+        Returns True on success; False on any error, including a failure to
+        re-stamp the previous file.
+        '''
         downloaded = False
+        request, filename_previous = (
+            IndicatorBase._get_request( url, None, filename ) )
+
         try:
-            with urlopen( url, timeout = IndicatorBase.TIMEOUT_IN_SECONDS ) as f_in:
+            with urlopen( request, timeout = IndicatorBase.TIMEOUT_IN_SECONDS ) as f_in:
                 IndicatorBase.write_text_file( filename, f_in.read().decode() )
+                IndicatorBase._write_validators( url, filename, f_in.headers )
 
             downloaded = True
 
+        except HTTPError as e:
+            not_modified = (
+                e.code == HTTPStatus.NOT_MODIFIED
+                and
+                filename_previous is not None )
+
+            if not_modified:
+                downloaded = (
+                    IndicatorBase._restamp_cache_file(
+                        url, filename_previous, filename, e.headers ) )
+
+            elif IndicatorBase._LOGGING_INITIALISED:
+                logging.error( "Error downloading from " + str( url ) )
+                logging.exception( e )
+
         except URLError as e:
             if IndicatorBase._LOGGING_INITIALISED:
                 logging.error( "Error downloading from " + str( url ) )
@@ -3162,6 +3355,165 @@ class IndicatorBase( ABC ):
         return downloaded
 
 
+    @staticmethod
+    def _get_request(
+        url,
+        data,
+        filename ):
+        '''
+        Create the request for the URL.
+
+        If data is not None, the request is a POST and the data is serialised
+        to a JSON object.
+
+        Otherwise, if filename is not None, the previous file in the cache
+        for the same basename is found and if downloaded from the same URL,
+        the request is made conditional on the validators of that file.
+
+        Returns a tuple of the request and the previous file, which is None if
+        the request is not conditional.
+        '''
+        data_ = data
+        if data:
+            data_ = json.dumps( data ).encode( "utf-8" ) # Convert to bytes.
+
+        headers = { }
+        filename_previous = None
+        if data is None and filename:
+            filename_previous = IndicatorBase._get_cache_previous_filename( filename )
+            if filename_previous:
+                validators = { }
+                try:
+                    with open(
+                        filename_previous.with_suffix( IndicatorBase._EXTENSION_VALIDATORS ),
+                        'r',
+                        encoding = "utf-8" ) as f_in:
+
+                        validators = json.load( f_in )
+
+                except ( OSError, ValueError ):
+                    pass
+
+                if validators.get( "url" ) == url:
+                    if "ETag" in validators:
+                        headers[ "If-None-Match" ] = validators[ "ETag" ]
+
+                    if "Last-Modified" in validators:
+                        headers[ "If-Modified-Since" ] = validators[ "Last-Modified" ]
+
+            if not headers:
+                filename_previous = None
+
+        return Request( url, data = data_, headers = headers ), filename_previous
+
+
+    @staticmethod
+    def _get_cache_previous_filename(
+        filename ):
+        '''
+        For a filename of the form
+            basenameCACHE_DATE_TIME_FORMAT_YYYYMMDDHHMMSSextension
+
+        find the newest file in the same directory with the same basename and
+        extension, but older timestamp.
+
+        The timestamp must immediately follow the basename, as basenames may
+        be shared ("icon-" versus "icon-fullmoon-").
+
+        Returns the previous file; None if no file can be found.
+        '''
+        filename = Path( filename )
+        extension = filename.suffix
+
+        # len( YYYYMMDDHHMMSS ) = 14.
+        basename = filename.name[ : len( filename.name ) - len( extension ) - 14 ]
+
+        filename_previous = None
+        if basename and extension:
+            for file_ in filename.parent.iterdir():
+                is_previous = (
+                    file_.name.startswith( basename )
+                    and
+                    file_.suffix == extension
+                    and
+                    len( file_.name ) == len( filename.name )
+                    and
+                    file_.name[ len( basename ) : len( basename ) + 14 ].isdigit()
+                    and
+                    file_.name < filename.name )
+
+                if is_previous:
+                    if filename_previous is None or file_.name > filename_previous.name:
+                        filename_previous = file_
+
+        return filename_previous
+
+
+    @staticmethod
+    def _write_validators(
+        url,
+        filename,
+        headers ):
+        '''
+        Write the validators (ETag, Last-Modified), if any, from the headers of
+        a response for the URL, to the validators file of the given filename.
+
+        A failure to write is ignored as the next download will simply not be
+        conditional.
+        '''
+        validators = {
+            key : headers[ key ]
+            for key in ( "ETag", "Last-Modified" )
+            if headers.get( key ) }
+
+        if validators:
+            validators[ "url" ] = url
+            try:
+                with open(
+                    Path( filename ).with_suffix( IndicatorBase._EXTENSION_VALIDATORS ),
+                    'w',
+                    encoding = "utf-8" ) as f_out:
+
+                    json.dump( validators, f_out )
+
+            except OSError:
+                pass
+
+
+    @staticmethod
+    def _restamp_cache_file(
+        url,
+        filename_previous,
+        filename,
+        headers ):
+        '''
+        The contents of the URL are unchanged since the previous file was
+        downloaded, so rename the previous file, along with any files kept
+        alongside (such as the validators), to the given filename.
+
+        Any validators in the headers of the (304) response replace those of
+        the previous file.
+
+        Returns True on success; on failure to rename, logs the error and
+        returns False.
+        '''
+        filename = Path( filename )
+        try:
+            for file_ in filename_previous.parent.iterdir():
+                if file_.stem == filename_previous.stem:
+                    file_.rename( filename.with_suffix( file_.suffix ) )
+
+        except OSError as e:
+            if IndicatorBase._LOGGING_INITIALISED:
+                logging.error( "Error re-stamping the cache file for " + str( url ) )
+                logging.exception( e )
+
+            return False
+
+        IndicatorBase._write_validators( url, filename, headers )
+        return True
+
+
     @abstractmethod
     def load_config(
         self,
@@ -3517,6 +3869,62 @@ class IndicatorBase( ABC ):
         return file_
 
 
+    def read_cache_binary_without_timestamp(
+        self,
+        filename ):
+        '''
+        Read the named binary file from the cache.
+
+        filename: The name of the file.
+
+        Returns the binary object; None when the file does not exist, or
+        cannot be read (such as a truncated file, or a file written by a
+        different version of the pickled classes) and logs.
+        '''
+        data = None
+        file_ = self.get_cache_directory() / filename
+        if file_.is_file():
+            try:
+                with open( file_, 'rb' ) as f_in:
+                    data = pickle.load( f_in )
+
+            except (
+                AttributeError,
+                EOFError,
+                ImportError,
+                OSError,
+                pickle.UnpicklingError,
+                ValueError ) as e:
+
+                data = None
+                if IndicatorBase._LOGGING_INITIALISED:
+                    logging.error( "Unable to read " + str( file_ ) + "; ignored." )
+                    logging.exception( e )
+
+        return data
+
+
+    def write_cache_binary_without_timestamp(
+        self,
+        binary_data,
+        filename ):
+        '''
+        Writes an object as a binary file to the cache.
+
+        binary_data: The object to write.
+        filename: The name of the file.
+
+        The object is written to a temporary file which then replaces the
+        file, so that the file is never left partially written.
+        '''
+        file_ = self.get_cache_directory() / filename
+        file_temporary = file_.with_name( file_.name + ".tmp" )
+        with open( file_temporary, 'wb' ) as f_out:
+            pickle.dump( binary_data, f_out )
+
+        file_temporary.replace( file_ )
+
+
     def cache_file_exists(
         self,
         filename ):
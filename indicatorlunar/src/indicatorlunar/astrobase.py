@@ -61,6 +61,79 @@ class AstroBase( ABC ):
         SUN = auto()
 
 
+    class StarRiseSet( IntEnum ):
+        ''' Outcome, other than rising and setting, of a star rise/set. '''
+        ALWAYS_UP = auto()
+        NEVER_UP = auto()
+        SEARCH = auto() # Too close to always/never up; must be searched.
+
+
+    class BodyData():
+        '''
+        Calculated astronomical information for a body.
+
+        There is a field for each data tag, named as the data tag in lower case
+        with spaces replaced by underscores; a field not calculated is None.
+
+        Azimuths, altitudes and the bright limb are floats in radians and the
+        illumination is a float percentage.  Date/times are in UTC.  The phase
+        is a lunar phase and the eclipse fields are as per the eclipse module.
+        '''
+
+        __slots__ = (
+            "altitude",
+            "azimuth",
+            "bright_limb",
+            "eclipse_date_time",
+            "eclipse_latitude",
+            "eclipse_longitude",
+            "eclipse_type",
+            "equinox",
+            "first_quarter",
+            "full",
+            "illumination",
+            "new",
+            "phase",
+            "rise_azimuth",
+            "rise_date_time",
+            "set_azimuth",
+            "set_date_time",
+            "solstice",
+            "third_quarter" )
+
+
+        def __init__( self ):
+            for field in self.__slots__:
+                setattr( self, field, None )
+
+
+        def get(
+            self,
+            data_tag ):
+            '''
+            Return the value for the data tag; None if not calculated.
+            '''
+            return getattr( self, data_tag.lower().replace( ' ', '_' ) )
+
+
+        def get_data_tags( self ):
+            '''
+            Return the data tags for which a value has been calculated.
+            '''
+            return [
+                field.upper().replace( '_', ' ' )
+                for field in self.__slots__
+                if getattr( self, field ) is not None ]
+
+
+        def __eq__( self, other ):
+            return (
+                self.__class__ == other.__class__ and
+                all(
+                    getattr( self, field ) == getattr( other, field )
+                    for field in self.__slots__ ) )
+
+
     # Data tags representing calculated astronomical information.
     DATA_TAG_ALTITUDE = "ALTITUDE"
     DATA_TAG_AZIMUTH = "AZIMUTH"
@@ -230,6 +303,10 @@ class AstroBase( ABC ):
         LUNAR_PHASE_FIRST_QUARTER   : _( "First Quarter" ),
         LUNAR_PHASE_WAXING_GIBBOUS  : _( "Waxing Gibbous" ) }
 
+    # Keys to almanac events held in the almanac cache.
+    ALMANAC_MOON_PHASES = "MOON PHASES"
+    ALMANAC_SEASONS = "SEASONS"
+
     _STARS_INDEX_NAME = 0
     _STARS_INDEX_HIP = 1
     _STARS_INDEX_NAME_TRANSLATION = 2
@@ -375,9 +452,19 @@ class AstroBase( ABC ):
         [ "ZAURAK",          18543,  _( "Zaurak" ),          _( "ZAURAK" ) ],
         [ "ZUBENELGENUBI",   72622,  _( "Zubenelgenubi" ),   _( "ZUBENELGENUBI" ) ] ]
 
+    # A star culminating within this many degrees of the horizon is close
+    # to being always up (or never up), so rise/set is instead searched.
+    STAR_RISE_SET_SEARCH_DEGREES = 0.5
+
+    # Sidereal days (rotations of the Earth) per day.
+    SIDEREAL_DAYS_PER_DAY = 1.00273781191135448
+
     # Number of hours to search from 'now' for visible satellite passes.
     SATELLITE_SEARCH_DURATION_HOURS = 75
 
+    # Minutes between each time at which satellites are screened.
+    SATELLITE_SCREEN_STEP_MINUTES = 5
+
     SATELLITE_TAG_NAME = "[NAME]"
     SATELLITE_TAG_NUMBER = "[NUMBER]"
     SATELLITE_TAG_INTERNATIONAL_DESIGNATOR = "[INTERNATIONAL DESIGNATOR]"
@@ -445,17 +532,25 @@ class AstroBase( ABC ):
         minor_planet_data,
         minor_planet_apparent_magnitude_data,
         apparent_magnitude_maximum,
-        logging = None ):
+        rise_set_cache,
+        almanac_cache,
+        logger = None,
+        body_types = None,
+        worker_count = 1 ):
         '''
         Returns a dictionary with astronomical information:
-            Key is a tuple of a BodyType, a name tag and a data tag.
-            Value is the calculated astronomical information as a string.
+            Key is a tuple of a BodyType and a name tag.
+            Value is a BodyData of the calculated astronomical information.
 
         Latitude, longitude are floating point numbers in decimal degrees.
         Elevation is a floating point number for metres above sea level.
         Maximum magnitude applies to planets, stars, comets and minor planets.
+        If the minor planet apparent magnitude data is None, the apparent
+        magnitude of each minor planet is computed from the absolute magnitude
+        and slope parameter of the minor planet data, for the current time.
 
-        If a body is never up, no data is added.
+        If a body is never up, no data is added (other than for the moon, for
+        which the illumination, phase and bright limb are always added).
         If a body is always up, the current azimuth/altitude are added.
         If the body will rise/set, the next rise date/time, next set date/time
         and current azimuth/altitude are added.
@@ -463,6 +558,28 @@ class AstroBase( ABC ):
         have the rise and set date/time and azimuth/altitude.
         For a polar satellite, only the azimuth/altitude is added.
 
+        The rise/set cache is a dictionary, initially empty, which is updated
+        with the rise/set date/times computed for each body and is to be passed
+        in on each subsequent call; refer to get_rise_set_from_cache().
+        The caller is responsible for clearing the cache should the latitude,
+        longitude or elevation change.
+
+        The almanac cache is likewise a dictionary, initially empty, holding
+        the next moon phases, equinox/solstice and so on, which is to be passed
+        in on each subsequent call; refer to get_almanac_events().  The events
+        do not depend on the location.
+
+        If the body types is not None, only bodies of the given body types are
+        calculated, allowing the bodies to be calculated in groups, a call per
+        group, for the same date/time.  Bodies of any other body type (the moon
+        and sun included) are not calculated and anything kept for them from
+        one call to the next is left untouched.
+
+        The worker count is the number of worker processes across which a
+        backend, if supported, calculates the comets, minor planets and
+        satellites; a value of 1 calculates all bodies within the current
+        process.
+
         NOTE: Any error when computing a body no result is added for that body.
         '''
         return { }
@@ -640,6 +757,74 @@ class AstroBase( ABC ):
         return apparent_magnitude
 
 
+    @staticmethod
+    def get_apparent_magnitudes_hg(
+        h_absolute_magnitudes,
+        g_slopes,
+        body_earth_distances_au,
+        body_sun_distances_au,
+        earth_sun_distance_au ):
+        '''
+        Calculate apparent magnitudes as per get_apparent_magnitude_hg(), but
+        over arrays (or lists), one element per body, all at once.
+
+        Rather than throw an error, the cosine of the phase angle is bounded to
+        +/- 1.0 and any other bad numbers yield NaN, which compares False to any
+        maximum apparent magnitude.
+
+        numpy is optional (unavailable on some 32 bit platforms); without
+        numpy, each apparent magnitude is calculated in turn.
+        '''
+        try:
+            import numpy # pylint: disable=import-outside-toplevel
+
+        except ImportError:
+            apparent_magnitudes = [ ]
+            for h_absolute_magnitude, g_slope, body_earth_distance_au, body_sun_distance_au in (
+                zip( h_absolute_magnitudes, g_slopes, body_earth_distances_au, body_sun_distances_au ) ):
+                try:
+                    apparent_magnitude = (
+                        AstroBase.get_apparent_magnitude_hg(
+                            h_absolute_magnitude,
+                            g_slope,
+                            body_earth_distance_au,
+                            body_sun_distance_au,
+                            earth_sun_distance_au ) )
+
+                except ( ArithmeticError, ValueError ):
+                    apparent_magnitude = math.nan
+
+                apparent_magnitudes.append( apparent_magnitude )
+
+            return apparent_magnitudes
+
+        h_absolute_magnitudes = numpy.asarray( h_absolute_magnitudes )
+        g_slopes = numpy.asarray( g_slopes )
+        body_earth_distances_au = numpy.asarray( body_earth_distances_au )
+        body_sun_distances_au = numpy.asarray( body_sun_distances_au )
+
+        numerators = (
+            body_sun_distances_au * body_sun_distances_au +
+            body_earth_distances_au * body_earth_distances_au -
+            earth_sun_distance_au * earth_sun_distance_au )
+
+        denominators = 2 * body_sun_distances_au * body_earth_distances_au
+
+        with numpy.errstate( divide = "ignore", invalid = "ignore" ):
+            betas = numpy.arccos( numpy.clip( numerators / denominators, -1.0, 1.0 ) )
+
+            tangents = numpy.tan( betas / 2.0 )
+            psi_1 = numpy.exp( -3.33 * tangents ** 0.63 )
+            psi_2 = numpy.exp( -1.87 * tangents ** 1.22 )
+
+            apparent_magnitudes = (
+                h_absolute_magnitudes +
+                5.0 * numpy.log10( body_sun_distances_au * body_earth_distances_au ) -
+                2.5 * numpy.log10( ( 1 - g_slopes ) * psi_1 + g_slopes * psi_2 ) )
+
+        return apparent_magnitudes
+
+
     @staticmethod
     def get_lunar_phase(
         illumination_percentage,
@@ -862,3 +1047,431 @@ class AstroBase( ABC ):
                 end_hour_as_date_time + datetime.timedelta( days = 1 ) )
 
         return windows
+
+
+    @staticmethod
+    def get_body_data(
+        data,
+        key ):
+        '''
+        Return the BodyData for the key, first adding to the data if absent.
+        '''
+        if key not in data:
+            data[ key ] = AstroBase.BodyData()
+
+        return data[ key ]
+
+
+    @staticmethod
+    def get_rise_set_from_cache(
+        rise_set_cache,
+        key,
+        utc_now,
+        orbital_element_data = None ):
+        '''
+        Rise/set date/times remain valid until either occurs, so rather than
+        computing them on each call to calculate(), the rise/set date/times
+        are held in a cache:
+            Key: ( BodyType, name tag )
+            Value: ( orbital element data, rise date/time, set date/time )
+
+        The orbital element data is the text from which a comet/minor planet
+        is computed (None for all other bodies) so that a cached rise/set
+        is discarded when orbital element data is refreshed.
+
+        Returns the tuple ( rise date/time, set date/time ) for the key if
+        present in the cache and neither rise nor set has passed; None
+        otherwise.
+        '''
+        rise_set = None
+        if key in rise_set_cache:
+            orbital_element_data_, rise_date_time, set_date_time = (
+                rise_set_cache[ key ] )
+
+            is_valid = (
+                orbital_element_data_ == orbital_element_data
+                and
+                rise_date_time > utc_now
+                and
+                set_date_time > utc_now )
+
+            if is_valid:
+                rise_set = ( rise_date_time, set_date_time )
+
+        return rise_set
+
+
+    @staticmethod
+    def get_almanac_events(
+        almanac_cache,
+        key,
+        utc_now,
+        calculate_function ):
+        '''
+        Almanac events such as the moon phases or equinox/solstice occur at
+        most a few times a month, so rather than computing them on each call
+        to calculate(), the events are held in a cache:
+            Key: Almanac key, such as ALMANAC_MOON_PHASES
+            Value: ( expiry date/time, events )
+
+        The events are returned from the cache if present and the expiry
+        date/time, being that of the earliest event, has not passed.
+        Otherwise the events are computed afresh by the calculate function,
+        which returns ( expiry date/time, events ), and added to the cache.
+        '''
+        if key not in almanac_cache or almanac_cache[ key ][ 0 ] <= utc_now:
+            almanac_cache[ key ] = calculate_function()
+
+        return almanac_cache[ key ][ 1 ]
+
+
+    @staticmethod
+    def get_star_rise_sets(
+        utc_now,
+        latitude,
+        horizon,
+        hour_angles,
+        declinations ):
+        '''
+        Calculate the next rise/set date/time of each star, all at once, from
+        the latitude of the observer, the altitude of the horizon (allowing
+        for refraction) and the apparent hour angle/declination of each star
+        at utc_now (all in radians).
+
+        A fixed star moves only with the rotation of the Earth, so rises
+        (sets) when the hour angle next reaches that at which the star
+        crosses the horizon.  Over a day, the change in the apparent position
+        of a star from precession, nutation and aberration moves a rise/set
+        by no more than about a second.
+
+        Returns a list, for each star, of either
+            ( rise date/time, set date/time )
+        or a StarRiseSet.
+
+        numpy is optional (unavailable on some 32 bit platforms); without
+        numpy, each star is marked to be searched.
+        '''
+        try:
+            import numpy # pylint: disable=import-outside-toplevel
+
+        except ImportError:
+            return [ AstroBase.StarRiseSet.SEARCH ] * len( declinations )
+
+        latitude_sine = math.sin( latitude )
+        latitude_cosine = math.cos( latitude )
+        declination_sines = numpy.sin( declinations )
+        declination_cosines = numpy.cos( declinations )
+
+        altitudes_upper_culmination = (
+            numpy.arcsin(
+                numpy.clip(
+                    latitude_sine * declination_sines +
+                    latitude_cosine * declination_cosines,
+                    -1.0,
+                    1.0 ) ) )
+
+        altitudes_lower_culmination = (
+            numpy.arcsin(
+                numpy.clip(
+                    latitude_sine * declination_sines -
+                    latitude_cosine * declination_cosines,
+                    -1.0,
+                    1.0 ) ) )
+
+        margin = math.radians( AstroBase.STAR_RISE_SET_SEARCH_DEGREES )
+
+        # Hour angle at which each star sets; rises at the negative.
+        with numpy.errstate( divide = "ignore", invalid = "ignore" ):
+            hour_angles_set = (
+                numpy.arccos(
+                    numpy.clip(
+                        ( math.sin( horizon ) - latitude_sine * declination_sines ) /
+                        ( latitude_cosine * declination_cosines ),
+                        -1.0,
+                        1.0 ) ) )
+
+        radians_per_day = 2.0 * math.pi * AstroBase.SIDEREAL_DAYS_PER_DAY
+        days_to_rise = (
+            numpy.mod( -hour_angles_set - hour_angles, 2.0 * math.pi ) /
+            radians_per_day )
+
+        days_to_set = (
+            numpy.mod( hour_angles_set - hour_angles, 2.0 * math.pi ) /
+            radians_per_day )
+
+        is_search = (
+            ( numpy.abs( altitudes_upper_culmination - horizon ) < margin )
+            |
+            ( numpy.abs( altitudes_lower_culmination - horizon ) < margin ) )
+
+        rise_sets = [ ]
+        z = zip(
+            is_search,
+            altitudes_upper_culmination,
+            altitudes_lower_culmination,
+            days_to_rise,
+            days_to_set )
+
+        for is_search_, altitude_upper_culmination, altitude_lower_culmination, days_to_rise_, days_to_set_ in z:
+            if is_search_:
+                rise_set = AstroBase.StarRiseSet.SEARCH
+
+            elif altitude_upper_culmination < horizon:
+                rise_set = AstroBase.StarRiseSet.NEVER_UP
+
+            elif altitude_lower_culmination > horizon:
+                rise_set = AstroBase.StarRiseSet.ALWAYS_UP
+
+            else:
+                rise_set = (
+                    utc_now + datetime.timedelta( days = float( days_to_rise_ ) ),
+                    utc_now + datetime.timedelta( days = float( days_to_set_ ) ) )
+
+            rise_sets.append( rise_set )
+
+        return rise_sets
+
+
+    @staticmethod
+    def remove_expired_from_rise_set_cache(
+        rise_set_cache,
+        utc_now ):
+        '''
+        Remove each cached rise/set for which either the rise or set has
+        passed, as per get_rise_set_from_cache() (a rise/set at utc_now has
+        passed).
+        '''
+        keys_expired = [
+            key
+            for key, ( orbital_element_data, rise_date_time, set_date_time )
+            in rise_set_cache.items()
+            if rise_date_time <= utc_now or set_date_time <= utc_now ]
+
+        for key in keys_expired:
+            del rise_set_cache[ key ]
+
+
+    @staticmethod
+    def get_satellite_pass(
+        satellite_passes,
+        windows ):
+        '''
+        Satellite passes is a list, in chronological order, of
+            ( rise date/time, rise azimuth, set date/time, set azimuth, visible )
+
+        Windows is a list of [ start date/time, end date/time ], in
+        chronological order, as per get_start_end_windows().
+
+        Returns the first visible pass which both rises and sets within a
+        window; None otherwise.
+        '''
+        satellite_pass = None
+        for start_date_time, end_date_time in windows:
+            for pass_ in satellite_passes:
+                rise_date_time, rise_azimuth, set_date_time, set_azimuth, visible = (
+                    pass_ )
+
+                is_within_window = (
+                    rise_date_time >= start_date_time
+                    and
+                    set_date_time < end_date_time )
+
+                if is_within_window and visible:
+                    satellite_pass = pass_
+                    break
+
+            if satellite_pass:
+                break
+
+        return satellite_pass
+
+
+    @staticmethod
+    def get_satellite_search_intervals(
+        satellite_records,
+        start_date_time,
+        end_date_time,
+        latitude,
+        longitude,
+        elevation,
+        altitude_degrees ):
+        '''
+        Screen satellites ahead of a search for passes.
+
+        All satellites are propagated together, at intervals of
+        SATELLITE_SCREEN_STEP_MINUTES, between the start and end date/times
+        (UTC).  Between two consecutive times a satellite can only rise above
+        the altitude if its distance from the region above the altitude, at
+        both times, is within the distance the satellite may travel relative
+        to the observer in that interval.
+
+        The satellite records is a dictionary:
+            Key: Satellite number
+            Value: Satellite record (sgp4 Satrec)
+
+        The latitude and longitude are in degrees; the elevation in metres.
+
+        Returns a dictionary:
+            Key: Satellite number
+            Value: List of [ start date/time, end date/time ] in
+                   chronological order, within which the satellite may be
+                   above the altitude.
+
+        A satellite which cannot reach the altitude, or fails to propagate,
+        is omitted.
+
+        Propagating all satellites together requires numpy, which is optional
+        (unavailable on some 32 bit platforms); without numpy, returns None and
+        the caller must search each satellite over the whole search.
+        '''
+        try:
+            import numpy # pylint: disable=import-outside-toplevel
+
+            from sgp4.api import SatrecArray # pylint: disable=import-outside-toplevel
+
+        except ImportError:
+            return None
+
+        step_seconds = AstroBase.SATELLITE_SCREEN_STEP_MINUTES * 60
+        number_of_steps = (
+            math.ceil(
+                ( end_date_time - start_date_time ).total_seconds()
+                /
+                step_seconds ) )
+
+        date_times = [
+            min(
+                start_date_time + datetime.timedelta( seconds = step_seconds * i ),
+                end_date_time )
+            for i in range( number_of_steps + 1 ) ]
+
+        julian_date = start_date_time.timestamp() / 86400.0 + 2440587.5
+        julian_dates = (
+            numpy.full( number_of_steps + 1, math.floor( julian_date ) ) )
+
+        julian_date_fractions = (
+            julian_date - math.floor( julian_date )
+            +
+            numpy.arange( number_of_steps + 1 ) * step_seconds / 86400.0 )
+
+        # Greenwich mean sidereal time, as per sgp4.propagation.gstime().
+        centuries = (
+            ( julian_dates + julian_date_fractions - 2451545.0 ) / 36525.0 )
+
+        sidereal_time = (
+            numpy.radians(
+                (
+                    -6.2e-6 * centuries ** 3
+                    +
+                    0.093104 * centuries ** 2
+                    +
+                    ( 876600.0 * 3600 + 8640184.812866 ) * centuries
+                    +
+                    67310.54841 )
+                /
+                240.0 ) % ( 2.0 * math.pi ) )
+
+        # Observer position (km) and zenith in the frame of the satellite
+        # records (TEME), using the WGS72 ellipsoid as does sgp4.
+        equatorial_radius = 6378.135
+        eccentricity_squared = ( 2.0 - 1.0 / 298.26 ) / 298.26
+        latitude_ = math.radians( latitude )
+        longitude_ = (
+            math.radians( longitude ) + sidereal_time ) # Array of times.
+
+        radius_of_curvature = (
+            equatorial_radius
+            /
+            math.sqrt( 1.0 - eccentricity_squared * math.sin( latitude_ ) ** 2 ) )
+
+        elevation_ = elevation / 1000.0
+        zenith = (
+            numpy.stack(
+                (
+                    math.cos( latitude_ ) * numpy.cos( longitude_ ),
+                    math.cos( latitude_ ) * numpy.sin( longitude_ ),
+                    numpy.full( longitude_.shape, math.sin( latitude_ ) ) ),
+                axis = -1 ) )
+
+        observer = (
+            zenith
+            *
+            numpy.array( [
+                radius_of_curvature + elevation_,
+                radius_of_curvature + elevation_,
+                radius_of_curvature * ( 1.0 - eccentricity_squared ) + elevation_ ] ) )
+
+        earth_rotation_radians_per_second = 7.292115e-5
+        altitude = math.radians( altitude_degrees )
+
+        # Allow for the relative speed of a satellite varying in an interval.
+        speed_margin = 1.25
+
+        intervals = { }
+        satellites = list( satellite_records.keys() )
+        chunk_size = 256 # Keep the arrays for each chunk to a few MB.
+        for i in range( 0, len( satellites ), chunk_size ):
+            chunk = satellites[ i : i + chunk_size ]
+            errors, positions, velocities = (
+                SatrecArray(
+                    [ satellite_records[ satellite ] for satellite in chunk ] ).sgp4(
+                        julian_dates,
+                        julian_date_fractions ) )
+
+            topocentric = positions - observer
+            distance = numpy.linalg.norm( topocentric, axis = -1 )
+            with numpy.errstate( invalid = "ignore" ):
+                satellite_altitude = (
+                    numpy.arcsin(
+                        numpy.clip(
+                            numpy.sum( topocentric * zenith, axis = -1 ) / distance,
+                            -1.0,
+                            1.0 ) ) )
+
+            # Distance from the cone about the zenith of all points above
+            # the altitude.
+            distance_from_cone = (
+                numpy.where(
+                    satellite_altitude >= altitude,
+                    0.0,
+                    numpy.where(
+                        altitude - satellite_altitude >= math.pi / 2.0,
+                        distance,
+                        distance * numpy.sin( altitude - satellite_altitude ) ) ) )
+
+            # Velocity relative to the (rotating) earth.
+            velocities_relative = velocities.copy()
+            velocities_relative[ ..., 0 ] += (
+                earth_rotation_radians_per_second * positions[ ..., 1 ] )
+
+            velocities_relative[ ..., 1 ] -= (
+                earth_rotation_radians_per_second * positions[ ..., 0 ] )
+
+            speed = numpy.linalg.norm( velocities_relative, axis = -1 )
+
+            with numpy.errstate( invalid = "ignore" ):
+                is_candidate = (
+                    distance_from_cone[ :, : -1 ] + distance_from_cone[ :, 1 : ]
+                    <=
+                    speed_margin
+                    *
+                    numpy.maximum( speed[ :, : -1 ], speed[ :, 1 : ] )
+                    *
+                    step_seconds )
+
+            is_candidate &= ( errors[ :, : -1 ] == 0 ) & ( errors[ :, 1 : ] == 0 )
+
+            for satellite, is_candidate_ in zip( chunk, is_candidate ):
+                if is_candidate_.any():
+                    # Merge consecutive candidate steps into intervals.
+                    edges = (
+                        numpy.flatnonzero(
+                            numpy.diff(
+                                numpy.concatenate(
+                                    ( [ 0 ], is_candidate_.astype( int ), [ 0 ] ) ) ) ) )
+
+                    intervals[ satellite ] = [
+                        [ date_times[ start ], date_times[ end ] ]
+                        for start, end in zip( edges[ : : 2 ], edges[ 1 : : 2 ] ) ]
+
+        return intervals
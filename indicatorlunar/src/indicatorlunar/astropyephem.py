@@ -21,12 +21,20 @@
 
 import datetime
 import locale
+import logging.handlers
 import math
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 
 import ephem
 
 from ephem.cities import _city_data
 
+from sgp4.api import Satrec
+
 from . import eclipse
 
 from .astrobase import AstroBase
@@ -54,6 +62,79 @@ class AstroPyEphem( AstroBase ):
     _PYEPHEM_SATELLITE_SETTING_DATE = 4
     _PYEPHEM_SATELLITE_SETTING_ANGLE = 5
 
+    # Altitude at which PyEphem finds a star rises/sets, being that for which
+    # refraction, at the default pressure and temperature, lifts the star to
+    # the horizon.
+    _STAR_HORIZON_DEGREES = -33.59 / 60.0
+
+    # Comets, minor planets and satellites may optionally be calculated in
+    # parallel, split across a pool of worker processes.  The pool is kept
+    # from one call to the next and created afresh only when the number of
+    # workers changes.  Workers are started from a fork server rather than
+    # forked from the calling process, which runs other threads, any of which
+    # may hold a lock at the time of the fork.
+    _executor = None
+    _executor_worker_count = None
+
+    # Satellite passes, kept between calls to calculate().
+    #   Key: Satellite number
+    #   Value: ( TLE, location, search end date/time, satellite passes )
+    # The location is the observer's latitude, longitude and elevation.
+    # Satellite passes are a list of
+    #   ( rise date/time, rise azimuth, set date/time, set azimuth, visible )
+    # in chronological order, or None if the satellite is circumpolar.
+    _satellite_passes = { }
+
+    # Observers and bodies for the observer's location, kept between calls to
+    # calculate() and created afresh when the location changes.
+    _session = None
+
+
+    class _Session():
+        '''
+        Observers and bodies for a location.
+
+        Bodies are kept in a dictionary:
+            Key: ( BodyType, name tag )
+            Value: ( orbital element data, body )
+        where the orbital element data is None other than for a comet or minor
+        planet.  A body is created on first use and kept only whilst used in
+        each subsequent call to calculate() for a new date/time; the bodies
+        used for the previous date/time are held in bodies previous.
+        '''
+
+        __slots__ = (
+            "location",
+            "observer",
+            "observer_visible_passes",
+            "moon",
+            "sun",
+            "bodies",
+            "bodies_previous" )
+
+
+        def __init__(
+            self,
+            latitude,
+            longitude,
+            elevation ):
+
+            self.location = ( latitude, longitude, elevation )
+
+            self.observer = ephem.city( "London" ) # Any name will do for now.
+            self.observer.lat = str( latitude )
+            self.observer.lon = str( longitude )
+            self.observer.elev = elevation
+
+            self.observer_visible_passes = self.observer.copy()
+            self.observer_visible_passes.pressure = 0
+            self.observer_visible_passes.horizon = "-0:34"
+
+            self.moon = ephem.Moon()
+            self.sun = ephem.Sun()
+            self.bodies = { }
+            self.bodies_previous = { }
+
 
     @staticmethod
     def calculate(
@@ -73,70 +154,413 @@ class AstroPyEphem( AstroBase ):
         minor_planet_data,
         minor_planet_apparent_magnitude_data,
         apparent_magnitude_maximum,
-        logging ):
+        rise_set_cache,
+        almanac_cache,
+        logger,
+        body_types = None,
+        worker_count = 1 ):
         '''
         Calculate the rise/set/az/alt for all bodies.
         '''
         data = { }
+        if body_types is None:
+            body_types = list( AstroBase.BodyType )
 
         # PyEphem date/time is NOT timezone aware.
         ephem_now = ephem.Date( utc_now )
 
-        observer = ephem.city( "London" ) # Any name will do for now.
-        observer.lat = str( latitude )
-        observer.lon = str( longitude )
-        observer.elev = elevation
-        observer.date = ephem_now
-
-        AstroPyEphem._calculate_moon(
-            ephem_now,
-            observer,
-            data )
-
-        AstroPyEphem._calculate_sun(
-            ephem_now,
-            observer,
-            data )
-
-        AstroPyEphem._calculate_planets(
-            observer,
-            data,
-            planets,
-            apparent_magnitude_maximum )
-
-        AstroPyEphem._calculate_stars(
-            observer,
-            data,
-            stars,
-            apparent_magnitude_maximum )
-
-        AstroPyEphem._calculate_comets(
-            observer,
-            data,
-            comets, comet_data,
-            apparent_magnitude_maximum,
-            logging )
-
-        AstroPyEphem._calculate_minor_planets(
-            observer,
-            data,
-            minor_planets,
-            minor_planet_data,
-            apparent_magnitude_maximum,
-            minor_planet_apparent_magnitude_data )
-
-        AstroPyEphem._calculate_satellites(
-            ephem_now,
-            observer,
-            data,
-            satellites,
-            satellite_data,
-            start_hour_as_date_time_in_utc,
-            end_hour_as_date_time_in_utc )
+        session = (
+            AstroPyEphem._get_session(
+                ephem_now,
+                latitude,
+                longitude,
+                elevation ) )
+
+        if AstroBase.BodyType.MOON in body_types:
+            AstroPyEphem._calculate_moon(
+                ephem_now,
+                session,
+                data,
+                rise_set_cache,
+                almanac_cache )
+
+        if AstroBase.BodyType.SUN in body_types:
+            AstroPyEphem._calculate_sun(
+                ephem_now,
+                session,
+                data,
+                rise_set_cache,
+                almanac_cache )
+
+        if AstroBase.BodyType.PLANET in body_types:
+            AstroPyEphem._calculate_planets(
+                session,
+                data,
+                planets,
+                apparent_magnitude_maximum,
+                rise_set_cache )
+
+        if AstroBase.BodyType.STAR in body_types:
+            AstroPyEphem._calculate_stars(
+                session,
+                data,
+                stars,
+                apparent_magnitude_maximum,
+                rise_set_cache )
+
+        if AstroBase.BodyType.COMET not in body_types:
+            comets = [ ]
+
+        if AstroBase.BodyType.MINOR_PLANET not in body_types:
+            minor_planets = [ ]
+
+        satellite_tles = { }
+        if AstroBase.BodyType.SATELLITE in body_types:
+            satellite_tles = (
+                AstroPyEphem._get_satellite_tles( satellites, satellite_data ) )
+
+            for satellite in list( AstroPyEphem._satellite_passes.keys() ):
+                if satellite not in satellite_tles:
+                    del AstroPyEphem._satellite_passes[ satellite ]
+
+        if worker_count > 1:
+            AstroPyEphem._calculate_in_parallel(
+                ephem_now,
+                latitude,
+                longitude,
+                elevation,
+                data,
+                comets,
+                comet_data,
+                minor_planets,
+                minor_planet_data,
+                minor_planet_apparent_magnitude_data,
+                apparent_magnitude_maximum,
+                satellite_tles,
+                start_hour_as_date_time_in_utc,
+                end_hour_as_date_time_in_utc,
+                rise_set_cache,
+                worker_count,
+                logger )
+
+        else:
+            AstroPyEphem._shutdown_executor()
+
+            AstroPyEphem._calculate_comets(
+                session,
+                data,
+                comets, comet_data,
+                apparent_magnitude_maximum,
+                rise_set_cache,
+                logger )
+
+            AstroPyEphem._calculate_minor_planets(
+                session,
+                data,
+                minor_planets,
+                minor_planet_data,
+                apparent_magnitude_maximum,
+                minor_planet_apparent_magnitude_data,
+                rise_set_cache )
+
+            AstroPyEphem._calculate_satellites(
+                ephem_now,
+                session,
+                data,
+                satellite_tles,
+                start_hour_as_date_time_in_utc,
+                end_hour_as_date_time_in_utc,
+                AstroPyEphem._satellite_passes )
 
         return data
 
 
+    @staticmethod
+    def _get_session(
+        ephem_now,
+        latitude,
+        longitude,
+        elevation ):
+        '''
+        Return the session for the location, creating the session if there is
+        none or the location has changed, with the observer set to now.
+
+        Bodies are kept for one date/time to the next; calls for the same
+        date/time (bodies calculated in groups) share the same bodies.
+        '''
+        session = AstroPyEphem._session
+        location = ( latitude, longitude, elevation )
+        if session is None or session.location != location:
+            session = AstroPyEphem._Session( latitude, longitude, elevation )
+            AstroPyEphem._session = session
+
+        if session.observer.date != ephem_now:
+            session.bodies_previous = session.bodies
+            session.bodies = { }
+
+        session.observer.date = ephem_now
+        return session
+
+
+    @staticmethod
+    def _get_body(
+        session,
+        key,
+        create_function,
+        orbital_element_data = None ):
+        '''
+        Return the body for the key from the session, creating the body if not
+        used for the previous date/time or if created from orbital
+        element data which has since changed.
+        '''
+        orbital_element_data_and_body = session.bodies_previous.get( key )
+        is_stale = (
+            orbital_element_data_and_body is None
+            or
+            orbital_element_data_and_body[ 0 ] != orbital_element_data )
+
+        if is_stale:
+            orbital_element_data_and_body = (
+                orbital_element_data, create_function() )
+
+        session.bodies[ key ] = orbital_element_data_and_body
+        return orbital_element_data_and_body[ 1 ]
+
+
+    @staticmethod
+    def _get_satellite_tles(
+        satellites,
+        satellite_data ):
+        '''
+        Return a dictionary of the satellites present in the satellite data:
+            Key: Satellite number
+            Value: ( name, TLE line one, TLE line two )
+        '''
+        return {
+            satellite : (
+                ( satellite_data[ satellite ].get_name(), ) +
+                satellite_data[ satellite ].get_tle_line_one_line_two() )
+            for satellite in satellites
+            if satellite in satellite_data }
+
+
+    @staticmethod
+    def _calculate_in_parallel(
+        ephem_now,
+        latitude,
+        longitude,
+        elevation,
+        data,
+        comets,
+        comet_data,
+        minor_planets,
+        minor_planet_data,
+        minor_planet_apparent_magnitude_data,
+        apparent_magnitude_maximum,
+        satellite_tles,
+        start_hour_as_date_time_in_utc,
+        end_hour_as_date_time_in_utc,
+        rise_set_cache,
+        worker_count,
+        logger ):
+        '''
+        Split the comets, minor planets and satellites across a pool of
+        worker processes, merging the results into the data and rise/set
+        cache and logging any messages from the workers.
+
+        Each worker receives only the data for its share of bodies and keeps
+        its own session.  Bodies are dealt out in turn so that each worker has
+        a similar load.
+        '''
+        def get_rise_set_cache( body_type, names ):
+            return {
+                ( body_type, name ) : rise_set_cache[ ( body_type, name ) ]
+                for name in names
+                if ( body_type, name ) in rise_set_cache }
+
+
+        comets = [ comet for comet in comets if comet in comet_data ]
+        minor_planets = [
+            minor_planet
+            for minor_planet in minor_planets
+            if minor_planet in minor_planet_data ]
+
+        satellites = list( satellite_tles.keys() )
+
+        tasks = [ ]
+        for i in range( worker_count ):
+            comets_ = comets[ i : : worker_count ]
+            if comets_:
+                tasks.append( (
+                    AstroPyEphem._calculate_comets,
+                    {
+                        "comets": comets_,
+                        "orbital_element_data": {
+                            comet : comet_data[ comet ] for comet in comets_ },
+                        "apparent_magnitude_maximum": apparent_magnitude_maximum,
+                        "rise_set_cache":
+                            get_rise_set_cache( AstroBase.BodyType.COMET, comets_ ),
+                        "logger": None } ) )
+
+            minor_planets_ = minor_planets[ i : : worker_count ]
+            if minor_planets_:
+                tasks.append( (
+                    AstroPyEphem._calculate_minor_planets,
+                    {
+                        "minor_planets": minor_planets_,
+                        "orbital_element_data": {
+                            minor_planet : minor_planet_data[ minor_planet ]
+                            for minor_planet in minor_planets_ },
+                        "apparent_magnitude_maximum": apparent_magnitude_maximum,
+                        "apparent_magnitude_data":
+                            None
+                            if minor_planet_apparent_magnitude_data is None else
+                            {
+                                minor_planet :
+                                    minor_planet_apparent_magnitude_data[ minor_planet ]
+                                for minor_planet in minor_planets_
+                                if minor_planet in minor_planet_apparent_magnitude_data },
+                        "rise_set_cache":
+                            get_rise_set_cache(
+                                AstroBase.BodyType.MINOR_PLANET, minor_planets_ ) } ) )
+
+            satellites_ = satellites[ i : : worker_count ]
+            if satellites_:
+                tasks.append( (
+                    AstroPyEphem._calculate_satellites,
+                    {
+                        "ephem_now": ephem_now,
+                        "satellite_tles": {
+                            satellite : satellite_tles[ satellite ]
+                            for satellite in satellites_ },
+                        "start_hour_as_date_time_in_utc":
+                            start_hour_as_date_time_in_utc,
+                        "end_hour_as_date_time_in_utc":
+                            end_hour_as_date_time_in_utc,
+                        "satellite_passes": {
+                            satellite : AstroPyEphem._satellite_passes[ satellite ]
+                            for satellite in satellites_
+                            if satellite in AstroPyEphem._satellite_passes } } ) )
+
+        if tasks:
+            try:
+                executor = AstroPyEphem._get_executor( worker_count )
+                futures = [
+                    executor.submit(
+                        AstroPyEphem._calculate_in_worker,
+                        ephem_now,
+                        latitude,
+                        longitude,
+                        elevation,
+                        function,
+                        keyword_arguments )
+                    for function, keyword_arguments in tasks ]
+
+                caches = {
+                    "rise_set_cache": rise_set_cache,
+                    "satellite_passes": AstroPyEphem._satellite_passes }
+
+                for future in futures:
+                    data_, caches_, messages = future.result()
+                    data.update( data_ )
+                    for name, cache in caches_.items():
+                        caches[ name ].update( cache )
+
+                    for level, message in messages:
+                        logger.log( level, message )
+
+            except BrokenProcessPool:
+                # A worker terminated abruptly; start afresh on the next call.
+                AstroPyEphem._executor = None
+                AstroPyEphem._executor_worker_count = None
+                raise
+
+
+    @staticmethod
+    def _get_executor(
+        worker_count ):
+        '''
+        Return the pool of worker processes, creating the pool if there is
+        none or the number of workers has changed.
+        '''
+        if AstroPyEphem._executor_worker_count != worker_count:
+            AstroPyEphem._shutdown_executor()
+            AstroPyEphem._executor = (
+                ProcessPoolExecutor(
+                    max_workers = worker_count,
+                    mp_context = multiprocessing.get_context( "forkserver" ) ) )
+
+            AstroPyEphem._executor_worker_count = worker_count
+
+        return AstroPyEphem._executor
+
+
+    @staticmethod
+    def _shutdown_executor():
+        '''
+        Shut down the pool of worker processes, if any, without waiting.
+        '''
+        if AstroPyEphem._executor is not None:
+            AstroPyEphem._executor.shutdown( wait = False )
+            AstroPyEphem._executor = None
+            AstroPyEphem._executor_worker_count = None
+
+
+    @staticmethod
+    def _calculate_in_worker(
+        ephem_now,
+        latitude,
+        longitude,
+        elevation,
+        function,
+        keyword_arguments ):
+        '''
+        Run within a worker process, calling the function with the session
+        and a new data dictionary.
+
+        The logger of the caller cannot be passed between processes, so any
+        messages are logged to a buffer and returned to be logged by the
+        caller.
+
+        Returns the data dictionary, a dictionary of any caches (rise/set,
+        satellite passes) used by the function, as updated by the function,
+        and a list of messages logged, each a tuple of level and message.
+        '''
+        logger = logging.getLogger( __name__ )
+        logger.setLevel( logging.DEBUG )
+        logger.propagate = False
+        handler = logging.handlers.BufferingHandler( math.inf )
+        logger.addHandler( handler )
+        if "logger" in keyword_arguments:
+            keyword_arguments[ "logger" ] = logger
+
+        data = { }
+        try:
+            function(
+                session =
+                    AstroPyEphem._get_session(
+                        ephem_now,
+                        latitude,
+                        longitude,
+                        elevation ),
+                data = data,
+                **keyword_arguments )
+
+        finally:
+            logger.removeHandler( handler )
+
+        caches = {
+            name : keyword_arguments[ name ]
+            for name in ( "rise_set_cache", "satellite_passes" )
+            if name in keyword_arguments }
+
+        messages = [
+            ( record.levelno, record.getMessage() )
+            for record in handler.buffer ]
+
+        return data, caches, messages
+
+
     @staticmethod
     def get_cities():
         '''
@@ -178,24 +602,37 @@ class AstroPyEphem( AstroBase ):
     @staticmethod
     def _calculate_moon(
         ephem_now,
-        observer,
-        data ):
+        session,
+        data,
+        rise_set_cache,
+        almanac_cache ):
 
         key = ( AstroBase.BodyType.MOON, AstroBase.NAME_TAG_MOON )
-        moon = ephem.Moon( observer )
-        sun = ephem.Sun( observer )
+        observer = session.observer
+        moon = session.moon
+        moon.compute( observer )
+        sun = session.sun
+        sun.compute( observer )
+        body_data = AstroBase.get_body_data( data, key )
 
         # Needed for icon.
-        data[ key + ( AstroBase.DATA_TAG_ILLUMINATION, ) ] = str( moon.phase )
+        body_data.illumination = float( moon.phase )
+
+        next_first_quarter, next_full, next_third_quarter, next_new = (
+            AstroBase.get_almanac_events(
+                almanac_cache,
+                AstroBase.ALMANAC_MOON_PHASES,
+                ephem_now.datetime().replace( tzinfo = datetime.timezone.utc ),
+                lambda: AstroPyEphem._calculate_moon_phases( ephem_now ) ) )
 
         # Need for notification.
         phase = (
             AstroBase.get_lunar_phase(
                 moon.phase,
-                ephem.next_full_moon( ephem_now ),
-                ephem.next_new_moon( ephem_now ) ) )
+                next_full,
+                next_new ) )
 
-        data[ key + ( AstroBase.DATA_TAG_PHASE, ) ] = phase
+        body_data.phase = phase
 
         bright_limb = (
             AstroBase.get_zenith_angle_of_bright_limb(
@@ -205,46 +642,54 @@ class AstroPyEphem( AstroBase ):
                 float( observer.lat ), float( observer.lon ) ) )
 
         # Needed for icon.
-        data[ key + ( AstroBase.DATA_TAG_BRIGHT_LIMB, ) ] = str( bright_limb )
+        body_data.bright_limb = bright_limb
 
         never_up = (
             AstroPyEphem._calculate_common(
                 data,
                 ( AstroBase.BodyType.MOON, AstroBase.NAME_TAG_MOON ),
                 observer,
-                moon ) )
+                moon,
+                rise_set_cache ) )
 
         if not never_up:
-            next_first_quarter = (
-                ephem.next_first_quarter_moon( ephem_now ).datetime() )
+            body_data.first_quarter = next_first_quarter
+            body_data.full = next_full
+            body_data.third_quarter = next_third_quarter
+            body_data.new = next_new
 
-            data[ key + ( AstroBase.DATA_TAG_FIRST_QUARTER, ) ] = (
-                next_first_quarter.replace( tzinfo = datetime.timezone.utc ) )
-
-            next_full = ephem.next_full_moon( ephem_now ).datetime()
-            data[ key + ( AstroBase.DATA_TAG_FULL, ) ] = (
-                next_full.replace( tzinfo = datetime.timezone.utc ) )
-
-            next_last_quarter = (
-                ephem.next_last_quarter_moon( ephem_now ).datetime() )
+            AstroPyEphem._calculate_eclipse( ephem_now, data, key, False )
 
-            data[ key + ( AstroBase.DATA_TAG_THIRD_QUARTER, ) ] = (
-                next_last_quarter.replace( tzinfo = datetime.timezone.utc ) )
 
-            next_new = ephem.next_new_moon( ephem_now ).datetime()
-            data[ key + ( AstroBase.DATA_TAG_NEW, ) ] = (
-                next_new.replace( tzinfo = datetime.timezone.utc ) )
+    @staticmethod
+    def _calculate_moon_phases(
+        ephem_now ):
+        '''
+        Returns ( expiry date/time, moon phases ) for the almanac cache, where
+        the moon phases are the date/times of the next first quarter, full,
+        third quarter and new moon and the expiry date/time is the earliest.
+        '''
+        moon_phases = tuple(
+            function( ephem_now ).datetime().replace( tzinfo = datetime.timezone.utc )
+            for function in (
+                ephem.next_first_quarter_moon,
+                ephem.next_full_moon,
+                ephem.next_last_quarter_moon,
+                ephem.next_new_moon ) )
 
-            AstroPyEphem._calculate_eclipse( ephem_now, data, key, False )
+        return min( moon_phases ), moon_phases
 
 
     @staticmethod
     def _calculate_sun(
         ephem_now,
-        observer,
-        data ):
+        session,
+        data,
+        rise_set_cache,
+        almanac_cache ):
 
-        sun = ephem.Sun()
+        observer = session.observer
+        sun = session.sun
         sun.compute( observer )
 
         never_up = (
@@ -252,20 +697,35 @@ class AstroPyEphem( AstroBase ):
                 data,
                 ( AstroBase.BodyType.SUN, AstroBase.NAME_TAG_SUN ),
                 observer,
-                sun ) )
+                sun,
+                rise_set_cache ) )
 
         if not never_up:
             key = ( AstroBase.BodyType.SUN, AstroBase.NAME_TAG_SUN )
+            body_data = AstroBase.get_body_data( data, key )
+            body_data.equinox, body_data.solstice = (
+                AstroBase.get_almanac_events(
+                    almanac_cache,
+                    AstroBase.ALMANAC_SEASONS,
+                    ephem_now.datetime().replace( tzinfo = datetime.timezone.utc ),
+                    lambda: AstroPyEphem._calculate_seasons( ephem_now ) ) )
 
-            next_equinox = ephem.next_equinox( ephem_now ).datetime()
-            data[ key + ( AstroBase.DATA_TAG_EQUINOX, ) ] = (
-                next_equinox.replace( tzinfo = datetime.timezone.utc ) )
+            AstroPyEphem._calculate_eclipse( ephem_now, data, key, True )
 
-            next_solstice = ephem.next_solstice( ephem_now ).datetime()
-            data[ key + ( AstroBase.DATA_TAG_SOLSTICE, ) ] = (
-                next_solstice.replace( tzinfo = datetime.timezone.utc ) )
 
-            AstroPyEphem._calculate_eclipse( ephem_now, data, key, True )
+    @staticmethod
+    def _calculate_seasons(
+        ephem_now ):
+        '''
+        Returns ( expiry date/time, seasons ) for the almanac cache, where the
+        seasons are the date/times of the next equinox and solstice and the
+        expiry date/time is the earliest.
+        '''
+        seasons = tuple(
+            function( ephem_now ).datetime().replace( tzinfo = datetime.timezone.utc )
+            for function in ( ephem.next_equinox, ephem.next_solstice ) )
+
+        return min( seasons ), seasons
 
 
     @staticmethod
@@ -285,38 +745,55 @@ class AstroPyEphem( AstroBase ):
             getattr( eclipse, eclipse_function )(
                 ephem_now.datetime().replace( tzinfo = datetime.timezone.utc ) ) )
 
-        data[ key + ( AstroBase.DATA_TAG_ECLIPSE_DATE_TIME, ) ] = (
+        body_data = AstroBase.get_body_data( data, key )
+        body_data.eclipse_date_time = (
             date_time.replace( tzinfo = datetime.timezone.utc ) )
 
-        data[ key + ( AstroBase.DATA_TAG_ECLIPSE_TYPE, ) ] = eclipse_type
-        data[ key + ( AstroBase.DATA_TAG_ECLIPSE_LATITUDE, ) ] = latitude
-        data[ key + ( AstroBase.DATA_TAG_ECLIPSE_LONGITUDE, ) ] = longitude
+        body_data.eclipse_type = eclipse_type
+        body_data.eclipse_latitude = latitude
+        body_data.eclipse_longitude = longitude
 
 
     @staticmethod
     def _calculate_planets(
-        observer,
+        session,
         data,
         planets,
-        apparent_magnitude_maximum ):
+        apparent_magnitude_maximum,
+        rise_set_cache ):
 
+        observer = session.observer
         for planet in planets:
-            body = getattr( ephem, planet.title() )()
+            key = ( AstroBase.BodyType.PLANET, planet )
+            body = (
+                AstroPyEphem._get_body(
+                    session,
+                    key,
+                    getattr( ephem, planet.title() ) ) )
+
             body.compute( observer )
             if body.mag <= apparent_magnitude_maximum:
                 AstroPyEphem._calculate_common(
                     data,
-                    ( AstroBase.BodyType.PLANET, planet ),
-                    observer, body )
+                    key,
+                    observer, body,
+                    rise_set_cache )
 
 
     @staticmethod
     def _calculate_stars(
-        observer,
+        session,
         data,
         stars,
-        apparent_magnitude_maximum ):
-
+        apparent_magnitude_maximum,
+        rise_set_cache ):
+        '''
+        The rise/set of each star is calculated in closed form, all at once,
+        other than for a star close to being always up or never up, which is
+        searched.
+        '''
+        observer = session.observer
+        bodies = { }
         for star in stars:
             # Did a test obtaining the absolute magnitude directly from the
             # ephemeris before reading in and computing the body.
@@ -324,26 +801,70 @@ class AstroPyEphem( AstroBase ):
             # After timing tests, this makes no difference, so follow the
             # "traditional" route of read, compute and obtain the absolute
             # magnitude.
-            body = ephem.star( star.title() )
+            body = (
+                AstroPyEphem._get_body(
+                    session,
+                    ( AstroBase.BodyType.STAR, star ),
+                    partial( ephem.star, star.title() ) ) )
+
             body.compute( observer )
             if body.mag <= apparent_magnitude_maximum:
-                AstroPyEphem._calculate_common(
-                    data,
-                    ( AstroBase.BodyType.STAR, star ),
-                    observer,
-                    body )
+                bodies[ star ] = body
+
+        if bodies:
+            utc_now = observer.date.datetime().replace( tzinfo = datetime.timezone.utc )
+            sidereal_time = float( observer.sidereal_time() )
+            rise_sets = (
+                AstroBase.get_star_rise_sets(
+                    utc_now,
+                    float( observer.lat ),
+                    math.radians( AstroPyEphem._STAR_HORIZON_DEGREES ),
+                    [ sidereal_time - float( body.ra ) for body in bodies.values() ],
+                    [ float( body.dec ) for body in bodies.values() ] ) )
+
+            for ( star, body ), rise_set in zip( bodies.items(), rise_sets ):
+                key = ( AstroBase.BodyType.STAR, star )
+                if rise_set == AstroBase.StarRiseSet.SEARCH:
+                    AstroPyEphem._calculate_common(
+                        data,
+                        key,
+                        observer,
+                        body,
+                        rise_set_cache )
+
+                elif rise_set != AstroBase.StarRiseSet.NEVER_UP:
+                    body_data = AstroBase.get_body_data( data, key )
+                    body_data.azimuth = float( body.az )
+                    body_data.altitude = float( body.alt )
+
+                    if rise_set != AstroBase.StarRiseSet.ALWAYS_UP:
+                        rise_set_cached = (
+                            AstroBase.get_rise_set_from_cache(
+                                rise_set_cache,
+                                key,
+                                utc_now ) )
+
+                        if rise_set_cached is None:
+                            rise_set_cache[ key ] = ( None, ) + rise_set
+
+                        else:
+                            rise_set = rise_set_cached
+
+                        body_data.rise_date_time, body_data.set_date_time = rise_set
 
 
     @staticmethod
     def _calculate_comets(
-        observer,
+        session,
         data,
         comets,
         orbital_element_data,
         apparent_magnitude_maximum,
-        logging ):
+        rise_set_cache,
+        logger ):
 
-        sun = ephem.Sun()
+        observer = session.observer
+        sun = session.sun
         sun.compute( observer )
         for key in comets:
             if key in orbital_element_data:
@@ -369,7 +890,7 @@ class AstroPyEphem( AstroBase ):
                     slope_parameter = fields[ 10 - 1 ]
 
                 else:
-                    logging.warning(
+                    logger.warning(
                         "Found unknown object type " +
                         object_type +
                         " for comet " +
@@ -379,7 +900,8 @@ class AstroPyEphem( AstroBase ):
 
                 body = (
                     AstroPyEphem._compute_minor_planet_or_comet_for_observer(
-                        observer,
+                        session,
+                        ( AstroBase.BodyType.COMET, key ),
                         orbital_element_data[ key ].get_data() ) )
 
                 if not AstroPyEphem._is_comet_or_minor_planet_bad( body ):
@@ -405,44 +927,128 @@ class AstroPyEphem( AstroBase ):
                             data,
                             ( AstroBase.BodyType.COMET, key ),
                             observer,
-                            body )
+                            body,
+                            rise_set_cache,
+                            orbital_element_data[ key ].get_data() )
 
 
     @staticmethod
     def _calculate_minor_planets(
-        observer,
+        session,
         data,
         minor_planets,
         orbital_element_data,
         apparent_magnitude_maximum,
-        apparent_magnitude_data ):
+        apparent_magnitude_data,
+        rise_set_cache ):
 
-        for key in minor_planets:
-            if key in orbital_element_data and key in apparent_magnitude_data:
-                apparent_magnitude = (
-                   float( apparent_magnitude_data[ key ].get_apparent_magnitude() ) )
+        if apparent_magnitude_data is None:
+            keys_and_bodies = (
+                AstroPyEphem._get_minor_planets_within_apparent_magnitude_hg(
+                    session,
+                    minor_planets,
+                    orbital_element_data,
+                    apparent_magnitude_maximum ) )
 
-                if apparent_magnitude < apparent_magnitude_maximum:
-                    body = (
-                        AstroPyEphem._compute_minor_planet_or_comet_for_observer(
-                            observer,
-                            orbital_element_data[ key ].get_data() ) )
+        else:
+            keys_and_bodies = [ ]
+            for key in minor_planets:
+                if key in orbital_element_data and key in apparent_magnitude_data:
+                    apparent_magnitude = (
+                       float( apparent_magnitude_data[ key ].get_apparent_magnitude() ) )
+
+                    if apparent_magnitude < apparent_magnitude_maximum:
+                        body = (
+                            AstroPyEphem._compute_minor_planet_or_comet_for_observer(
+                                session,
+                                ( AstroBase.BodyType.MINOR_PLANET, key ),
+                                orbital_element_data[ key ].get_data() ) )
+
+                        if not AstroPyEphem._is_comet_or_minor_planet_bad( body ):
+                            keys_and_bodies.append( ( key, body ) )
+
+        for key, body in keys_and_bodies:
+            AstroPyEphem._calculate_common(
+                data,
+                ( AstroBase.BodyType.MINOR_PLANET, key ),
+                session.observer,
+                body,
+                rise_set_cache,
+                orbital_element_data[ key ].get_data() )
 
-                    if not AstroPyEphem._is_comet_or_minor_planet_bad( body ):
-                        AstroPyEphem._calculate_common(
-                            data,
-                            ( AstroBase.BodyType.MINOR_PLANET, key ),
-                            observer,
-                            body )
+
+    @staticmethod
+    def _get_minor_planets_within_apparent_magnitude_hg(
+        session,
+        minor_planets,
+        orbital_element_data,
+        apparent_magnitude_maximum ):
+        '''
+        Compute each minor planet and from the absolute magnitude and slope
+        parameter of the orbital element data, compute the apparent magnitudes
+        of all minor planets at once.
+
+        Returns a list of ( key, body ) for each minor planet within the
+        maximum apparent magnitude.
+        '''
+        sun = session.sun
+        sun.compute( session.observer )
+
+        keys_and_bodies = [ ]
+        absolute_magnitudes = [ ]
+        slope_parameters = [ ]
+        body_earth_distances = [ ]
+        body_sun_distances = [ ]
+        for key in minor_planets:
+            if key in orbital_element_data:
+                body = (
+                    AstroPyEphem._compute_minor_planet_or_comet_for_observer(
+                        session,
+                        ( AstroBase.BodyType.MINOR_PLANET, key ),
+                        orbital_element_data[ key ].get_data() ) )
+
+                if not AstroPyEphem._is_comet_or_minor_planet_bad( body ):
+                    # The absolute magnitude and slope parameter are the last
+                    # two fields; the absolute magnitude may be prefixed by
+                    # the magnitude model.
+                    fields = orbital_element_data[ key ].get_data().split( ',' )
+                    keys_and_bodies.append( ( key, body ) )
+                    absolute_magnitudes.append(
+                        float( fields[ 12 - 1 ].strip().lstrip( "Hg" ) ) )
+
+                    slope_parameters.append( float( fields[ 13 - 1 ] ) )
+                    body_earth_distances.append( body.earth_distance )
+                    body_sun_distances.append( body.sun_distance )
+
+        apparent_magnitudes = (
+            AstroBase.get_apparent_magnitudes_hg(
+                absolute_magnitudes,
+                slope_parameters,
+                body_earth_distances,
+                body_sun_distances,
+                sun.earth_distance ) )
+
+        return [
+            key_and_body
+            for key_and_body, apparent_magnitude
+            in zip( keys_and_bodies, apparent_magnitudes )
+            if apparent_magnitude < apparent_magnitude_maximum ]
 
 
     @staticmethod
     def _compute_minor_planet_or_comet_for_observer(
-        observer,
+        session,
+        key,
         orbital_element_data ):
 
-        body = ephem.readdb( orbital_element_data )
-        body.compute( observer )
+        body = (
+            AstroPyEphem._get_body(
+                session,
+                key,
+                lambda: ephem.readdb( orbital_element_data ),
+                orbital_element_data ) )
+
+        body.compute( session.observer )
         return body
 
 
@@ -476,53 +1082,89 @@ class AstroPyEphem( AstroBase ):
         data,
         key,
         observer,
-        body ):
+        body,
+        rise_set_cache,
+        orbital_element_data = None ):
         '''
         Calculates common attributes such as rise/set date/time,
         azimuth/altitude.
 
+        The rise/set date/time is taken from the cache if still valid;
+        otherwise is computed and added to the cache.
+
         Returns True if the body is never up; false otherwise.
         '''
         never_up = False
+        next_rise = None
+        next_set = None
         try:
             # Must compute az/alt BEFORE rise/set otherwise results
             # will be incorrect.
-            data[ key + ( AstroBase.DATA_TAG_AZIMUTH, ) ] = repr( body.az )
-            data[ key + ( AstroBase.DATA_TAG_ALTITUDE, ) ] = repr( body.alt )
+            azimuth = float( body.az )
+            altitude = float( body.alt )
+
+            rise_set = (
+                AstroBase.get_rise_set_from_cache(
+                    rise_set_cache,
+                    key,
+                    observer.date.datetime().replace(
+                        tzinfo = datetime.timezone.utc ),
+                    orbital_element_data ) )
 
-            next_rise = (
-                observer.next_rising( body ).datetime() )
+            if rise_set is None:
+                next_rise = (
+                    observer.next_rising( body ).datetime().replace(
+                        tzinfo = datetime.timezone.utc ) )
 
-            data[ key + ( AstroBase.DATA_TAG_RISE_DATE_TIME, ) ] = (
-                next_rise.replace( tzinfo = datetime.timezone.utc ) )
+                next_set = (
+                    observer.next_setting( body ).datetime().replace(
+                        tzinfo = datetime.timezone.utc ) )
 
-            next_set = (
-                observer.next_setting( body ).datetime() )
+                rise_set_cache[ key ] = (
+                    orbital_element_data, next_rise, next_set )
 
-            data[ key + ( AstroBase.DATA_TAG_SET_DATE_TIME, ) ] = (
-                next_set.replace( tzinfo = datetime.timezone.utc ) )
+            else:
+                next_rise, next_set = rise_set
 
         except ephem.AlwaysUpError:
             pass
 
         except ephem.NeverUpError:
-            del data[ key + ( AstroBase.DATA_TAG_AZIMUTH, ) ]
-            del data[ key + ( AstroBase.DATA_TAG_ALTITUDE, ) ]
             never_up = True
 
+        if not never_up:
+            body_data = AstroBase.get_body_data( data, key )
+            body_data.azimuth = azimuth
+            body_data.altitude = altitude
+            body_data.rise_date_time = next_rise
+            body_data.set_date_time = next_set
+
         return never_up
 
 
     @staticmethod
     def _calculate_satellites(
         ephem_now,
-        observer,
+        session,
         data,
-        satellites,
-        satellite_data,
+        satellite_tles,
         start_hour_as_date_time_in_utc,
-        end_hour_as_date_time_in_utc ):
-
+        end_hour_as_date_time_in_utc,
+        satellite_passes ):
+        '''
+        For each satellite, find the first visible pass within the windows.
+
+        The passes for a satellite are found up to and including the first
+        visible pass within the windows and retained in satellite passes;
+        subsequent calls look up the passes until either the TLE or the
+        location changes, or the passes are exhausted, in which case the
+        search is extended from where the previous search stopped.  The search
+        is made only as far as needed, so that the first calculation is no
+        slower than searching for the first visible pass of each satellite.
+
+        Satellites to be searched are first screened together, so that each
+        search is confined to those intervals in which a satellite may rise.
+        '''
         utc_now = ephem_now.datetime().replace( tzinfo = datetime.timezone.utc )
 
         utc_now_plus_search_duration = (
@@ -536,118 +1178,211 @@ class AstroPyEphem( AstroBase ):
                 start_hour_as_date_time_in_utc,
                 end_hour_as_date_time_in_utc ) )
 
-        observer_visible_passes = observer.copy()
-        observer_visible_passes.pressure = 0
-        observer_visible_passes.horizon = "-0:34"
-
-        for satellite in satellites:
-            if satellite in satellite_data:
-                key = ( AstroBase.BodyType.SATELLITE, satellite )
-                earth_satellite = (
-                    ephem.readtle(
-                        satellite_data[ satellite ].get_name(),
-                        *satellite_data[ satellite ].get_tle_line_one_line_two() ) )
-
-                for start_date_time, end_date_time in windows:
-                    found_pass = (
-                        AstroPyEphem._calculate_satellite(
-                            ephem.Date( start_date_time ),
-                            ephem.Date( end_date_time ),
-                            data,
-                            key,
-                            earth_satellite,
-                            observer,
-                            observer_visible_passes ) )
+        windows = [
+            ( ephem.Date( start_date_time ), ephem.Date( end_date_time ) )
+            for start_date_time, end_date_time in windows ]
+
+        search_end = ephem.Date( utc_now_plus_search_duration )
+        observer = session.observer
+        location = ( float( observer.lat ), float( observer.lon ), observer.elev )
+
+        # Satellites to be searched, with the passes found so far (None if
+        # the search is from scratch).
+        satellite_tles_stale = { }
+        for satellite, tle in satellite_tles.items():
+            passes = satellite_passes.get( satellite )
+            if passes is None or passes[ 0 ] != tle or passes[ 1 ] != location:
+                satellite_tles_stale[ satellite ] = ( tle, None )
+
+            elif passes[ 3 ] is not None:
+                # Passes beyond the end of the previous search are unknown.
+                is_exhausted = (
+                    AstroBase.get_satellite_pass( passes[ 3 ], windows ) is None
+                    and
+                    passes[ 2 ] < search_end )
+
+                if is_exhausted:
+                    satellite_tles_stale[ satellite ] = ( tle, passes )
+
+        # Screen all stale satellites together so that only those intervals
+        # in which a satellite may rise are searched.  The altitude is just
+        # below the horizon to allow for refraction.
+        search_intervals = (
+            AstroBase.get_satellite_search_intervals(
+                {
+                    satellite : Satrec.twoline2rv( tle[ 1 ], tle[ 2 ] )
+                    for satellite, ( tle, passes ) in satellite_tles_stale.items() },
+                utc_now,
+                utc_now_plus_search_duration,
+                math.degrees( location[ 0 ] ),
+                math.degrees( location[ 1 ] ),
+                location[ 2 ],
+                -1.0 ) )
+
+        if search_intervals is None:
+            # Unable to screen; search each satellite over the whole search.
+            search_intervals = {
+                satellite : [ [ utc_now, utc_now_plus_search_duration ] ]
+                for satellite in satellite_tles_stale }
+
+        for satellite, ( tle, passes ) in satellite_tles_stale.items():
+            if passes is None:
+                search_start = ephem_now
+                passes_previous = [ ]
+
+            else:
+                # Extend the previous search, dropping passes which have set.
+                search_start = passes[ 2 ]
+                passes_previous = [
+                    pass_
+                    for pass_ in passes[ 3 ]
+                    if pass_[ 2 ] > ephem_now ]
+
+            passes_, search_end_ = (
+                AstroPyEphem._calculate_satellite_passes(
+                    [
+                        (
+                            ephem.Date( max( ephem.Date( start_date_time ), search_start ) ),
+                            ephem.Date( end_date_time ) )
+                        for start_date_time, end_date_time
+                        in search_intervals.get( satellite, [ ] )
+                        if ephem.Date( end_date_time ) > search_start ],
+                    search_end,
+                    windows,
+                    ephem.readtle( *tle ),
+                    observer,
+                    session.observer_visible_passes ) )
+
+            satellite_passes[ satellite ] = (
+                tle,
+                location,
+                search_end_,
+                None if passes_ is None else passes_previous + passes_ )
+
+        for satellite, tle in satellite_tles.items():
+            key = ( AstroBase.BodyType.SATELLITE, satellite )
+            passes = satellite_passes[ satellite ]
+            if passes[ 3 ] is None:
+                # Satellite never rises/sets,
+                # so can only show current position.
+                earth_satellite = ephem.readtle( *tle )
+                earth_satellite.compute( observer )
+                body_data = AstroBase.get_body_data( data, key )
+                body_data.azimuth = float( earth_satellite.az )
+                body_data.altitude = float( earth_satellite.alt )
 
-                    if found_pass:
-                        break
+            else:
+                satellite_pass = (
+                    AstroBase.get_satellite_pass( passes[ 3 ], windows ) )
 
-        # Observer's date was changed in the calculate satellite method,
-        # so clean up before returning in case the observer is used later.
-        observer.date = ephem_now
+                if satellite_pass is not None:
+                    rise_date_time, rise_azimuth, set_date_time, set_azimuth, visible = (
+                        satellite_pass )
+
+                    body_data = AstroBase.get_body_data( data, key )
+                    body_data.rise_date_time = (
+                        ephem.Date( rise_date_time ).datetime().replace(
+                            tzinfo = datetime.timezone.utc ) )
+
+                    body_data.rise_azimuth = rise_azimuth
+
+                    body_data.set_date_time = (
+                        ephem.Date( set_date_time ).datetime().replace(
+                            tzinfo = datetime.timezone.utc ) )
+
+                    body_data.set_azimuth = set_azimuth
 
 
     @staticmethod
-    def _calculate_satellite(
-        start_date_time,
-        end_date_time,
-        data,
-        key,
+    def _calculate_satellite_passes(
+        search_intervals,
+        search_end,
+        windows,
         earth_satellite,
         observer,
         observer_visible_passes ):
+        '''
+        Find the passes of the satellite rising within the search intervals,
+        a list of ( start date/time, end date/time ) in chronological order
+        ending no later than the search end, stopping at the first visible
+        pass within the windows.
+
+        Returns a tuple of
+            A list of
+                ( rise date/time, rise azimuth, set date/time, set azimuth, visible )
+            or None if the satellite is circumpolar.
+
+            The date/time from which any subsequent search must start; at or
+            after the search end unless the search stopped at a visible pass.
+        '''
+        date_time_original = observer.date
+        passes = [ ]
+        current_date_time = None
+        found = False
+        for start_date_time, end_date_time in search_intervals:
+            if current_date_time is None or current_date_time < start_date_time:
+                current_date_time = start_date_time
+
+            while current_date_time < end_date_time:
+                observer.date = current_date_time
+                earth_satellite.compute( observer )
+                try:
+                    # Must set 'singlepass = False' as it is possible a pass
+                    # is too quick/low and an exception is thrown.
+                    # https://github.com/brandon-rhodes/pyephem/issues/164
+                    # https://github.com/brandon-rhodes/pyephem/pull/85/files
+                    next_pass = (
+                        observer.next_pass( earth_satellite, singlepass = False ) )
+
+                    if AstroPyEphem._is_satellite_pass_valid( next_pass ):
+                        pass_is_visible = (
+                            AstroPyEphem._is_satellite_pass_visible(
+                                observer_visible_passes,
+                                earth_satellite,
+                                next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_CULMINATION_DATE ] ) )
+
+                        passes.append( (
+                            float( next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_RISING_DATE ] ),
+                            float( next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_RISING_ANGLE ] ),
+                            float( next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_SETTING_DATE ] ),
+                            float( next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_SETTING_ANGLE ] ),
+                            pass_is_visible ) )
+
+                        # Look for the next pass starting shortly after current set.
+                        current_date_time = (
+                            ephem.Date(
+                                next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_SETTING_DATE ] +
+                                ephem.minute * 15 ) )
+
+                        found = (
+                            AstroBase.get_satellite_pass( passes[ -1 : ], windows )
+                            is not None )
+
+                        if found:
+                            break
 
-        found_pass = False
-        current_date_time = start_date_time
-        while current_date_time < end_date_time:
-            observer.date = current_date_time
-            earth_satellite.compute( observer )
-            try:
-                # Must set 'singlepass = False' as it is possible a pass
-                # is too quick/low and an exception is thrown.
-                # https://github.com/brandon-rhodes/pyephem/issues/164
-                # https://github.com/brandon-rhodes/pyephem/pull/85/files
-                next_pass = (
-                    observer.next_pass( earth_satellite, singlepass = False ) )
-
-                if AstroPyEphem._is_satellite_pass_valid( next_pass ):
-                    pass_before_end_date_time = (
-                        next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_SETTING_DATE ]
-                        <
-                        end_date_time )
-
-                    pass_is_visible = (
-                        AstroPyEphem._is_satellite_pass_visible(
-                            observer_visible_passes,
-                            earth_satellite,
-                            next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_CULMINATION_DATE ] ) )
-
-                    if pass_before_end_date_time and pass_is_visible:
-                        next_rise = next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_RISING_DATE ]
-                        next_rise = next_rise.datetime().replace( tzinfo = datetime.timezone.utc )
-                        data[ key + ( AstroBase.DATA_TAG_RISE_DATE_TIME, ) ] = (
-                            next_rise )
-
-                        data[ key + ( AstroBase.DATA_TAG_RISE_AZIMUTH, ) ] = (
-                            repr( next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_RISING_ANGLE ] ) )
-
-                        next_set = next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_SETTING_DATE ]
-                        next_set = next_set.datetime().replace( tzinfo = datetime.timezone.utc )
-                        data[ key + ( AstroBase.DATA_TAG_SET_DATE_TIME, ) ] = (
-                            next_set )
-
-                        data[ key + ( AstroBase.DATA_TAG_SET_AZIMUTH, ) ] = (
-                            repr( next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_SETTING_ANGLE ] ) )
-
-                        found_pass = True
-                        break
-
-                    # Look for the next pass starting shortly after current set.
-                    current_date_time = (
-                        ephem.Date(
-                            next_pass[ AstroPyEphem._PYEPHEM_SATELLITE_SETTING_DATE ] +
-                            ephem.minute * 15 ) )
+                    else:
+                        # Bad pass data, so look shortly after the current time.
+                        current_date_time = (
+                            ephem.Date( current_date_time + ephem.minute * 15 ) )
 
-                else:
-                    # Bad pass data, so look shortly after the current time.
-                    current_date_time = (
-                        ephem.Date( current_date_time + ephem.minute * 15 ) )
+                except ValueError:
+                    if earth_satellite.circumpolar:
+                        passes = None
 
-            except ValueError:
-                if earth_satellite.circumpolar:
-                    # Satellite never rises/sets,
-                    # so can only show current position.
-                    data[ key + ( AstroBase.DATA_TAG_AZIMUTH, ) ] = (
-                        repr( earth_satellite.az ) )
+                    break
 
-                    data[ key + ( AstroBase.DATA_TAG_ALTITUDE, ) ] = (
-                        repr( earth_satellite.alt ) )
+            if passes is None or found:
+                break
 
-                    found_pass = True
+        # Observer's date was changed above, so clean up before returning in
+        # case the observer is used later.
+        observer.date = date_time_original
 
-                break
+        if not found and ( current_date_time is None or current_date_time < search_end ):
+            current_date_time = search_end
 
-        return found_pass
+        return passes, current_date_time
 
 
     @staticmethod
@@ -110,10 +110,10 @@
 #         exclude src/indicatorlunar/astroskyfield.py
 #     Add the lines
 #         include src/indicatorlunar/data/planets.bsp
-#         include src/indicatorlunar/data/stars.dat
+#         include src/indicatorlunar/data/stars.bin
 #
 # In pyprojectspecific.toml
-#     Remove ephem from the dependencies, leaving only sgp4
+#     Remove ephem from the dependencies, leaving only numpy and sgp4
 #
 # In the Python PyPI pip install instructions, using some bash trickery to
 # determine if 32 bit or 64 bit.
@@ -142,12 +142,18 @@ import math
 
 from pathlib import Path
 
+import numpy
 import skyfield
 
 from skyfield import almanac, constants, eclipselib
 from skyfield.api import EarthSatellite, load, Star, wgs84
-from skyfield.data import hipparcos, mpc
+from skyfield.data import mpc
+from skyfield.data.spice import inertial_frames
+from skyfield.functions import length_of, mxv, T
+from skyfield.geometry import intersect_line_and_sphere
+from skyfield.keplerlib import propagate
 from skyfield.magnitudelib import planetary_magnitude
+from skyfield.sgp4lib import TEME
 from skyfield.trigonometry import position_angle_of
 
 from . import eclipse
@@ -178,12 +184,50 @@ class AstroSkyfield( AstroBase ):
     #
     # Alternatively, download a .bsp and use spkmerge
     #     https://github.com/skyfielders/python-skyfield/issues/123
-    _EPHEMERIS_PLANETS = (
-        load( str( Path( __file__ ).parent / "data" / "planets.bsp" ) ) )
-
-    ephemeris_stars_path = Path( __file__ ).parent / "data" / "stars.dat"
-    with load.open( str( ephemeris_stars_path ) ) as f:
-        _EPHEMERIS_STARS = hipparcos.load_dataframe( f )
+    #
+    # The planets and stars ephemerides are loaded on first use, rather than
+    # on import, via _get_ephemeris_planets() and _get_ephemeris_stars().
+    _ephemeris_planets = None
+    _ephemeris_stars = None
+
+    # Stars ephemeris, created by tools/_build_wheel.py from hip_main.dat,
+    # holds for each star seven little endian doubles:
+    #   HIP, magnitude, RA (degrees), Dec (degrees), parallax (mas),
+    #   proper motion in RA (mas/year), proper motion in Dec (mas/year)
+    _STARS_FIELD_COUNT = 7
+
+    # Epoch of the Hipparcos catalogue, as per skyfield.data.hipparcos.
+    _STARS_EPOCH_YEAR = 1991.25
+
+    # Altitude at which a star rises/sets, allowing 34' for refraction, as per
+    # skyfield.almanac.find_risings().
+    _STAR_HORIZON_DEGREES = -34.0 / 60.0
+
+    # Orbits for comets and minor planets, kept between calls to calculate().
+    #   Key: Body name (upper case)
+    #   Value: ( orbital element line, dataframe row, orbit, orbit from sun )
+    _orbits_comets = { }
+    _orbits_minor_planets = { }
+
+    # Satellite passes, kept between calls to calculate().
+    #   Key: Satellite number
+    #   Value: ( epoch, location, search end date/time, satellite passes )
+    # The epoch is that of the satellite record and the location is the
+    # observer's latitude, longitude and elevation.
+    # Satellite passes are a list of
+    #   ( rise date/time, rise azimuth, set date/time, set azimuth, visible )
+    # in chronological order.
+    _satellite_passes = { }
+
+    # Altitude above which a satellite is deemed to have risen.
+    _SATELLITE_ALTITUDE_DEGREES = 20.0
+
+    # Key to the next lunar eclipse held in the almanac cache.
+    _ALMANAC_ECLIPSE_LUNAR = "ECLIPSE LUNAR"
+
+    # Timescale, observer's location and almanac functions, kept between calls
+    # to calculate() and created afresh when the location changes.
+    _session = None
 
     # Name tags for bodies.
     _MOON = "MOON"
@@ -335,6 +379,131 @@ class AstroSkyfield( AstroBase ):
         "Zurich"           : ( 47.3833333, 8.5333333, 405.500916 ) }
 
 
+    class _Session():
+        '''
+        Timescale, observer's location and almanac functions for a location.
+        '''
+
+        __slots__ = (
+            "location",
+            "timescale",
+            "latitude_longitude_elevation",
+            "observer",
+            "is_twilight_function",
+            "moon_phases_function",
+            "seasons_function" )
+
+
+        def __init__(
+            self,
+            latitude,
+            longitude,
+            elevation ):
+
+            self.location = ( latitude, longitude, elevation )
+
+            self.timescale = load.timescale( builtin = True )
+
+            self.latitude_longitude_elevation = (
+                wgs84.latlon( latitude, longitude, elevation ) )
+
+            ephemeris_planets = AstroSkyfield._get_ephemeris_planets()
+            self.observer = (
+                ephemeris_planets[ AstroSkyfield._PLANET_EARTH ] +
+                self.latitude_longitude_elevation )
+
+            self.is_twilight_function = (
+                almanac.dark_twilight_day(
+                    ephemeris_planets,
+                    self.latitude_longitude_elevation ) )
+
+            self.moon_phases_function = almanac.moon_phases( ephemeris_planets )
+            self.seasons_function = almanac.seasons( ephemeris_planets )
+
+
+    @staticmethod
+    def _get_session(
+        latitude,
+        longitude,
+        elevation ):
+        '''
+        Return the session for the location, creating the session if there is
+        none or the location has changed.
+        '''
+        session = AstroSkyfield._session
+        location = ( latitude, longitude, elevation )
+        if session is None or session.location != location:
+            session = AstroSkyfield._Session( latitude, longitude, elevation )
+            AstroSkyfield._session = session
+
+        return session
+
+
+    @staticmethod
+    def _get_ephemeris_planets():
+        '''
+        Return the planets ephemeris, loading on first call.
+
+        Loading reads only the summary of each segment; the segment data is
+        memory mapped (by jplephem) on first computation of that segment.
+        '''
+        if AstroSkyfield._ephemeris_planets is None:
+            AstroSkyfield._ephemeris_planets = (
+                load( str( Path( __file__ ).parent / "data" / "planets.bsp" ) ) )
+
+        return AstroSkyfield._ephemeris_planets
+
+
+    @staticmethod
+    def _get_ephemeris_stars():
+        '''
+        Return the stars ephemeris, loading on first call, as a dictionary:
+            Key: HIP
+            Value: ( magnitude, RA (degrees), Dec (degrees), parallax (mas),
+                     proper motion in RA (mas/year),
+                     proper motion in Dec (mas/year) )
+        '''
+        if AstroSkyfield._ephemeris_stars is None:
+            stars = (
+                numpy.fromfile(
+                    Path( __file__ ).parent / "data" / "stars.bin",
+                    dtype = "<f8" ).reshape(
+                        -1,
+                        AstroSkyfield._STARS_FIELD_COUNT ) )
+
+            AstroSkyfield._ephemeris_stars = {
+                int( star[ 0 ] ) : tuple( star[ 1 : ] )
+                for star in stars.tolist() }
+
+        return AstroSkyfield._ephemeris_stars
+
+
+    @staticmethod
+    def _create_star(
+        ra_degrees,
+        dec_degrees,
+        parallax_mas,
+        ra_mas_per_year,
+        dec_mas_per_year ):
+        '''
+        Create a Star from a stars ephemeris value (less the magnitude).
+
+        Each argument may be an array, creating a single Star holding the
+        positions of many stars.
+        '''
+        # As per skyfield.starlib.Star.from_dataframe().
+        epoch = 1721045.0 + AstroSkyfield._STARS_EPOCH_YEAR * 365.25
+
+        return (
+            Star(
+                ra_hours = ra_degrees / 15.0,
+                dec_degrees = dec_degrees,
+                ra_mas_per_year = ra_mas_per_year,
+                dec_mas_per_year = dec_mas_per_year,
+                parallax_mas = parallax_mas,
+                epoch = epoch ) )
+
+
     @staticmethod
     def calculate(
         utc_now,
@@ -353,13 +522,20 @@ class AstroSkyfield( AstroBase ):
         minor_planet_data,
         minor_planet_apparent_magnitude_data,
         apparent_magnitude_maximum,
-        logging ):
+        rise_set_cache,
+        almanac_cache,
+        logger,
+        body_types = None,
+        worker_count = 1 ):
         '''
         Calculate the rise/set/az/alt for all bodies.
         '''
         data = { }
+        if body_types is None:
+            body_types = list( AstroBase.BodyType )
 
-        timescale = load.timescale( builtin = True ) #TODO Was "timeScale =" so hopefully the rename to timescale does not clash with load.timescale.
+        session = AstroSkyfield._get_session( latitude, longitude, elevation )
+        timescale = session.timescale
         now = (
             timescale.utc(
                 utc_now.year,
@@ -372,76 +548,89 @@ class AstroSkyfield( AstroBase ):
         # Rise/set window for most bodies.
         now_plus_twenty_five_hours = now + datetime.timedelta( hours = 25 )
 
-        latitude_longitude_elevation = (
-            wgs84.latlon( latitude, longitude, elevation ) )
+        location = session.observer
+        location_at_now = location.at( now )
 
-        location = (
-            AstroSkyfield._EPHEMERIS_PLANETS[ AstroSkyfield._PLANET_EARTH ] +
-            wgs84.latlon( latitude, longitude, elevation ) )
+        if AstroBase.BodyType.MOON in body_types:
+            AstroSkyfield._calculate_moon(
+                now,
+                location,
+                location_at_now,
+                session.moon_phases_function,
+                data,
+                rise_set_cache,
+                almanac_cache )
 
-        location_at_now = location.at( now )
+        if AstroBase.BodyType.SUN in body_types:
+            AstroSkyfield._calculate_sun(
+                now,
+                now_plus_twenty_five_hours,
+                location,
+                location_at_now,
+                session.seasons_function,
+                data,
+                rise_set_cache,
+                almanac_cache )
+
+        if AstroBase.BodyType.PLANET in body_types:
+            AstroSkyfield._calculate_planets(
+                now,
+                now_plus_twenty_five_hours,
+                location,
+                location_at_now,
+                data,
+                planets,
+                apparent_magnitude_maximum,
+                rise_set_cache )
 
-        AstroSkyfield._calculate_moon(
-            now,
-            location,
-            location_at_now,
-            data )
-
-        AstroSkyfield._calculate_sun(
-            now,
-            now_plus_twenty_five_hours,
-            location,
-            location_at_now,
-            data )
-
-        AstroSkyfield._calculate_planets(
-            now,
-            now_plus_twenty_five_hours,
-            location,
-            location_at_now,
-            data,
-            planets,
-            apparent_magnitude_maximum )
-
-        AstroSkyfield._calculate_stars(
-            now,
-            now_plus_twenty_five_hours,
-            location,
-            location_at_now,
-            data,
-            stars,
-            apparent_magnitude_maximum )
-
-        AstroSkyfield._calculate_comets(
-            now,
-            timescale,
-            location,
-            location_at_now,
-            data,
-            comets,
-            comet_data,
-            apparent_magnitude_maximum )
-
-        AstroSkyfield._calculate_minor_planets(
-            now,
-            timescale,
-            location,
-            location_at_now,
-            data,
-            minor_planets,
-            minor_planet_data,
-            apparent_magnitude_maximum,
-            minor_planet_apparent_magnitude_data )
-
-        AstroSkyfield._calculate_satellites(
-            now,
-            timescale,
-            latitude_longitude_elevation,
-            data,
-            satellites,
-            satellite_data,
-            start_hour_as_date_time_in_utc,
-            end_hour_as_date_time_in_utc )
+        if AstroBase.BodyType.STAR in body_types:
+            AstroSkyfield._calculate_stars(
+                now,
+                now_plus_twenty_five_hours,
+                latitude,
+                location,
+                location_at_now,
+                data,
+                stars,
+                apparent_magnitude_maximum,
+                rise_set_cache )
+
+        if AstroBase.BodyType.COMET in body_types:
+            AstroSkyfield._calculate_comets(
+                now,
+                timescale,
+                location,
+                location_at_now,
+                data,
+                comets,
+                comet_data,
+                apparent_magnitude_maximum,
+                rise_set_cache )
+
+        if AstroBase.BodyType.MINOR_PLANET in body_types:
+            AstroSkyfield._calculate_minor_planets(
+                now,
+                timescale,
+                location,
+                location_at_now,
+                data,
+                minor_planets,
+                minor_planet_data,
+                apparent_magnitude_maximum,
+                minor_planet_apparent_magnitude_data,
+                rise_set_cache )
+
+        if AstroBase.BodyType.SATELLITE in body_types:
+            AstroSkyfield._calculate_satellites(
+                now,
+                timescale,
+                session.latitude_longitude_elevation,
+                session.is_twilight_function,
+                data,
+                satellites,
+                satellite_data,
+                start_hour_as_date_time_in_utc,
+                end_hour_as_date_time_in_utc )
 
         return data
 
@@ -521,40 +710,39 @@ class AstroSkyfield( AstroBase ):
         now,
         location,
         location_at_now,
-        data ):
+        moon_phases_function,
+        data,
+        rise_set_cache,
+        almanac_cache ):
 
         key = ( AstroBase.BodyType.MOON, AstroBase.NAME_TAG_MOON )
-        moon = AstroSkyfield._EPHEMERIS_PLANETS[ AstroSkyfield._MOON ]
+        moon = AstroSkyfield._get_ephemeris_planets()[ AstroSkyfield._MOON ]
         moon_at_now_apparent = location_at_now.observe( moon ).apparent()
-        sun = AstroSkyfield._EPHEMERIS_PLANETS[ AstroSkyfield._SUN ]
+        sun = AstroSkyfield._get_ephemeris_planets()[ AstroSkyfield._SUN ]
+        body_data = AstroBase.get_body_data( data, key )
 
         # Needed for icon.
         illumination = moon_at_now_apparent.fraction_illuminated( sun ) * 100
-        data[ key + ( AstroBase.DATA_TAG_ILLUMINATION, ) ] = str( illumination )
-
-        # Moon phases search window.
-        now_plus_thirty_one_days = now + datetime.timedelta( days = 31 )
-
-        date_times, events = (
-            almanac.find_discrete(
-                now,
-                now_plus_thirty_one_days,
-                almanac.moon_phases( AstroSkyfield._EPHEMERIS_PLANETS ) ) )
+        body_data.illumination = float( illumination )
 
-        # Take first four events to avoid an unforeseen edge case!
-        events_to_date_times = (
-            dict( zip( events[ : 4 ], date_times[ : 4 ].utc_datetime() ) ) )
+        next_first_quarter, next_full, next_third_quarter, next_new = (
+            AstroBase.get_almanac_events(
+                almanac_cache,
+                AstroBase.ALMANAC_MOON_PHASES,
+                now.utc_datetime(),
+                lambda:
+                    AstroSkyfield._calculate_moon_phases(
+                        now,
+                        moon_phases_function ) ) )
 
-        index_full_moon = almanac.MOON_PHASES.index( "Full Moon" )
-        index_new_moon = almanac.MOON_PHASES.index( "New Moon" )
         lunar_phase = (
             AstroBase.get_lunar_phase(
                 illumination,
-                events_to_date_times[ index_full_moon ],
-                events_to_date_times[ index_new_moon ] ) )
+                next_full,
+                next_new ) )
 
         # Needed for notification.
-        data[ key + ( AstroBase.DATA_TAG_PHASE, ) ] = lunar_phase
+        body_data.phase = lunar_phase
 
         sun_alt_az = location_at_now.observe( sun ).apparent().altaz()
 
@@ -564,8 +752,7 @@ class AstroSkyfield( AstroBase ):
                 moon_at_now_apparent.altaz(),
                 sun_alt_az ) )
 
-        data[ key + ( AstroBase.DATA_TAG_BRIGHT_LIMB, ) ] = (
-            str( bright_limb.radians ) )
+        body_data.bright_limb = float( bright_limb.radians )
 
         never_up = (
             AstroSkyfield._calculate_common(
@@ -575,22 +762,51 @@ class AstroSkyfield( AstroBase ):
                 location_at_now,
                 data,
                 key,
-                moon ) )
+                moon,
+                rise_set_cache ) )
 
         if not never_up:
-            data[ key + ( AstroBase.DATA_TAG_FIRST_QUARTER, ) ] = (
-                events_to_date_times[ almanac.MOON_PHASES.index( "First Quarter" ) ] )
+            body_data.first_quarter = next_first_quarter
+            body_data.full = next_full
+            body_data.third_quarter = next_third_quarter
+            body_data.new = next_new
 
-            data[ key + ( AstroBase.DATA_TAG_FULL, ) ] = (
-                events_to_date_times[ almanac.MOON_PHASES.index( "Full Moon" ) ] )
+            AstroSkyfield._calculate_eclipse(
+                now,
+                data,
+                key,
+                False,
+                almanac_cache )
 
-            data[ key + ( AstroBase.DATA_TAG_THIRD_QUARTER, ) ] = (
-                events_to_date_times[ almanac.MOON_PHASES.index( "Last Quarter" ) ] )
 
-            data[ key + ( AstroBase.DATA_TAG_NEW, ) ] = (
-                events_to_date_times[ almanac.MOON_PHASES.index( "New Moon" ) ] )
+    @staticmethod
+    def _calculate_moon_phases(
+        now,
+        moon_phases_function ):
+        '''
+        Returns ( expiry date/time, moon phases ) for the almanac cache, where
+        the moon phases are the date/times of the next first quarter, full,
+        third quarter and new moon and the expiry date/time is the earliest.
+        '''
+        # Moon phases search window.
+        now_plus_thirty_one_days = now + datetime.timedelta( days = 31 )
+
+        date_times, events = (
+            almanac.find_discrete(
+                now,
+                now_plus_thirty_one_days,
+                moon_phases_function ) )
+
+        # Take first four events to avoid an unforeseen edge case!
+        events_to_date_times = (
+            dict( zip( events[ : 4 ], date_times[ : 4 ].utc_datetime() ) ) )
+
+        moon_phases = tuple(
+            events_to_date_times[ almanac.MOON_PHASES.index( moon_phase ) ]
+            for moon_phase in (
+                "First Quarter", "Full Moon", "Last Quarter", "New Moon" ) )
 
-            AstroSkyfield._calculate_eclipse( now, data, key, False )
+        return min( moon_phases ), moon_phases
 
 
     @staticmethod
@@ -598,7 +814,11 @@ class AstroSkyfield( AstroBase ):
         now,
         now_plus_twenty_five_hours,
         location,
-        location_at_now, data ):
+        location_at_now,
+        seasons_function,
+        data,
+        rise_set_cache,
+        almanac_cache ):
 
         key = ( AstroBase.BodyType.SUN, AstroBase.NAME_TAG_SUN )
 
@@ -610,46 +830,73 @@ class AstroSkyfield( AstroBase ):
                 location_at_now,
                 data,
                 key,
-                AstroSkyfield._EPHEMERIS_PLANETS[ AstroSkyfield._SUN ] ) )
+                AstroSkyfield._get_ephemeris_planets()[ AstroSkyfield._SUN ],
+                rise_set_cache ) )
 
         if not never_up:
-            date_times, events = (
-                almanac.find_discrete(
-                    now,
-                    now + datetime.timedelta( days = 366 / 12 * 7 ), # Solstice/equinox search window.
-                    almanac.seasons( AstroSkyfield._EPHEMERIS_PLANETS ) ) )
+            body_data = AstroBase.get_body_data( data, key )
+            body_data.equinox, body_data.solstice = (
+                AstroBase.get_almanac_events(
+                    almanac_cache,
+                    AstroBase.ALMANAC_SEASONS,
+                    now.utc_datetime(),
+                    lambda:
+                        AstroSkyfield._calculate_seasons(
+                            now,
+                            seasons_function ) ) )
+
+            AstroSkyfield._calculate_eclipse(
+                now,
+                data,
+                key,
+                True,
+                almanac_cache )
 
-            # Take first two events to avoid an unforeseen edge case!
-            events_to_date_times = (
-                dict( zip( events[ : 2 ], date_times[ : 2 ].utc_datetime() ) ) )
 
-            index_equinox_march = (
-                almanac.SEASON_EVENTS_NEUTRAL.index( "March Equinox" ) )
+    @staticmethod
+    def _calculate_seasons(
+        now,
+        seasons_function ):
+        '''
+        Returns ( expiry date/time, seasons ) for the almanac cache, where the
+        seasons are the date/times of the next equinox and solstice and the
+        expiry date/time is the earliest.
+        '''
+        date_times, events = (
+            almanac.find_discrete(
+                now,
+                now + datetime.timedelta( days = 366 / 12 * 7 ), # Solstice/equinox search window.
+                seasons_function ) )
 
-            if index_equinox_march in events_to_date_times:
-                key_equinox = index_equinox_march
+        # Take first two events to avoid an unforeseen edge case!
+        events_to_date_times = (
+            dict( zip( events[ : 2 ], date_times[ : 2 ].utc_datetime() ) ) )
 
-            else:
-                key_equinox = (
-                    almanac.SEASON_EVENTS_NEUTRAL.index( "September Equinox" ) )
+        index_equinox_march = (
+            almanac.SEASON_EVENTS_NEUTRAL.index( "March Equinox" ) )
 
-            data[ key + ( AstroBase.DATA_TAG_EQUINOX, ) ] = (
-                events_to_date_times[ key_equinox ] )
+        if index_equinox_march in events_to_date_times:
+            key_equinox = index_equinox_march
 
-            index_solstice_june = (
-                almanac.SEASON_EVENTS_NEUTRAL.index( "June Solstice" ) )
+        else:
+            key_equinox = (
+                almanac.SEASON_EVENTS_NEUTRAL.index( "September Equinox" ) )
 
-            if index_solstice_june in events_to_date_times:
-                key_solstice = index_solstice_june
+        index_solstice_june = (
+            almanac.SEASON_EVENTS_NEUTRAL.index( "June Solstice" ) )
 
-            else:
-                key_solstice = (
-                    almanac.SEASON_EVENTS_NEUTRAL.index( "December Solstice" ) )
+        if index_solstice_june in events_to_date_times:
+            key_solstice = index_solstice_june
 
-            data[ key + ( AstroBase.DATA_TAG_SOLSTICE, ) ] = (
-                events_to_date_times[ key_solstice ] )
+        else:
+            key_solstice = (
+                almanac.SEASON_EVENTS_NEUTRAL.index( "December Solstice" ) )
+
+        seasons = (
+            events_to_date_times[ key_equinox ],
+            events_to_date_times[ key_solstice ] )
 
-            AstroSkyfield._calculate_eclipse( now, data, key, True )
+        return min( seasons ), seasons
 
 
     @staticmethod
@@ -657,7 +904,8 @@ class AstroSkyfield( AstroBase ):
         now,
         data,
         key,
-        is_solar ):
+        is_solar,
+        almanac_cache ):
 
         # https://rhodesmill.org/skyfield/almanac.html
         def _get_native_eclipse_type(
@@ -687,39 +935,48 @@ class AstroSkyfield( AstroBase ):
             return native_eclipse_type
 
 
+        body_data = AstroBase.get_body_data( data, key )
         if is_solar:
             date_time, eclipse_type, latitude, longitude = (
                 eclipse.get_eclipse_solar( now.utc_datetime() ) )
 
-            data[ key + ( AstroBase.DATA_TAG_ECLIPSE_DATE_TIME, ) ] = date_time
-            data[ key + ( AstroBase.DATA_TAG_ECLIPSE_TYPE, ) ] = eclipse_type
-            data[ key + ( AstroBase.DATA_TAG_ECLIPSE_LATITUDE, ) ] = latitude
-            data[ key + ( AstroBase.DATA_TAG_ECLIPSE_LONGITUDE, ) ] = longitude
+            body_data.eclipse_date_time = date_time
+            body_data.eclipse_type = eclipse_type
+            body_data.eclipse_latitude = latitude
+            body_data.eclipse_longitude = longitude
 
 #TODO When solar eclipses are implemented,
 # swap the code above with the code below and
 # update the eclipse credit in the indicator.
 # https://github.com/skyfielders/python-skyfield/issues/445
-            # dateTimes, events, details = eclipselib.solar_eclipses( now, now_plus_one_year, AstroSkyfield._EPHEMERIS_PLANETS )
-            # data[ key + ( AstroBase.DATA_TAG_ECLIPSE_DATE_TIME, ) ] = dateTimes[ 0 ].utc_datetime()
-            # data[ key + ( AstroBase.DATA_TAG_ECLIPSE_TYPE, ) ] = _get_native_eclipse_type( events[ 0 ], False )
+            # dateTimes, events, details = eclipselib.solar_eclipses( now, now_plus_one_year, AstroSkyfield._get_ephemeris_planets() )
+            # body_data.eclipse_date_time = dateTimes[ 0 ].utc_datetime()
+            # body_data.eclipse_type = _get_native_eclipse_type( events[ 0 ], False )
 
         else:
 #TODO Submitted a discussion to see if possible to get the lat/long.
 # If feasible, add here and remove check in indicator front-end.
 # https://github.com/skyfielders/python-skyfield/discussions/801
-            now_plus_one_year = now + datetime.timedelta( days = 366 ) # Eclipse search window.
-            date_times, events, details = (
-                eclipselib.lunar_eclipses(
-                    now,
-                    now_plus_one_year,
-                    AstroSkyfield._EPHEMERIS_PLANETS ) )
+            def _calculate_eclipse_lunar():
+                now_plus_one_year = now + datetime.timedelta( days = 366 ) # Eclipse search window.
+                date_times, events, details = (
+                    eclipselib.lunar_eclipses(
+                        now,
+                        now_plus_one_year,
+                        AstroSkyfield._get_ephemeris_planets() ) )
+
+                date_time = date_times[ 0 ].utc_datetime()
+                return (
+                    date_time,
+                    ( date_time, _get_native_eclipse_type( events[ 0 ], True ) ) )
 
-            data[ key + ( AstroBase.DATA_TAG_ECLIPSE_DATE_TIME, ) ] = (
-                date_times[ 0 ].utc_datetime() )
 
-            data[ key + ( AstroBase.DATA_TAG_ECLIPSE_TYPE, ) ] = (
-                _get_native_eclipse_type( events[ 0 ], True ) )
+            body_data.eclipse_date_time, body_data.eclipse_type = (
+                AstroBase.get_almanac_events(
+                    almanac_cache,
+                    AstroSkyfield._ALMANAC_ECLIPSE_LUNAR,
+                    now.utc_datetime(),
+                    _calculate_eclipse_lunar ) )
 
 
     @staticmethod
@@ -730,13 +987,14 @@ class AstroSkyfield( AstroBase ):
         location_at_now,
         data,
         planets,
-        apparent_magnitude_maximum ):
+        apparent_magnitude_maximum,
+        rise_set_cache ):
 
-        earth = AstroSkyfield._EPHEMERIS_PLANETS[ AstroSkyfield._PLANET_EARTH ]
+        earth = AstroSkyfield._get_ephemeris_planets()[ AstroSkyfield._PLANET_EARTH ]
         earth_at_now = earth.at( now )
         for planet_name in planets:
             index_planet = AstroSkyfield._PLANET_MAPPINGS[ planet_name ]
-            planet = AstroSkyfield._EPHEMERIS_PLANETS[ index_planet ]
+            planet = AstroSkyfield._get_ephemeris_planets()[ index_planet ]
             apparent_magnitude = (
                 planetary_magnitude( earth_at_now.observe( planet ) ) )
 
@@ -757,31 +1015,83 @@ class AstroSkyfield( AstroBase ):
                     location_at_now,
                     data,
                     ( AstroBase.BodyType.PLANET, planet_name ),
-                    planet )
+                    planet,
+                    rise_set_cache )
 
 
     @staticmethod
     def _calculate_stars(
         now,
         now_plus_twenty_five_hours,
+        latitude,
         location,
         location_at_now,
         data,
         stars,
-        apparent_magnitude_maximum ):
+        apparent_magnitude_maximum,
+        rise_set_cache ):
+        '''
+        Calculate all stars at once, as a single Star.
 
-        for star in stars:
-            hip = AstroBase.get_star_hip( star )
-            star_ = AstroSkyfield._EPHEMERIS_STARS.loc[ hip ]
-            if star_.magnitude <= apparent_magnitude_maximum:
-                AstroSkyfield._calculate_common(
-                    now,
-                    now_plus_twenty_five_hours,
-                    location,
-                    location_at_now,
-                    data,
-                    ( AstroBase.BodyType.STAR, star ),
-                    Star.from_dataframe( star_ ) )
+        The rise/set of a star is calculated in closed form, other than for a
+        star close to being always up or never up, which is searched.
+        '''
+        ephemeris_stars = AstroSkyfield._get_ephemeris_stars()
+        stars_ = [
+            ( star, ephemeris_stars[ AstroBase.get_star_hip( star ) ] )
+            for star in stars
+            if ephemeris_stars[ AstroBase.get_star_hip( star ) ][ 0 ] <= apparent_magnitude_maximum ]
+
+        if stars_:
+            ephemerides = numpy.array( [ ephemeris for star, ephemeris in stars_ ] )
+            apparent = (
+                location_at_now.observe(
+                    AstroSkyfield._create_star( *ephemerides[ :, 1 : ].T ) ).apparent() )
+
+            alt, az, earth_body_distance = apparent.altaz()
+            hour_angle, dec, earth_body_distance = apparent.hadec()
+            utc_now = now.utc_datetime()
+            rise_sets = (
+                AstroBase.get_star_rise_sets(
+                    utc_now,
+                    math.radians( latitude ),
+                    math.radians( AstroSkyfield._STAR_HORIZON_DEGREES ),
+                    hour_angle.radians,
+                    dec.radians ) )
+
+            for i, ( star, ephemeris ) in enumerate( stars_ ):
+                key = ( AstroBase.BodyType.STAR, star )
+                rise_set = rise_sets[ i ]
+                if rise_set == AstroBase.StarRiseSet.SEARCH:
+                    AstroSkyfield._calculate_common(
+                        now,
+                        now_plus_twenty_five_hours,
+                        location,
+                        location_at_now,
+                        data,
+                        key,
+                        AstroSkyfield._create_star( *ephemeris[ 1 : ] ),
+                        rise_set_cache )
+
+                elif rise_set != AstroBase.StarRiseSet.NEVER_UP:
+                    body_data = AstroBase.get_body_data( data, key )
+                    if rise_set != AstroBase.StarRiseSet.ALWAYS_UP:
+                        rise_set_cached = (
+                            AstroBase.get_rise_set_from_cache(
+                                rise_set_cache,
+                                key,
+                                utc_now ) )
+
+                        if rise_set_cached is None:
+                            rise_set_cache[ key ] = ( None, ) + rise_set
+
+                        else:
+                            rise_set = rise_set_cached
+
+                        body_data.rise_date_time, body_data.set_date_time = rise_set
+
+                    body_data.azimuth = float( az.radians[ i ] )
+                    body_data.altitude = float( alt.radians[ i ] )
 
 
 #TODO Issue logged with regard to slow speed of processing comets / minor planets:
@@ -797,52 +1107,88 @@ class AstroSkyfield( AstroBase ):
         data,
         comets,
         orbital_element_data,
-        apparent_magnitude_maximum ):
-
-        with io.BytesIO() as f:
-            for key in comets:
-                if key in orbital_element_data:
-                    line = orbital_element_data[ key ].get_data() + '\n'
-                    f.write( line.encode() )
-
-            f.seek( 0 )
-
-            dataframe = mpc.load_comets_dataframe( f )
-
-        dataframe = dataframe.set_index( "designation", drop = False )
-
-        sun = AstroSkyfield._EPHEMERIS_PLANETS[ AstroSkyfield._SUN ]
-        sun_at_now = sun.at( now )
+        apparent_magnitude_maximum,
+        rise_set_cache ):
+
+        orbits = (
+            AstroSkyfield._get_orbits(
+                timescale,
+                comets,
+                orbital_element_data,
+                AstroSkyfield._orbits_comets,
+                mpc.load_comets_dataframe,
+                mpc.comet_orbit ) )
+
+        if not orbits:
+            return
+
+        # Screen all comets at once on apparent magnitude, so that only those
+        # bright enough are subject to the (far more expensive) rise/set search.
+        sun = AstroSkyfield._get_ephemeris_planets()[ AstroSkyfield._SUN ]
+        body_sun_position = (
+            AstroSkyfield._get_heliocentric_positions(
+                [ orbit for name, row, orbit, body in orbits ],
+                now ) )
+
+        body_position = (
+            sun.at( now ).position.au[ :, numpy.newaxis ] + body_sun_position )
+
+        body_earth_position = (
+            body_position - location_at_now.position.au[ :, numpy.newaxis ] )
+
+        g_absolute_magnitudes = (
+            numpy.array( [ row[ "magnitude_g" ] for name, row, orbit, body in orbits ] ) )
+
+        k_luminosity_indices = (
+            numpy.array( [ row[ "magnitude_k" ] for name, row, orbit, body in orbits ] ) )
+
+        # According to MPC, always use the gk model.
+        #   https://github.com/skyfielders/python-skyfield/issues/416
+        # Same as AstroBase.get_apparent_magnitude_gk(), but over arrays.
+        apparent_magnitudes = (
+            g_absolute_magnitudes
+            +
+            5 * numpy.log10( length_of( body_earth_position ) )
+            +
+            2.5 * k_luminosity_indices * numpy.log10( length_of( body_sun_position ) ) )
 
         # Found that using 25 hours throws a ValueError, so using 48.
         # https://github.com/skyfielders/python-skyfield/issues/959
         now_plus_forty_eight_hours = now + datetime.timedelta( hours = 48 )
 
-        for name, row in dataframe.iterrows():
-            key = ( AstroBase.BodyType.COMET, name.upper() )
-            body = (
-                sun
-                +
-                mpc.comet_orbit(
-                    row,
-                    timescale,
-                    constants.GM_SUN_Pitjeva_2005_km3_s2 ) )
-
-            ra, dec, earth_body_distance = location_at_now.observe( body ).radec()
-            ra, dec, sun_body_distance = sun_at_now.observe( body ).radec()
-
-            # According to MPC, always use the gk model.
-            #   https://github.com/skyfielders/python-skyfield/issues/416
-            apparent_magnitude = (
-                AstroBase.get_apparent_magnitude_gk(
-                    row[ "magnitude_g" ], row[ "magnitude_k" ],
-                    earth_body_distance.au, sun_body_distance.au ) )
-
+        z = zip( orbits, apparent_magnitudes )
+        for ( name, row, orbit, body ), apparent_magnitude in z:
             if apparent_magnitude < apparent_magnitude_maximum:
                 AstroSkyfield._calculate_common(
                     now, now_plus_forty_eight_hours,
                     location, location_at_now,
-                    data, key, body )
+                    data, ( AstroBase.BodyType.COMET, name ), body,
+                    rise_set_cache, orbital_element_data[ name ].get_data() )
+
+
+    @staticmethod
+    def _get_heliocentric_positions(
+        orbits,
+        now ):
+        '''
+        Return the positions (au) of the orbits relative to the sun at the
+        given time, as an array of shape ( 3, number of orbits ).
+
+        All orbits are propagated together in a single call, rather than one
+        at a time through each orbit's at() function.  Each orbit is given its
+        own copy of the time, which is how the propagator handles more than one
+        orbit.  Light travel time is ignored.
+        '''
+        position, velocity = (
+            propagate(
+                numpy.array( [ orbit.position_at_epoch.au for orbit in orbits ] ).T,
+                numpy.array( [ orbit.velocity_at_epoch.au_per_d for orbit in orbits ] ).T,
+                numpy.array( [ orbit.epoch.tt for orbit in orbits ] ),
+                numpy.full( ( len( orbits ), 1 ), now.tt ),
+                orbits[ 0 ].mu_au3_d2 ) )
+
+        # Orbital elements from the MPC are relative to the ecliptic.
+        return mxv( inertial_frames[ "ECLIPJ2000" ].T, position[ :, :, 0 ] )
 
 
 #TODO Issue logged with regard to slow speed of processing comets / minor planets:
@@ -859,10 +1205,16 @@ class AstroSkyfield( AstroBase ):
         minor_planets,
         orbital_element_data,
         apparent_magnitude_maximum,
-        apparent_magnitude_data ):
+        apparent_magnitude_data,
+        rise_set_cache ):
 
-        with io.BytesIO() as f:
-            for key in minor_planets:
+        minor_planets_to_calculate = [ ]
+        for key in minor_planets:
+            if apparent_magnitude_data is None:
+                # Screened below, on apparent magnitude computed locally.
+                minor_planets_to_calculate.append( key )
+
+            else:
                 orbital_element_present = key in orbital_element_data
                 apparent_magnitude_present = key in apparent_magnitude_data
                 if orbital_element_present and apparent_magnitude_present:
@@ -870,35 +1222,121 @@ class AstroSkyfield( AstroBase ):
                         float( apparent_magnitude_data[ key ].get_apparent_magnitude() ) )
 
                     if apparent_magnitude <= apparent_magnitude_maximum:
-                        line = orbital_element_data[ key ].get_data() + '\n'
-                        f.write( line.encode() )
-
-            f.seek( 0 )
-            dataframe = mpc.load_mpcorb_dataframe( f )
-
-        dataframe = dataframe.set_index( "designation", drop = False )
-        sun = AstroSkyfield._EPHEMERIS_PLANETS[ AstroSkyfield._SUN ]
-        for name, row in dataframe.iterrows():
-            key = ( AstroBase.BodyType.MINOR_PLANET, name.upper() )
-            body = (
-                sun
-                +
-                mpc.mpcorb_orbit(
-                    row,
-                    timescale,
-                    constants.GM_SUN_Pitjeva_2005_km3_s2 ) )
+                        minor_planets_to_calculate.append( key )
+
+        orbits = (
+            AstroSkyfield._get_orbits(
+                timescale,
+                minor_planets_to_calculate,
+                orbital_element_data,
+                AstroSkyfield._orbits_minor_planets,
+                mpc.load_mpcorb_dataframe,
+                mpc.mpcorb_orbit ) )
+
+        if apparent_magnitude_data is None and orbits:
+            # Screen all minor planets at once on apparent magnitude, from the
+            # absolute magnitude and slope parameter, so that only those bright
+            # enough are subject to the rise/set search.
+            sun_position = (
+                AstroSkyfield._get_ephemeris_planets()[ AstroSkyfield._SUN ].at(
+                    now ).position.au )
+
+            body_sun_position = (
+                AstroSkyfield._get_heliocentric_positions(
+                    [ orbit for name, row, orbit, body in orbits ],
+                    now ) )
+
+            body_earth_position = (
+                sun_position[ :, numpy.newaxis ] +
+                body_sun_position -
+                location_at_now.position.au[ :, numpy.newaxis ] )
+
+            apparent_magnitudes = (
+                AstroBase.get_apparent_magnitudes_hg(
+                    numpy.array( [ row[ "magnitude_H" ] for name, row, orbit, body in orbits ] ),
+                    numpy.array( [ row[ "magnitude_G" ] for name, row, orbit, body in orbits ] ),
+                    length_of( body_earth_position ),
+                    length_of( body_sun_position ),
+                    length_of( sun_position - location_at_now.position.au ) ) )
+
+            orbits = [
+                orbit
+                for orbit, apparent_magnitude in zip( orbits, apparent_magnitudes )
+                if apparent_magnitude <= apparent_magnitude_maximum ]
+
+        # Found that using 25 hours throws a ValueError, so using 48.
+        # https://github.com/skyfielders/python-skyfield/issues/959
+        now_plus_forty_eight_hours = now + datetime.timedelta( hours = 48 )
 
-            # Found that using 25 hours throws a ValueError, so using 48.
-            # https://github.com/skyfielders/python-skyfield/issues/959
-            now_plus_forty_eight_hours = now + datetime.timedelta( hours = 48 )
+        for name, row, orbit, body in orbits:
             AstroSkyfield._calculate_common(
                 now,
                 now_plus_forty_eight_hours,
                 location,
                 location_at_now,
                 data,
-                key,
-                body )
+                ( AstroBase.BodyType.MINOR_PLANET, name ),
+                body,
+                rise_set_cache,
+                orbital_element_data[ name ].get_data() )
+
+
+    @staticmethod
+    def _get_orbits(
+        timescale,
+        names,
+        orbital_element_data,
+        orbits_cache,
+        load_dataframe_function,
+        orbit_function ):
+        '''
+        Return a list of ( name, row, orbit, body ) for each name present in
+        the orbital element data, where row is the parsed dataframe row, orbit
+        is relative to the sun and body is the orbit positioned at the sun.
+
+        Parsing the orbital elements and constructing the orbit is expensive,
+        so each result is kept in the cache, keyed by name, along with the
+        orbital element line from which it was built.  A cached orbit is used
+        only whilst the line is unchanged; when fresh orbital element data is
+        loaded which differs, the orbit is rebuilt.  Orbits for names no longer
+        requested are dropped from the cache.
+        '''
+        lines = { }
+        for name in names:
+            if name in orbital_element_data:
+                lines[ name ] = orbital_element_data[ name ].get_data()
+
+        for name in list( orbits_cache.keys() ):
+            if name not in lines or orbits_cache[ name ][ 0 ] != lines[ name ]:
+                del orbits_cache[ name ]
+
+        names_missing = [ name for name in lines if name not in orbits_cache ]
+        if names_missing:
+            with io.BytesIO() as f:
+                for name in names_missing:
+                    f.write( ( lines[ name ] + '\n' ).encode() )
+
+                f.seek( 0 )
+                dataframe = load_dataframe_function( f )
+
+            dataframe = dataframe.set_index( "designation", drop = False )
+            sun = AstroSkyfield._get_ephemeris_planets()[ AstroSkyfield._SUN ]
+            for designation, row in dataframe.iterrows():
+                name = designation.upper()
+                if name in lines:
+                    orbit = (
+                        orbit_function(
+                            row,
+                            timescale,
+                            constants.GM_SUN_Pitjeva_2005_km3_s2 ) )
+
+                    orbits_cache[ name ] = (
+                        lines[ name ], row, orbit, sun + orbit )
+
+        return [
+            ( name, ) + orbits_cache[ name ][ 1 : ]
+            for name in lines
+            if name in orbits_cache ]
 
 
     @staticmethod
@@ -909,41 +1347,51 @@ class AstroSkyfield( AstroBase ):
         location_at_now,
         data,
         key,
-        body ):
+        body,
+        rise_set_cache,
+        orbital_element_data = None ):
 
         never_up = False
 
-        # https://rhodesmill.org/skyfield/almanac.html#risings-and-settings
-        rise_date_time, rises = (
-            almanac.find_risings( location, body, now, now_plus_whatever ) )
+        rise_set = (
+            AstroBase.get_rise_set_from_cache(
+                rise_set_cache,
+                key,
+                now.utc_datetime(),
+                orbital_element_data ) )
 
-        set_date_time, sets = (
-            almanac.find_settings( location, body, now, now_plus_whatever ) )
+        if rise_set is None:
+            # https://rhodesmill.org/skyfield/almanac.html#risings-and-settings
+            rise_date_time, rises = (
+                almanac.find_risings( location, body, now, now_plus_whatever ) )
 
-        if rises.item( 0 ) and sets.item( 0 ): # Rises and sets.
-            data[ key + ( AstroBase.DATA_TAG_RISE_DATE_TIME, ) ] = (
-                rise_date_time[ 0 ].utc_datetime() )
+            set_date_time, sets = (
+                almanac.find_settings( location, body, now, now_plus_whatever ) )
 
-            data[ key + ( AstroBase.DATA_TAG_SET_DATE_TIME, ) ] = (
-                set_date_time[ 0 ].utc_datetime() )
+            if rises.item( 0 ) and sets.item( 0 ): # Rises and sets.
+                rise_set = (
+                    rise_date_time[ 0 ].utc_datetime(),
+                    set_date_time[ 0 ].utc_datetime() )
 
-            alt, az, earth_body_distance = (
-                location_at_now.observe( body ).apparent().altaz() )
+                rise_set_cache[ key ] = ( orbital_element_data, ) + rise_set
+
+            elif sets.item( 0 ): # not rises.item( 0 )
+                # Never rises (never up).
+                # It is impossible to be never up AND always up.
+                never_up = True
 
-            data[ key + ( AstroBase.DATA_TAG_AZIMUTH, ) ] = str( az.radians )
-            data[ key + ( AstroBase.DATA_TAG_ALTITUDE, ) ] = str( alt.radians )
+            # Otherwise never sets (always up).
+
+        if not never_up:
+            body_data = AstroBase.get_body_data( data, key )
+            if rise_set is not None:
+                body_data.rise_date_time, body_data.set_date_time = rise_set
 
-        elif not sets.item( 0 ): # Never sets (always up).
             alt, az, earth_body_distance = (
                 location_at_now.observe( body ).apparent().altaz() )
 
-            data[ key + ( AstroBase.DATA_TAG_AZIMUTH, ) ] = str( az.radians )
-            data[ key + ( AstroBase.DATA_TAG_ALTITUDE, ) ] = str( alt.radians )
-
-        else: # not rises.item( 0 )
-            # Never rises (never up).
-            # It is impossible to be never up AND always up.
-            never_up = True
+            body_data.azimuth = float( az.radians )
+            body_data.altitude = float( alt.radians )
 
         return never_up
 
@@ -959,12 +1407,23 @@ class AstroSkyfield( AstroBase ):
         now,
         timescale,
         latitude_longitude_elevation,
+        is_twilight_function,
         data,
         satellites,
         satellite_data,
         start_hour_as_date_time_in_utc,
         end_hour_as_date_time_in_utc ):
+        '''
+        For each satellite, find the first visible pass within the windows.
 
+        All passes for a satellite are found in one search and retained;
+        subsequent calls look up the passes until either the satellite record
+        or the location changes, or the passes are exhausted, in which case
+        the search is extended to the new search end.
+
+        Satellites to be searched are first screened together, so that each
+        search is confined to those intervals in which a satellite may rise.
+        '''
         end = (
             now
             +
@@ -978,145 +1437,389 @@ class AstroSkyfield( AstroBase ):
                 start_hour_as_date_time_in_utc,
                 end_hour_as_date_time_in_utc ) )
 
-        is_twilight_function = (
-            almanac.dark_twilight_day(
-                AstroSkyfield._EPHEMERIS_PLANETS,
-                latitude_longitude_elevation ) )
+        location = (
+            latitude_longitude_elevation.latitude.degrees,
+            latitude_longitude_elevation.longitude.degrees,
+            latitude_longitude_elevation.elevation.m )
+
+        for satellite in list( AstroSkyfield._satellite_passes.keys() ):
+            if satellite not in satellites or satellite not in satellite_data:
+                del AstroSkyfield._satellite_passes[ satellite ]
 
+        # Satellites to be searched, with the passes found so far (None if
+        # the search is from scratch).
+        satellite_records_stale = { }
         for satellite in satellites:
             if satellite in satellite_data:
-                key = ( AstroBase.BodyType.SATELLITE, satellite )
-                earth_satellite = (
-                    EarthSatellite.from_satrec(
-                        satellite_data[ satellite ].get_satellite_record(),
-                        timescale ) )
-
-                for start_date_time, end_date_time in windows:
-                    found_pass = (
-                        AstroSkyfield._calculate_satellite(
-                            timescale.from_datetime( start_date_time ),
-                            timescale.from_datetime( end_date_time ),
-                            timescale,
-                            latitude_longitude_elevation,
-                            data,
-                            key,
-                            earth_satellite,
-                            is_twilight_function ) )
+                satellite_record = (
+                    satellite_data[ satellite ].get_satellite_record() )
+
+                epoch = (
+                    satellite_record.jdsatepoch, satellite_record.jdsatepochF )
+
+                passes = AstroSkyfield._satellite_passes.get( satellite )
+                if passes is None or passes[ 0 ] != epoch or passes[ 1 ] != location:
+                    satellite_records_stale[ satellite ] = ( satellite_record, None )
+
+                else:
+                    # Passes beyond the end of the previous search are unknown.
+                    is_exhausted = (
+                        AstroBase.get_satellite_pass( passes[ 3 ], windows ) is None
+                        and
+                        passes[ 2 ] < end.utc_datetime() )
+
+                    if is_exhausted:
+                        satellite_records_stale[ satellite ] = (
+                            satellite_record, passes )
+
+        # Screen all stale satellites together so that only those intervals
+        # in which a satellite may rise are searched.
+        search_intervals = (
+            AstroBase.get_satellite_search_intervals(
+                {
+                    satellite : satellite_record
+                    for satellite, ( satellite_record, passes )
+                    in satellite_records_stale.items() },
+                now.utc_datetime(),
+                end.utc_datetime(),
+                *location,
+                AstroSkyfield._SATELLITE_ALTITUDE_DEGREES ) )
 
-                    if found_pass:
-                        break
+        # For each stale satellite:
+        #   ( earth satellite, previous passes, rise/set date/times, search end )
+        satellite_searches = { }
+        for satellite, ( satellite_record, passes ) in satellite_records_stale.items():
+            if passes is None:
+                search_start = now.utc_datetime()
+                passes_previous = [ ]
+
+            else:
+                # Extend the previous search, dropping passes which have set.
+                search_start = passes[ 2 ]
+                passes_previous = [
+                    pass_
+                    for pass_ in passes[ 3 ]
+                    if pass_[ 2 ] > now.utc_datetime() ]
+
+            earth_satellite = (
+                EarthSatellite.from_satrec( satellite_record, timescale ) )
+
+            rise_set_date_times, search_end = (
+                AstroSkyfield._calculate_satellite_passes(
+                    [
+                        (
+                            timescale.from_datetime( max( start_date_time, search_start ) ),
+                            timescale.from_datetime( end_date_time ) )
+                        for start_date_time, end_date_time
+                        in search_intervals.get( satellite, [ ] )
+                        if end_date_time > search_start ],
+                    end.utc_datetime(),
+                    latitude_longitude_elevation,
+                    earth_satellite ) )
+
+            satellite_searches[ satellite ] = (
+                earth_satellite, passes_previous, rise_set_date_times, search_end )
+
+        # Determine visibility for the passes of all satellites at once.
+        passes_visible = (
+            AstroSkyfield._are_satellite_passes_visible(
+                timescale,
+                [
+                    ( earth_satellite, rise_set_date_times )
+                    for earth_satellite, passes_previous, rise_set_date_times, search_end
+                    in satellite_searches.values() ],
+                is_twilight_function ) )
+
+        z = zip( satellite_searches.items(), passes_visible )
+        for ( satellite, satellite_search ), pass_is_visible in z:
+            earth_satellite, passes_previous, rise_set_date_times, search_end = (
+                satellite_search )
+
+            AstroSkyfield._satellite_passes[ satellite ] = (
+                (
+                    earth_satellite.model.jdsatepoch,
+                    earth_satellite.model.jdsatepochF ),
+                location,
+                search_end,
+                passes_previous
+                +
+                AstroSkyfield._get_satellite_passes(
+                    timescale,
+                    rise_set_date_times,
+                    pass_is_visible,
+                    latitude_longitude_elevation,
+                    earth_satellite ) )
+
+        for satellite in satellites:
+            if satellite in AstroSkyfield._satellite_passes:
+                satellite_pass = (
+                    AstroBase.get_satellite_pass(
+                        AstroSkyfield._satellite_passes[ satellite ][ 3 ],
+                        windows ) )
+
+                if satellite_pass is not None:
+                    key = ( AstroBase.BodyType.SATELLITE, satellite )
+                    body_data = AstroBase.get_body_data( data, key )
+                    (
+                        body_data.rise_date_time,
+                        body_data.rise_azimuth,
+                        body_data.set_date_time,
+                        body_data.set_azimuth,
+                        visible ) = satellite_pass
 
 
     @staticmethod
-    def _calculate_satellite(
-        start_date_time,
-        end_date_time,
-        timescale,
+    def _calculate_satellite_passes(
+        search_intervals,
+        search_end,
         latitude_longitude_elevation,
-        data,
-        key,
-        earth_satellite,
-        is_twilight_function ):
+        earth_satellite ):
+        '''
+        Find all passes of the satellite within the search intervals, a list
+        of ( start date/time, end date/time ) in chronological order ending no
+        later than the search end (date/time in UTC).
 
-        found_pass = False
-        rise_date_time = None
+        Returns a tuple of
+            A list of ( rise date/time, set date/time ).
 
-        # Culminate may occur more than once, so collect them all.
-        culmination_date_times = [ ]
+            The date/time (UTC) from which any subsequent search must start;
+            the search end unless a pass is underway at the search end.
+        '''
+        rise_set_date_times = [ ]
+        for start_date_time, end_date_time in search_intervals:
+            rise_date_time = None
 
-        date_times, events = (
-            earth_satellite.find_events(
-                latitude_longitude_elevation,
-                start_date_time,
-                end_date_time,
-                altitude_degrees = 20.0 ) )
-
-        for date_time, event in zip( date_times, events ):
-            if event == 0: # Satellite rose above altitude_degrees.
-                rise_date_time = date_time
-
-            elif event == 1: # Satellite culminated and started to descend.
-                culmination_date_times.append( date_time )
-
-            else: # Satellite fell below altitude_degrees.
-                have_rise_and_culminations = (
-                    rise_date_time is not None and culmination_date_times )
-
-                if have_rise_and_culminations:
-                    pass_is_visible = (
-                        AstroSkyfield._is_satellite_pass_visible(
-                            timescale,
-                            rise_date_time,
-                            date_time,
-                            is_twilight_function,
-                            earth_satellite ) )
+            # Culminate may occur more than once, so collect them all.
+            culmination_date_times = [ ]
 
-                    if pass_is_visible:
-                        data[ key + ( AstroBase.DATA_TAG_RISE_DATE_TIME, ) ] = (
-                            rise_date_time.utc_datetime() )
+            date_times, events = (
+                earth_satellite.find_events(
+                    latitude_longitude_elevation,
+                    start_date_time,
+                    end_date_time,
+                    altitude_degrees = AstroSkyfield._SATELLITE_ALTITUDE_DEGREES ) )
 
-                        alt, az, earth_satellite_distance = ( earth_satellite - latitude_longitude_elevation ).at( rise_date_time ).altaz()  #TODO Too long
+            for date_time, event in zip( date_times, events ):
+                if event == 0: # Satellite rose above altitude_degrees.
+                    rise_date_time = date_time
 
-                        data[ key + ( AstroBase.DATA_TAG_RISE_AZIMUTH, ) ] = (
-                            str( az.radians ) )
+                elif event == 1: # Satellite culminated and started to descend.
+                    culmination_date_times.append( date_time )
 
-                        data[ key + ( AstroBase.DATA_TAG_SET_DATE_TIME, ) ] = (
-                            date_time.utc_datetime() )
+                else: # Satellite fell below altitude_degrees.
+                    have_rise_and_culminations = (
+                        rise_date_time is not None and culmination_date_times )
 
-                        alt, az, earth_satellite_distance = ( earth_satellite - latitude_longitude_elevation ).at( date_time ).altaz()  #TODO Too long
-                        data[ key + ( AstroBase.DATA_TAG_SET_AZIMUTH, ) ] = (
-                            str( az.radians ) )
+                    if have_rise_and_culminations:
+                        rise_set_date_times.append( ( rise_date_time, date_time ) )
 
-                        found_pass = True
-                        break
+                    rise_date_time = None
+                    culmination_date_times = [ ]
 
-                rise_date_time = None
-                culmination_date_times = [ ]
+            if rise_date_time is not None:
+                # The satellite is still up at the end of the search, so
+                # search this interval again when extending the search.
+                search_end = start_date_time.utc_datetime()
 
-        return found_pass
+        return rise_set_date_times, search_end
 
 
     @staticmethod
-    def _is_satellite_pass_visible(
+    def _get_satellite_passes(
         timescale,
-        start_date_time,
-        end_date_time,
-        is_twilight_function,
+        rise_set_date_times,
+        pass_is_visible,
+        latitude_longitude_elevation,
         earth_satellite ):
+        '''
+        Returns a list of
+            ( rise date/time, rise azimuth, set date/time, set azimuth, visible )
+        where the azimuths are None for a pass which is not visible.
+        '''
+        passes = [
+            ( rise_date_time.utc_datetime(), None, set_date_time.utc_datetime(), None, False )
+            for rise_date_time, set_date_time in rise_set_date_times ]
+
+        indices_visible = [
+            i
+            for i, is_visible in enumerate( pass_is_visible )
+            if is_visible ]
+
+        if indices_visible:
+            # Compute the rise and set azimuths of all visible passes at once.
+            date_times = [
+                date_time
+                for i in indices_visible
+                for date_time in rise_set_date_times[ i ] ]
+
+            date_times = (
+                timescale.tt_jd(
+                    [ date_time.whole for date_time in date_times ],
+                    [ date_time.tt_fraction for date_time in date_times ] ) )
+
+            alt, az, earth_satellite_distance = (
+                ( earth_satellite - latitude_longitude_elevation ).at(
+                    date_times ).altaz() )
+
+            azimuths = az.radians
+            for j, i in enumerate( indices_visible ):
+                rise_date_time, rise_azimuth, set_date_time, set_azimuth, visible = (
+                    passes[ i ] )
+
+                passes[ i ] = (
+                    rise_date_time,
+                    float( azimuths[ 2 * j ] ),
+                    set_date_time,
+                    float( azimuths[ 2 * j + 1 ] ),
+                    True )
+
+        return passes
+
 
-        seconds_from_rise_to_set = ( end_date_time.utc_datetime() - start_date_time.utc_datetime() ).total_seconds() #TODO Too long
-        range_start = math.ceil( start_date_time.utc.second )
-        range_end = (
-            math.ceil(
-                start_date_time.utc.second + seconds_from_rise_to_set ) )
+    @staticmethod
+    def _are_satellite_passes_visible(
+        timescale,
+        satellite_rise_set_date_times,
+        is_twilight_function ):
+        '''
+        A pass is visible if at some point the satellite is sunlit while the
+        observer is in astronomical or nautical twilight.
 
-        # Set a step interval of 60 seconds.
-        range_step = max( math.ceil( seconds_from_rise_to_set / 60.0 ), 1.0 )
+        Each pass is sampled at about sixty points from rise to set.  The
+        samples for all passes of all satellites are placed into a single
+        time array, so that twilight is evaluated once.  Those samples in
+        twilight are then checked, again in a single evaluation, for the
+        satellite being sunlit.
 
-        transit_range = (
-            timescale.utc(
-                start_date_time.utc.year,
-                start_date_time.utc.month,
-                start_date_time.utc.day,
-                start_date_time.utc.hour,
-                start_date_time.utc.minute,
-                range( range_start, range_end, range_step ) ) )
-
-        # almanac.TWILIGHTS[ 1 ], Astronomical twilight
-        is_twilight_astronomical = is_twilight_function( transit_range ) == 1
-
-        # almanac.TWILIGHTS[ 2 ], Nautical twilight
-        is_twilight_nautical = is_twilight_function( transit_range ) == 2
-
-        is_sunlit = (
-            earth_satellite.at( transit_range ).is_sunlit(
-                AstroSkyfield._EPHEMERIS_PLANETS ) )
-
-        is_visible = False
-        z = zip( is_twilight_astronomical, is_twilight_nautical, is_sunlit )
-        for twilight_astronomical, twilight_nautical, sunlit in z:
-            if sunlit and ( twilight_astronomical or twilight_nautical ):
-                is_visible = True
-                break
-
-        return is_visible
+        Satellite rise/set date/times is a list of
+            ( earth satellite, list of ( rise date/time, set date/time ) )
+
+        Returns a list, for each satellite, of a list of booleans, one per
+        pass, indicating visibility.
+        '''
+        years = [ ]
+        months = [ ]
+        days = [ ]
+        hours = [ ]
+        minutes = [ ]
+        seconds = [ ]
+
+        # Julian date (UTC) of each sample, split into whole and fraction,
+        # as required for propagation by sgp4.
+        julian_dates = [ ]
+        julian_date_fractions = [ ]
+
+        # The pass to which each sample belongs, along with the satellite.
+        pass_indices = [ ]
+        satellite_indices = [ ]
+
+        pass_index = 0
+        z = enumerate( satellite_rise_set_date_times )
+        for satellite_index, ( earth_satellite, rise_set_date_times ) in z:
+            for start_date_time, end_date_time in rise_set_date_times:
+                start_utc = start_date_time.utc
+                seconds_from_rise_to_set = (
+                    (
+                        end_date_time.utc_datetime()
+                        -
+                        start_date_time.utc_datetime() ).total_seconds() )
+
+                range_start = math.ceil( start_utc.second )
+                range_end = (
+                    math.ceil( start_utc.second + seconds_from_rise_to_set ) )
+
+                # Set a step interval of 60 seconds.
+                range_step = (
+                    max( math.ceil( seconds_from_rise_to_set / 60.0 ), 1 ) )
+
+                seconds_ = range( range_start, range_end, range_step )
+
+                start_of_minute = (
+                    start_date_time.utc_datetime().replace(
+                        second = 0,
+                        microsecond = 0 ) )
+
+                julian_date = (
+                    start_of_minute.timestamp() / 86400.0 + 2440587.5 )
+
+                years.extend( [ start_utc.year ] * len( seconds_ ) )
+                months.extend( [ start_utc.month ] * len( seconds_ ) )
+                days.extend( [ start_utc.day ] * len( seconds_ ) )
+                hours.extend( [ start_utc.hour ] * len( seconds_ ) )
+                minutes.extend( [ start_utc.minute ] * len( seconds_ ) )
+                seconds.extend( seconds_ )
+
+                julian_dates.extend(
+                    [ math.floor( julian_date ) ] * len( seconds_ ) )
+
+                julian_date_fractions.extend(
+                    julian_date - math.floor( julian_date ) + second / 86400.0
+                    for second in seconds_ )
+
+                pass_indices.extend( [ pass_index ] * len( seconds_ ) )
+                satellite_indices.extend( [ satellite_index ] * len( seconds_ ) )
+                pass_index += 1
+
+        passes_visible = numpy.zeros( pass_index, dtype = bool )
+        if seconds:
+            transit_range = (
+                timescale.utc( years, months, days, hours, minutes, seconds ) )
+
+            # almanac.TWILIGHTS[ 1 ], Astronomical twilight
+            # almanac.TWILIGHTS[ 2 ], Nautical twilight
+            twilight = is_twilight_function( transit_range )
+            indices = (
+                numpy.flatnonzero( ( twilight == 1 ) | ( twilight == 2 ) ) )
+
+            if len( indices ):
+                # Satellite positions in the TEME frame, in metres.
+                julian_dates = numpy.array( julian_dates )[ indices ]
+                julian_date_fractions = (
+                    numpy.array( julian_date_fractions )[ indices ] )
+
+                satellite_indices = numpy.array( satellite_indices )[ indices ]
+                positions = numpy.empty( ( len( indices ), 3 ) )
+                for satellite_index in numpy.unique( satellite_indices ):
+                    mask = satellite_indices == satellite_index
+                    earth_satellite = (
+                        satellite_rise_set_date_times[ satellite_index ][ 0 ] )
+
+                    errors, positions[ mask ], velocities = (
+                        earth_satellite.model.sgp4_array(
+                            julian_dates[ mask ],
+                            julian_date_fractions[ mask ] ) )
+
+                # Rotate to GCRS and test for the Earth's shadow, as per
+                # skyfield.positionlib.ICRF.is_sunlit().
+                transit_range = transit_range[ indices ]
+                positions = (
+                    mxv(
+                        T( TEME.rotation_at( transit_range ) ),
+                        positions.T * 1000.0 ) )
+
+                sun = (
+                    AstroSkyfield._get_ephemeris_planets()[ AstroSkyfield._SUN ]
+                    -
+                    AstroSkyfield._get_ephemeris_planets()[ AstroSkyfield._PLANET_EARTH ] )
+
+                near, far = (
+                    intersect_line_and_sphere(
+                        sun.at( transit_range ).xyz.m - positions,
+                        - positions,
+                        constants.ERAD ) )
+
+                is_sunlit = numpy.nan_to_num( far ) <= 0
+
+                # Any sample within a pass will do.
+                pass_indices = numpy.array( pass_indices )[ indices ]
+                passes_visible[ pass_indices[ is_sunlit ] ] = True
+
+        passes_visible_by_satellite = [ ]
+        i = 0
+        for earth_satellite, rise_set_date_times in satellite_rise_set_date_times:
+            passes_visible_by_satellite.append(
+                passes_visible[ i : i + len( rise_set_date_times ) ].tolist() )
+
+            i += len( rise_set_date_times )
+
+        return passes_visible_by_satellite
@@ -22,7 +22,11 @@ comets, minor planets and satellites.
 '''
 
 
+import pickle
+
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from pathlib import Path
 
 
 class DataProvider( ABC ):
@@ -31,6 +35,18 @@ class DataProvider( ABC ):
     and satellites.
     '''
 
+    # Data loaded from a file is pre-parsed and kept in a sidecar, named as
+    # the file but with the sidecar extension.  The sidecar extension sorts
+    # before the extension of the file, so the file remains the newest in the
+    # cache, and the sidecar is flushed along with the file as both share the
+    # same timestamp.
+    #
+    # The version is held in the sidecar; increment when the pre-parsed data
+    # of any data provider changes.
+    _SIDECAR_EXTENSION = ".bin"
+    _SIDECAR_VERSION = 2
+
+
     @staticmethod
     @abstractmethod
     def download(
@@ -55,3 +71,99 @@ class DataProvider( ABC ):
         Return dictionary which may be empty with optional log.
         '''
         return { }
+
+
+    @staticmethod
+    def read_sidecar(
+        filename ):
+        '''
+        Read the pre-parsed data from the sidecar of the given filename.
+
+        Returns the pre-parsed data; None if the sidecar does not exist, is of
+        a different version or cannot be read.
+        '''
+        data = None
+        try:
+            with open( DataProvider._get_sidecar( filename ), 'rb' ) as f_in:
+                version, data_ = pickle.load( f_in )
+
+            if version == DataProvider._SIDECAR_VERSION:
+                data = data_
+
+        except ( EOFError, OSError, pickle.UnpicklingError, ValueError ):
+            pass
+
+        return data
+
+
+    @staticmethod
+    def write_sidecar(
+        filename,
+        data ):
+        '''
+        Write the pre-parsed data to the sidecar of the given filename.
+
+        A failure to write is ignored as the data will simply be parsed from
+        the file when next loaded.
+        '''
+        try:
+            with open( DataProvider._get_sidecar( filename ), 'wb' ) as f_out:
+                pickle.dump( ( DataProvider._SIDECAR_VERSION, data ), f_out )
+
+        except OSError:
+            pass
+
+
+    @staticmethod
+    def _get_sidecar(
+        filename ):
+
+        return Path( filename ).with_suffix( DataProvider._SIDECAR_EXTENSION )
+
+
+class Catalogue( Mapping ):
+    '''
+    Read only dictionary of bodies, holding the fields of the bodies in columns
+    rather than holding an object per body, for catalogues of thousands of
+    bodies which are kept in memory.
+
+    Each column is a list, or an array for a numeric field, holding a field of
+    each body in the same order as the keys.  A body is created on access from
+    the fields, by the given function along with any arguments common to all
+    bodies.
+    '''
+
+    __slots__ = ( "indices", "columns", "function", "arguments" )
+
+
+    def __init__(
+        self,
+        keys,
+        columns,
+        function,
+        *arguments ):
+
+        self.indices = { key : index for index, key in enumerate( keys ) }
+        self.columns = columns
+        self.function = function
+        self.arguments = arguments
+
+
+    def __getitem__( self, key ):
+        index = self.indices[ key ]
+        return (
+            self.function(
+                *[ column[ index ] for column in self.columns ],
+                *self.arguments ) )
+
+
+    def __contains__( self, key ):
+        return key in self.indices
+
+
+    def __iter__( self ):
+        return iter( self.indices )
+
+
+    def __len__( self ):
+        return len( self.indices )
@@ -24,7 +24,10 @@ comets and minor planets.
 
 import datetime
 
-from .dataprovider import DataProvider
+from array import array
+from pathlib import Path
+
+from .dataprovider import Catalogue, DataProvider
 from .indicatorbase import IndicatorBase
 
 
@@ -108,46 +111,61 @@ class DataProviderApparentMagnitude( DataProvider ):
             "query": query,
             "variables": variables }
 
-        json_, error_network, error_timeout = (
-            IndicatorBase.get_json(
-                url,
-                data = data ) )
+        # Write each minor planet as read, rather than hold the response,
+        # which can be tens of megabytes, in memory.
+        with open( filename, 'w', encoding = "utf-8" ) as f:
+            downloaded, error_network, error_timeout = (
+                IndicatorBase.get_json_array(
+                    url,
+                    "minorplanet",
+                    lambda minor_planet: f.write(
+                        DataProviderApparentMagnitude._get_minor_planet(
+                            minor_planet ) ),
+                    data = data ) )
+
+        if not downloaded:
+            Path( filename ).unlink()
 
-        downloaded = False
-        if json_:
-            downloaded = True
-            minor_planets = json_[ "data" ][ "minorplanet" ]
-            content = ""
-            for minor_planet in minor_planets:
-                asteroid_number = minor_planet[ "ast_number" ]
-                if asteroid_number is None:
-                    continue # Not all minor planets have a number.
+        return downloaded
 
-                if minor_planet[ "designameByIdDesignationName" ] is None:
-                    continue # Not all minor planets have names.
 
-                designation_name = (
-                    minor_planet[ "designameByIdDesignationName" ][ "str_designame" ] )
+    @staticmethod
+    def _get_minor_planet(
+        minor_planet ):
+        '''
+        Return the minor planet from the JSON as a line of apparent magnitude
+        data, or an empty string if the minor planet is to be dropped.
+        '''
+        content = ""
 
-                apparent_magnitude = (
-                    str( minor_planet[ "ephemeris" ][ 0 ][ "v_mag" ] ) )
+        # Not all minor planets have a number or a name.
+        is_named = (
+            minor_planet[ "ast_number" ] is not None
+            and
+            minor_planet[ "designameByIdDesignationName" ] is not None )
 
-                content += (
-                    str( asteroid_number ) +
-                    ' ' +
-                    designation_name +
-                    ',' +
-                    apparent_magnitude +
-                    '\n' )
+        if is_named:
+            designation_name = (
+                minor_planet[ "designameByIdDesignationName" ][ "str_designame" ] )
 
-            IndicatorBase.write_text_file( filename, content )
+            apparent_magnitude = (
+                str( minor_planet[ "ephemeris" ][ 0 ][ "v_mag" ] ) )
 
-        return downloaded
+            content = (
+                str( minor_planet[ "ast_number" ] ) +
+                ' ' +
+                designation_name +
+                ',' +
+                apparent_magnitude +
+                '\n' )
+
+        return content
 
 
     @staticmethod
     def load(
-        filename ):
+        filename,
+        columnar = False ):
         '''
         Load apparent magnitude data from the given filename.
 
@@ -155,17 +173,47 @@ class DataProviderApparentMagnitude( DataProvider ):
             Key: Object/body name
             Value: ApparentMagnitude object
 
+        If columnar is True, the dictionary is a Catalogue, which is more
+        compact for thousands of bodies.
+
         Otherwise, returns an empty dictionary and may write to the log.
         '''
-        am_data = { }
-        lines = IndicatorBase.read_text_file( filename )
-        for line in lines:
-            line_ = line.strip()
-            last_comma = line_.rfind( ',' )
-            name = line_[ 0 : last_comma ]
-            apparent_magnitude = line_[ last_comma + 1 : ]
-            am = ApparentMagnitude( name, apparent_magnitude )
-            am_data[ am.get_name().upper() ] = am
+        names_and_apparent_magnitudes = (
+            DataProviderApparentMagnitude.read_sidecar( filename ) )
+
+        if names_and_apparent_magnitudes is None:
+            names_and_apparent_magnitudes = [ ]
+            lines = IndicatorBase.read_text_file( filename )
+            for line in lines:
+                line_ = line.strip()
+                last_comma = line_.rfind( ',' )
+                name = line_[ 0 : last_comma ]
+                apparent_magnitude = float( line_[ last_comma + 1 : ] )
+                names_and_apparent_magnitudes.append( ( name, apparent_magnitude ) )
+
+            DataProviderApparentMagnitude.write_sidecar(
+                filename,
+                names_and_apparent_magnitudes )
+
+        if columnar:
+            names = [ name for name, apparent_magnitude in names_and_apparent_magnitudes ]
+            am_data = (
+                Catalogue(
+                    [ name.upper() for name in names ],
+                    (
+                        names,
+                        array(
+                            'd',
+                            [
+                                apparent_magnitude
+                                for name, apparent_magnitude in names_and_apparent_magnitudes ] ) ),
+                    ApparentMagnitude ) )
+
+        else:
+            am_data = { }
+            for name, apparent_magnitude in names_and_apparent_magnitudes:
+                am = ApparentMagnitude( name, apparent_magnitude )
+                am_data[ am.get_name().upper() ] = am
 
         return am_data
 
@@ -173,13 +221,16 @@ class DataProviderApparentMagnitude( DataProvider ):
 class ApparentMagnitude():
     ''' Apparent magnitude for a comet or minor planet. '''
 
+    __slots__ = ( "name", "apparent_magnitude" )
+
+
     def __init__(
         self,
         name,
         apparent_magnitude ):
 
         self.name = name
-        self.apparent_magnitude = apparent_magnitude
+        self.apparent_magnitude = float( apparent_magnitude )
 
 
     def get_name( self ):
@@ -191,13 +242,13 @@ class ApparentMagnitude():
 
     def get_apparent_magnitude( self ):
         '''
-        Return the apparent magnitude.
+        Return the apparent magnitude as a float.
         '''
         return self.apparent_magnitude
 
 
     def __str__( self ):
-        return self.name + ',' + self.apparent_magnitude
+        return self.name + ',' + str( self.apparent_magnitude )
 
 
     def __repr__( self ):
@@ -45,20 +45,32 @@ class DataProviderGeneralPerturbation( DataProvider ):
 
     @staticmethod
     def load(
-        filename ):
+        filename,
+        numbers = None ):
         '''
         Load general perturbation data from the given filename.
 
+        If numbers (satellite catalog numbers) is given, only those satellites
+        are loaded; otherwise all satellites are loaded.
+
         Returns a dictionary:
             Key: Satellite catalog number (NORAD number)
             Value: GeneralPerturbation object
 
         Otherwise, returns an empty dictionary and may write to the log.
         '''
+        xml_fields_from_omm = DataProviderGeneralPerturbation.read_sidecar( filename )
+        if xml_fields_from_omm is None:
+            xml_fields_from_omm = list( omm.parse_xml( filename ) )
+            DataProviderGeneralPerturbation.write_sidecar(
+                filename,
+                xml_fields_from_omm )
+
         data = { }
-        for fields in omm.parse_xml( filename ):
-            gp = GeneralPerturbation( fields )
-            data[ gp.get_number() ] = gp
+        for fields in xml_fields_from_omm:
+            if numbers is None or fields[ "NORAD_CAT_ID" ] in numbers:
+                gp = GeneralPerturbation( fields )
+                data[ gp.get_number() ] = gp
 
         return data
 
@@ -66,43 +78,32 @@ class DataProviderGeneralPerturbation( DataProvider ):
 class GeneralPerturbation():
     '''Hold general perturbation for a satellite.'''
 
+    __slots__ = (
+        "xml_fields_from_omm",
+        "name",
+        "number",
+        "satellite_record",
+        "tle_line_one",
+        "tle_line_two" )
+
+
     def __init__(
         self,
         xml_fields_from_omm ):
         '''
-        Take the XML fields from the OMM data and propagate.
-
-        Unfortunately, the underlying C++ sgp, which performs the propagation,
-        has an upper limit of 339,999 for the NORAD catalog number:
-            https://github.com/brandon-rhodes/pyephem/discussions/243
-
-        Ensure propagation occurs when the NORAD catalog number exceeds 339,999:
-            Swap out the NORAD catalog number with '0' which is safe as NORAD
-            catalog numbers start from '1', perform the propagation, then swap
-            back in.
-
-        Although the resultant satellite record will contain a value of '0'
-        for the NORAD catalog number, the actual NORAD catalog number is still
-        available via get_number().
+        Take the XML fields from the OMM data; the satellite record is created
+        from the fields on demand, so that only satellites which are used are
+        propagated.
         '''
-        self.satellite_record = Satrec()
+        self.xml_fields_from_omm = xml_fields_from_omm
 
         # Satellite record does not hold the name.
         self.name = xml_fields_from_omm[ "OBJECT_NAME" ]
 
         self.number = xml_fields_from_omm[ "NORAD_CAT_ID" ]
-        if float( xml_fields_from_omm[ "NORAD_CAT_ID" ] ) > float( "339999" ):
-            xml_fields_from_omm[ "NORAD_CAT_ID" ] = '0'
-
-            # The satellite record now has a satnum = 0.
-            omm.initialize( self.satellite_record, xml_fields_from_omm )
-
-            xml_fields_from_omm[ "NORAD_CAT_ID" ] = self.number
-
-        else:
-            omm.initialize( self.satellite_record, xml_fields_from_omm )
 
         # Generate on demand.
+        self.satellite_record = None
         self.tle_line_one = None
         self.tle_line_two = None
 
@@ -123,15 +124,42 @@ class GeneralPerturbation():
 
     def get_international_designator( self ):
         '''
-        Return the international designator.
+        Return the international designator, as per the satellite record.
         '''
-        return self.satellite_record.intldesg
+        return self.xml_fields_from_omm[ "OBJECT_ID" ][ 2 : ].replace( '-', '' )
 
 
     def get_satellite_record( self ):
         '''
-        Return the satellite record.
+        Return the satellite record, created on first call.
+
+        Unfortunately, the underlying C++ sgp, which performs the propagation,
+        has an upper limit of 339,999 for the NORAD catalog number:
+            https://github.com/brandon-rhodes/pyephem/discussions/243
+
+        Ensure propagation occurs when the NORAD catalog number exceeds 339,999:
+            Swap out the NORAD catalog number with '0' which is safe as NORAD
+            catalog numbers start from '1', perform the propagation, then swap
+            back in.
+
+        Although the resultant satellite record will contain a value of '0'
+        for the NORAD catalog number, the actual NORAD catalog number is still
+        available via get_number().
         '''
+        if self.satellite_record is None:
+            self.satellite_record = Satrec()
+            xml_fields_from_omm = self.xml_fields_from_omm
+            if float( xml_fields_from_omm[ "NORAD_CAT_ID" ] ) > float( "339999" ):
+                xml_fields_from_omm[ "NORAD_CAT_ID" ] = '0'
+
+                # The satellite record now has a satnum = 0.
+                omm.initialize( self.satellite_record, xml_fields_from_omm )
+
+                xml_fields_from_omm[ "NORAD_CAT_ID" ] = self.number
+
+            else:
+                omm.initialize( self.satellite_record, xml_fields_from_omm )
+
         return self.satellite_record
 
 
@@ -150,20 +178,20 @@ class GeneralPerturbation():
             if float( self.get_number() ) > float( "339999" ):
                 # The satnum was set to '0' in the init, so safe to export.
                 self.tle_line_one, self.tle_line_two = (
-                    exporter.export_tle( self.satellite_record ) )
+                    exporter.export_tle( self.get_satellite_record() ) )
 
             elif len( self.get_number() ) > 5:
                 # https://github.com/brandon-rhodes/python-sgp4/issues/97#issuecomment-1525482029
-                self.satellite_record.satnum_str = "00000"
+                self.get_satellite_record().satnum_str = "00000"
                 self.tle_line_one, self.tle_line_two = (
-                    exporter.export_tle( self.satellite_record ) )
+                    exporter.export_tle( self.get_satellite_record() ) )
 
-                self.satellite_record.satnum_str = (
+                self.get_satellite_record().satnum_str = (
                     alpha5.to_alpha5( int( self.get_number() ) ) )
 
             else:
                 self.tle_line_one, self.tle_line_two = (
-                    exporter.export_tle( self.satellite_record ) )
+                    exporter.export_tle( self.get_satellite_record() ) )
 
         return self.tle_line_one, self.tle_line_two
 
@@ -183,4 +211,4 @@ class GeneralPerturbation():
         return (
             self.__class__ == other.__class__ and
             self.get_name() == other.get_name() and
-            self.get_satellite_record() == other.get_satellite_record() )
+            self.xml_fields_from_omm == other.xml_fields_from_omm )
@@ -25,8 +25,9 @@ orbital elements for comets and minor planets.
 import datetime
 
 from enum import auto, IntEnum
+from pathlib import Path
 
-from .dataprovider import DataProvider
+from .dataprovider import Catalogue, DataProvider
 from .indicatorbase import IndicatorBase
 
 
@@ -125,28 +126,6 @@ class DataProviderOrbitalElement( DataProvider ):
             "query": query,
             "variables": variables }
 
-        json_, error_network, error_timeout = (
-            IndicatorBase.get_json(
-                url,
-                data = data ) )
-
-        downloaded = False
-        if json_:
-            downloaded = True
-            DataProviderOrbitalElement._process_json_and_write(
-                json_,
-                orbital_element_data_type,
-                filename )
-
-        return downloaded
-
-
-    @staticmethod
-    def _process_json_and_write(
-        json_,
-        orbital_element_data_type,
-        filename ):
-
         xephem_minor_planet = (
             orbital_element_data_type
             ==
@@ -164,67 +143,81 @@ class DataProviderOrbitalElement( DataProvider ):
                     DataProviderOrbitalElement,
                     "_append_minor_planet_skyfield" ) )
 
-        minor_planets = json_[ "data" ][ "query_closest_orbelements" ]
-        content = ""
-        for minor_planet in minor_planets:
-            minor_planet_ = minor_planet[ "minorplanet" ]
+        # Write each minor planet as read, rather than hold the response,
+        # which can be tens of megabytes, in memory.
+        with open( filename, 'w', encoding = "utf-8" ) as f:
+            downloaded, error_network, error_timeout = (
+                IndicatorBase.get_json_array(
+                    url,
+                    "query_closest_orbelements",
+                    lambda minor_planet: f.write(
+                        DataProviderOrbitalElement._get_minor_planet(
+                            minor_planet,
+                            append_function ) ),
+                    data = data ) )
+
+        if not downloaded:
+            Path( filename ).unlink()
+
+        return downloaded
+
 
-            asteroid_number = minor_planet_[ "ast_number" ]
-            if asteroid_number is None:
-                continue
+    @staticmethod
+    def _get_minor_planet(
+        minor_planet,
+        append_function ):
+        '''
+        Return the minor planet from the JSON as a line of orbital element
+        data, or an empty string if the minor planet is to be dropped.
+        '''
+        content = ""
+        minor_planet_ = minor_planet[ "minorplanet" ]
 
-            if minor_planet_[ "designameByIdDesignationName" ] is None:
-                continue
+        # Not all minor planets have a number or a name.
+        is_named = (
+            minor_planet_[ "ast_number" ] is not None
+            and
+            minor_planet_[ "designameByIdDesignationName" ] is not None )
 
+        # XEphem has three formats for minor planets based on the value
+        # of the eccentricity ( < 1, == 1, > 1 )
+        #   https://xephem.github.io/XEphem/Site/help/xephem.html#mozTocId468501
+        #
+        # When the eccentricity is >= 1, the format is the same and
+        # requires date of epoch of perihelion, which does not appear
+        # to be present in the Lowell data.
+        #
+        # After checking both the Minor Planet Center's MPCORB.DAT
+        # and Lowell's astorb.dat, there are no bodies for which the
+        # eccentricity is >= 1.0.
+        #
+        # Therefore this should not be a problem of concern; however,
+        # filter out such bodies just to be safe!
+        if is_named and float( minor_planet[ 'e' ] ) < 1.0:
             designation_name = (
                 minor_planet_[ "designameByIdDesignationName" ][ "str_designame" ] )
 
-            designation = str( asteroid_number ) + ' ' + designation_name
-
-            absolute_magnitude = str( minor_planet_[ 'h' ] )
-
-            # The slope parameter is hard coded; typically does not vary
-            # much and is not used to calculate apparent magnitude.
-            slope_parameter = "0.15"
-
-            mean_anomaly_epoch = str( minor_planet[ 'm' ] )
-            argument_perihelion = str( minor_planet[ "peri" ] )
-            longitude_ascending_node = str( minor_planet[ "node" ] )
-            inclination_to_ecliptic = str( minor_planet[ 'i' ] )
-            orbital_eccentricity = str( minor_planet[ 'e' ] )
-            semimajor_axis = str( minor_planet[ 'a' ] )
-
-            # XEphem has three formats for minor planets based on the value
-            # of the eccentricity ( < 1, == 1, > 1 )
-            #   https://xephem.github.io/XEphem/Site/help/xephem.html#mozTocId468501
-            #
-            # When the eccentricity is >= 1, the format is the same and
-            # requires date of epoch of perihelion, which does not appear
-            # to be present in the Lowell data.
-            #
-            # After checking both the Minor Planet Center's MPCORB.DAT
-            # and Lowell's astorb.dat, there are no bodies for which the
-            # eccentricity is >= 1.0.
-            #
-            # Therefore this should not be a problem of concern; however,
-            # filter out such bodies just to be safe!
-            if float( orbital_eccentricity ) >= 1.0:
-                continue
-
-            content += (
+            designation = str( minor_planet_[ "ast_number" ] ) + ' ' + designation_name
+
+            # The slope parameter is not in the data, so is hard coded to the
+            # typical value of 0.15, which does not vary much between bodies.
+            # The backend uses the slope parameter, along with the absolute
+            # magnitude, to calculate the apparent magnitude when not
+            # downloaded separately.
+            content = (
                 append_function(
                     minor_planet,
                     designation,
-                    absolute_magnitude,
-                    slope_parameter,
-                    mean_anomaly_epoch,
-                    argument_perihelion,
-                    longitude_ascending_node,
-                    inclination_to_ecliptic,
-                    orbital_eccentricity,
-                    semimajor_axis ) )
+                    str( minor_planet_[ 'h' ] ), # Absolute magnitude
+                    "0.15", # Slope parameter
+                    str( minor_planet[ 'm' ] ), # Mean anomaly epoch
+                    str( minor_planet[ "peri" ] ), # Argument perihelion
+                    str( minor_planet[ "node" ] ), # Longitude ascending node
+                    str( minor_planet[ 'i' ] ), # Inclination to ecliptic
+                    str( minor_planet[ 'e' ] ), # Orbital eccentricity
+                    str( minor_planet[ 'a' ] ) ) ) # Semimajor axis
 
-        IndicatorBase.write_text_file( filename, content )
+        return content
 
 
     @staticmethod
@@ -389,7 +382,8 @@ class DataProviderOrbitalElement( DataProvider ):
     @staticmethod
     def load(
         filename,
-        orbital_element_data_type ):
+        orbital_element_data_type,
+        columnar = False ):
         '''
         Load orbital element data from the given filename.
 
@@ -397,6 +391,9 @@ class DataProviderOrbitalElement( DataProvider ):
             Key: Object/body name
             Value: OrbitalElement object
 
+        If columnar is True, the dictionary is a Catalogue, which is more
+        compact for thousands of bodies.
+
         Otherwise, returns an empty dictionary and may write to the log.
         '''
         is_skyfield_data = (
@@ -431,32 +428,49 @@ class DataProviderOrbitalElement( DataProvider ):
         #
         # When the cache becomes stale, a new download will occur, hopefully
         # successful.
-        if is_skyfield_data:
-            download_function = "_load_skyfield"
+        names_and_data = DataProviderOrbitalElement.read_sidecar( filename )
+        if names_and_data is None:
+            if is_skyfield_data:
+                parse_function = "_parse_skyfield"
+
+            else:
+                parse_function = "_parse_xephem"
+
+            names_and_data = (
+                getattr( DataProviderOrbitalElement, parse_function )(
+                    filename,
+                    orbital_element_data_type ) )
+
+            DataProviderOrbitalElement.write_sidecar( filename, names_and_data )
+
+        if columnar:
+            names = [ name for name, data in names_and_data ]
+            oe_data = (
+                Catalogue(
+                    [ name.upper() for name in names ],
+                    ( names, [ data for name, data in names_and_data ] ),
+                    OrbitalElement,
+                    orbital_element_data_type ) )
 
         else:
-            download_function = "_load_xephem"
+            oe_data = { }
+            for name, data in names_and_data:
+                oe = OrbitalElement( name, data, orbital_element_data_type )
+                oe_data[ oe.get_name().upper() ] = oe
 
-        return (
-            getattr( DataProviderOrbitalElement, download_function )(
-                filename,
-                orbital_element_data_type ) )
+        return oe_data
 
 
     @staticmethod
-    def _load_skyfield(
+    def _parse_skyfield(
         filename,
         orbital_element_data_type ):
         '''
-        Load orbital element data from the given filename.
-
-        Returns a dictionary:
-            Key: Object/body name
-            Value: OrbitalElement object
+        Parse orbital element data from the given filename.
 
-        Otherwise, returns an empty dictionary and may write to the log.
+        Returns a list of tuples ( object/body name, orbital element data ).
         '''
-        oe_data = { }
+        names_and_data = [ ]
         if orbital_element_data_type == OrbitalElement.DataType.SKYFIELD_COMET:
             # https://minorplanetcenter.net/iau/info/CometOrbitFormat.html
             name_start = 103
@@ -485,26 +499,21 @@ class DataProviderOrbitalElement( DataProvider ):
 
             if keep:
                 name = line_[ name_start - 1 : name_end - 1 + 1 ].strip()
-                oe = OrbitalElement( name, line_, orbital_element_data_type )
-                oe_data[ oe.get_name().upper() ] = oe
+                names_and_data.append( ( name, line_ ) )
 
-        return oe_data
+        return names_and_data
 
 
     @staticmethod
-    def _load_xephem(
+    def _parse_xephem(
         filename,
         orbital_element_data_type ):
         '''
-        Load orbital element data from the given filename.
+        Parse orbital element data from the given filename.
 
-        Returns a dictionary:
-            Key: Object/body name
-            Value: OrbitalElement object
-
-        Otherwise, returns an empty dictionary and may write to the log.
+        Returns a list of tuples ( object/body name, orbital element data ).
         '''
-        oe_data = { }
+        names_and_data = [ ]
         lines = IndicatorBase.read_text_file( filename )
         for line in lines:
             line_ = line.strip()
@@ -512,10 +521,9 @@ class DataProviderOrbitalElement( DataProvider ):
                 break
 
             name = line_[ : line_.find( ',' ) ].strip()
-            oe = OrbitalElement( name, line_, orbital_element_data_type )
-            oe_data[ oe.get_name().upper() ] = oe
+            names_and_data.append( ( name, line_ ) )
 
-        return oe_data
+        return names_and_data
 
 
 class OrbitalElement():
@@ -529,6 +537,9 @@ class OrbitalElement():
         XEPHEM_MINOR_PLANET = auto()
 
 
+    __slots__ = ( "name", "data", "data_type" )
+
+
     def __init__(
         self,
         name,
@@ -24,6 +24,7 @@ https://eclipse.gsfc.nasa.gov/eclipse.html
 '''
 
 
+import bisect
 import datetime
 
 from enum import auto, IntEnum
@@ -422,11 +423,14 @@ def _get_eclipse_type_from_table_value(
     return _eclipse_type
 
 
-def _get_eclipse(
-    utc_now,
+def _parse_eclipses(
     eclipses ):
-
-    eclipse_information = None
+    '''
+    Parse an eclipse table into a tuple of two lists, in chronological order:
+        date/times (UTC), used to search by date/time
+        eclipses, each a tuple as returned by get_eclipse_lunar()
+    '''
+    eclipses_parsed = [ ]
     for line in eclipses.splitlines():
         fields = line.split()
 
@@ -445,25 +449,61 @@ def _get_eclipse(
         date_time = date_time.replace( tzinfo = datetime.timezone.utc )
         date_time = date_time - datetime.timedelta( seconds = int( delta_t ) )
 
-        if utc_now <= date_time:
-            latitude = fields[ 6 ]
-            longitude = fields[ 7 ]
+        latitude = fields[ 6 ]
+        longitude = fields[ 7 ]
+
+        latitude_ = str( int( float( latitude[ : -1 ] ) ) )
+        if latitude.endswith( 'S' ):
+            latitude_ = '-' + latitude_
+
+        longitude_ = str( int( float( longitude[ : -1 ] ) ) )
+        if longitude.endswith( 'E' ):
+            longitude_ = '-' + longitude_
 
-            latitude_ = str( int( float( latitude[ : -1 ] ) ) )
-            if latitude.endswith( 'S' ):
-                latitude_ = '-' + latitude_
+        eclipses_parsed.append( (
+            date_time,
+            _get_eclipse_type_from_table_value( fields[ 5 ][ 0 ] ),
+            latitude_,
+            longitude_ ) )
 
-            longitude_ = str( int( float( longitude[ : -1 ] ) ) )
-            if longitude.endswith( 'E' ):
-                longitude_ = '-' + longitude_
+    eclipses_parsed.sort( key = lambda eclipse: eclipse[ 0 ] )
 
-            eclipse_information = (
-                date_time,
-                _get_eclipse_type_from_table_value( fields[ 5 ][ 0 ] ),
-                latitude_,
-                longitude_ )
+    return (
+        [ eclipse[ 0 ] for eclipse in eclipses_parsed ],
+        eclipses_parsed )
 
-            break
+
+# Eclipse tables parsed once, on import.
+_eclipses_lunar = _parse_eclipses( _ECLIPSES_LUNAR )
+_eclipses_solar = _parse_eclipses( _ECLIPSES_SOLAR )
+
+
+def _get_eclipses(
+    eclipses,
+    utc_start,
+    utc_end,
+    count ):
+
+    date_times, eclipses_ = eclipses
+    start = bisect.bisect_left( date_times, utc_start )
+    end = len( date_times )
+    if utc_end is not None:
+        end = bisect.bisect_left( date_times, utc_end, lo = start )
+
+    if count is not None:
+        end = min( end, start + count )
+
+    return eclipses_[ start : end ]
+
+
+def _get_eclipse(
+    utc_now,
+    eclipses ):
+
+    eclipse_information = None
+    eclipses_ = _get_eclipses( eclipses, utc_now, None, 1 )
+    if eclipses_:
+        eclipse_information = eclipses_[ 0 ]
 
     return eclipse_information
 
@@ -481,7 +521,7 @@ def get_eclipse_lunar(
 
     When no eclipse found, returns None.
     '''
-    return _get_eclipse( utc_now, _ECLIPSES_LUNAR )
+    return _get_eclipse( utc_now, _eclipses_lunar )
 
 
 def get_eclipse_solar(
@@ -497,7 +537,35 @@ def get_eclipse_solar(
 
     When no eclipse found, returns None.
     '''
-    return _get_eclipse( utc_now, _ECLIPSES_SOLAR )
+    return _get_eclipse( utc_now, _eclipses_solar )
+
+
+def get_eclipses_lunar(
+    utc_start,
+    utc_end = None,
+    count = None ):
+    '''
+    Gets the lunar eclipses at or after utc_start, optionally before utc_end
+    and optionally limited to the first count eclipses.
+
+    Returns a list, in chronological order, of tuples as for
+    get_eclipse_lunar().
+    '''
+    return _get_eclipses( _eclipses_lunar, utc_start, utc_end, count )
+
+
+def get_eclipses_solar(
+    utc_start,
+    utc_end = None,
+    count = None ):
+    '''
+    Gets the solar eclipses at or after utc_start, optionally before utc_end
+    and optionally limited to the first count eclipses.
+
+    Returns a list, in chronological order, of tuples as for
+    get_eclipse_solar().
+    '''
+    return _get_eclipses( _eclipses_solar, utc_start, utc_end, count )
 
 
 def get_eclipse_type_as_text(
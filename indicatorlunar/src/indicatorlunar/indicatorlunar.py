@@ -20,17 +20,25 @@
 ''' Application indicator for the home astronomer. '''
 
 
+import concurrent.futures
 import datetime
+import heapq
 import importlib
 import locale
 import math
+import os
 import re
 import webbrowser
 
+from bisect import bisect_left
+from itertools import islice
 from urllib.parse import urlencode
 
 import gi
 
+gi.require_version( "GLib", "2.0" )
+from gi.repository import GLib
+
 gi.require_version( "Gtk", "3.0" )
 from gi.repository import Gtk
 
@@ -72,6 +80,8 @@ class IndicatorLunar( IndicatorBase ):
     CONFIG_MAGNITUDE = "magnitude"
     CONFIG_MINOR_PLANETS = "minorPlanets"
     CONFIG_MINOR_PLANETS_ADD_NEW = "minorPlanetsAddNew"
+    CONFIG_MINOR_PLANETS_APPARENT_MAGNITUDE_FROM_ORBITAL_ELEMENT = (
+        "minorPlanetsApparentMagnitudeFromOrbitalElement" )
     CONFIG_HIDE_BODIES_BELOW_HORIZON = "hideBodiesBelowHorizon"
     CONFIG_INDICATOR_TEXT = "indicatorText"
     CONFIG_INDICATOR_TEXT_SEPARATOR = "indicatorTextSeparator"
@@ -89,6 +99,7 @@ class IndicatorLunar( IndicatorBase ):
     CONFIG_STARS = "stars"
     CONFIG_WEREWOLF_WARNING_MESSAGE = "werewolfWarningMessage"
     CONFIG_WEREWOLF_WARNING_SUMMARY = "werewolfWarningSummary"
+    CONFIG_WORKER_COUNT = "workerCount"
 
     CREDIT = sorted( [
         astro_backend.get_credit(),
@@ -109,8 +120,10 @@ class IndicatorLunar( IndicatorBase ):
 
     ICON_CACHE_BASENAME = "icon-"
 
-    # Keep icons around for an hour to allow multiple instances to run.
-    ICON_CACHE_MAXIMUM_AGE_HOURS = 1
+    # Icons are named by phase, illumination and bright limb angle and reused
+    # (and shared by multiple instances), so keep icons around for a day from
+    # when last used.
+    ICON_CACHE_MAXIMUM_AGE_HOURS = 24
 
     INDICATOR_TEXT_DEFAULT = (
         " [" +
@@ -161,6 +174,18 @@ class IndicatorLunar( IndicatorBase ):
         if astro_backend_name == astro_backend_pyephem else
         OrbitalElement.DataType.SKYFIELD_MINOR_PLANET )
 
+    # Rows are appended to the stores of the Preferences dialog in chunks when
+    # idle, so that the dialog appears without waiting on thousands of bodies.
+    PREFERENCES_STORE_CHUNK_SIZE = 250
+
+    # Rise/set date/times are specific to the backend and survive restarts.
+    RISE_SET_CACHE_FILENAME = (
+        "riseset-" + astro_backend_name.lower() + CACHE_VERSION + "cache" )
+
+    # As are almanac events (moon phases, equinox/solstice and so on).
+    ALMANAC_CACHE_FILENAME = (
+        "almanac-" + astro_backend_name.lower() + CACHE_VERSION + "cache" )
+
     SATELLITE_CACHE_BASENAME = "satellite-generalperturbation" + CACHE_VERSION
     SATELLITE_CACHE_EXTENSION = ".xml"
     SATELLITE_CACHE_MAXIMUM_AGE_HOURS = 48
@@ -215,19 +240,59 @@ class IndicatorLunar( IndicatorBase ):
             creditz = IndicatorLunar.CREDIT )
 
         # Dictionary for currently calculated astronomical data.
-        # Key: combination of three tags: body type, body name and data name.
-        # Value: a string for all data types, EXCEPT for date/time which is a
-        # Python datetime in UTC with timezone.
+        # Key: combination of two tags: body type and body name.
+        # Value: BodyData, holding floats and Python datetimes in UTC with
+        # timezone.
         self.data = None
 
         # Dictionary for previously calculated astronomical data, used for
         # satellite transits.
         self.data_previous = None
 
+        # The moon, sun and planets are calculated in the update; the stars,
+        # comets, minor planets and satellites are calculated in turn in the
+        # background, by a single worker as the backend is not to be called
+        # concurrently.  Each group once calculated is added to the data and
+        # an update requested to show the data, without calculating again.
+        self.calculation_executor = (
+            concurrent.futures.ThreadPoolExecutor( max_workers = 1 ) )
+
+        self.calculation_future = None # Background calculation in progress.
+        self.calculation_show_only = False # Update to show data only.
+        self.calculation_pending = False # Calculate once background completes.
+
+        # Upcoming events (rise/set, moon phases, equinox/solstice, eclipse) of
+        # the bodies in the data, as a heap of ( date/time, key ), the top of
+        # which gives the next update.  The heap is added to only as the events
+        # of a body change, after which the entries of the previous events of
+        # the body are stale and discarded on reaching the top.
+        # Key: combination of body type and body name;
+        # Value: date/times of the events of the body in the heap.
+        self.timeline = [ ]
+        self.timeline_events = { }
+
+        # The indicator text compiled into a list of tokens, each of which is
+        # either literal text (str), a tag (tuple of candidate pairs of body
+        # name and data tag) or free text enclosed by { } (list of literal text
+        # and tags).  Compiled afresh whenever the indicator text changes.
+        self.indicator_text_compiled = None
+        self.indicator_text_tokens = [ ]
+
+        # Key of the icon currently set: phase, illumination and bright limb
+        # angle, as used to name the icon in the cache.
+        self.icon_key = None
+
+        # Dictionaries of formatted data for display.
+        # Key: combination of data tag, data and date/time format.
+        # Value: formatted data.
+        self.format_data_cache = { }
+        self.format_data_cache_previous = { }
+
         # Key: comet designation; Value: OE object.
         self.comet_orbital_element_data = { }
 
         # Key: minor planet designation; Value AM object.
+        # Unused when computed from the orbital elements.
         self.minor_planet_apparent_magnitude_data = { }
 
         # Key: minor planet designation; Value: OE object.
@@ -236,6 +301,19 @@ class IndicatorLunar( IndicatorBase ):
         # Key: satellite number; Value: GP object.
         self.satellite_general_perturbation_data = { }
 
+        # Key: combination of body type and body name;
+        # Value: orbital element data (if any), rise date/time, set date/time.
+        # Only valid for the location (latitude, longitude, elevation) at which
+        # the rise/set date/times were computed.
+        self.rise_set_cache = { }
+        self.rise_set_cache_location = None
+        self._load_rise_set_cache()
+
+        # Key: almanac key; Value: expiry date/time, almanac events.
+        # Valid for any location.
+        self.almanac_cache = { }
+        self._load_almanac_cache()
+
         self.satellite_previous_notifications = [ ]
 
         self.last_full_moon_notfication = (
@@ -246,18 +324,42 @@ class IndicatorLunar( IndicatorBase ):
         self.icon_satellite = (
             self.get_icon_name().replace( "-symbolic", "satellite-symbolic" ) )
 
+        # Comet, minor planet and satellite data are refreshed in the
+        # background, one worker per refresh, so that a slow download or load
+        # does not block the update.
+        # Key: name of the refresh; Value: future of the refresh in progress.
+        self.update_data_executor = (
+            concurrent.futures.ThreadPoolExecutor( max_workers = 4 ) )
+
+        self.update_data_futures = { }
+
         self._flush_the_cache()
         self._initialise_download_counts_and_cache_date_times()
 
 
     def _flush_the_cache( self ):
+        # Comet and satellite data are kept beyond the maximum age so that the
+        # next download is conditional on the (stale) data being unchanged,
+        # in which case the stale data is re-stamped rather than downloaded.
         self.flush_cache(
             IndicatorLunar.COMET_CACHE_ORBITAL_ELEMENT_BASENAME,
-            IndicatorLunar.COMET_CACHE_MAXIMUM_AGE_HOURS )
+            IndicatorLunar.COMET_CACHE_MAXIMUM_AGE_HOURS * 2 )
 
-        self.flush_cache(
-            IndicatorLunar.ICON_CACHE_BASENAME,
-            IndicatorLunar.ICON_CACHE_MAXIMUM_AGE_HOURS )
+        # Icons are named without a timestamp, so are flushed by the time of
+        # last use instead.
+        icon_cache_maximum_age_date_time = (
+            datetime.datetime.now().timestamp()
+            -
+            IndicatorLunar.ICON_CACHE_MAXIMUM_AGE_HOURS * 60 * 60 )
+
+        for file_ in self.get_cache_directory().iterdir():
+            is_old_icon = (
+                file_.name.startswith( IndicatorLunar.ICON_CACHE_BASENAME )
+                and
+                file_.stat().st_mtime < icon_cache_maximum_age_date_time )
+
+            if is_old_icon:
+                file_.unlink()
 
         self.flush_cache(
             IndicatorLunar.MINOR_PLANET_CACHE_APPARENT_MAGNITUDE_BASENAME,
@@ -269,7 +371,55 @@ class IndicatorLunar( IndicatorBase ):
 
         self.flush_cache(
             IndicatorLunar.SATELLITE_CACHE_BASENAME,
-            IndicatorLunar.SATELLITE_CACHE_MAXIMUM_AGE_HOURS )
+            IndicatorLunar.SATELLITE_CACHE_MAXIMUM_AGE_HOURS * 2 )
+
+
+    def _load_rise_set_cache( self ):
+        rise_set_cache = (
+            self.read_cache_binary_without_timestamp(
+                IndicatorLunar.RISE_SET_CACHE_FILENAME ) )
+
+        if rise_set_cache is not None:
+            self.rise_set_cache_location, self.rise_set_cache = rise_set_cache
+
+
+    def _save_rise_set_cache(
+        self,
+        utc_now,
+        rise_set_cache_previous ):
+        '''
+        Drop expired rise/set date/times and if the cache has changed, write
+        to disk.
+        '''
+        IndicatorLunar.astro_backend.remove_expired_from_rise_set_cache(
+            self.rise_set_cache,
+            utc_now )
+
+        if self.rise_set_cache != rise_set_cache_previous:
+            self.write_cache_binary_without_timestamp(
+                ( self.rise_set_cache_location, self.rise_set_cache ),
+                IndicatorLunar.RISE_SET_CACHE_FILENAME )
+
+
+    def _load_almanac_cache( self ):
+        almanac_cache = (
+            self.read_cache_binary_without_timestamp(
+                IndicatorLunar.ALMANAC_CACHE_FILENAME ) )
+
+        if almanac_cache is not None:
+            self.almanac_cache = almanac_cache
+
+
+    def _save_almanac_cache(
+        self,
+        almanac_cache_previous ):
+        '''
+        If the cache has changed, write to disk.
+        '''
+        if self.almanac_cache != almanac_cache_previous:
+            self.write_cache_binary_without_timestamp(
+                self.almanac_cache,
+                IndicatorLunar.ALMANAC_CACHE_FILENAME )
 
 
     def _initialise_download_counts_and_cache_date_times( self ):
@@ -296,32 +446,20 @@ class IndicatorLunar( IndicatorBase ):
         # Update comet minor planet and satellite cached data.
         self.update_data( utc_now )
 
-        # Update backend.
-        self.data_previous = self.data
-        self.data = (
-            IndicatorLunar.astro_backend.calculate(
-                utc_now,
-                self.latitude,
-                self.longitude,
-                self.elevation,
-                self.planets,
-                self.stars,
-                self.satellites,
-                self.satellite_general_perturbation_data,
-                *self.convert_start_hour_and_end_hour_to_date_time_in_utc(
-                    self.satellite_limit_start,
-                    self.satellite_limit_end ),
-                self.comets,
-                self.comet_orbital_element_data,
-                self.minor_planets,
-                self.minor_planet_orbital_element_data,
-                self.minor_planet_apparent_magnitude_data,
-                self.magnitude,
-                self.get_logging() ) )
+        if self.calculation_show_only:
+            self.calculation_show_only = False
 
-        if self.data_previous is None:
-            # Occurs on first run or when the user alters the satellite window.
-            self.data_previous = self.data
+        elif self.calculation_future is None:
+            self._calculate( utc_now )
+
+        else:
+            # Show the data calculated so far and calculate again once the
+            # background calculation completes.
+            self.calculation_pending = True
+
+        # Keep formatted data only if formatted in this update or the last.
+        self.format_data_cache_previous = self.format_data_cache
+        self.format_data_cache = { }
 
         # Update frontend.
         if self.is_debug():
@@ -347,106 +485,326 @@ class IndicatorLunar( IndicatorBase ):
         return self._get_next_update_time_in_seconds()
 
 
-    def update_data(
+    def _calculate(
         self,
         utc_now ):
         '''
-        Download data for comets, minor planets and satellites.
-        '''
+        Calculate the moon, sun and planets, then submit the calculation of
+        the stars, comets, minor planets and satellites to the background.
 
-        # Update comet data.
-        (
+        Until a group calculated in the background is handed over, the bodies
+        of that group (which remain selected) are kept from the previous data,
+        so that the menu and label do not drop those bodies on each update.
+        '''
+        # Rise/set date/times are only valid for the given location.
+        location = ( self.latitude, self.longitude, self.elevation )
+        if location != self.rise_set_cache_location:
+            self.rise_set_cache = { }
+            self.rise_set_cache_location = location
+
+        rise_set_cache_previous = dict( self.rise_set_cache )
+        almanac_cache_previous = dict( self.almanac_cache )
+
+        calculate_arguments = (
+            utc_now,
+            self.latitude,
+            self.longitude,
+            self.elevation,
+            self.planets,
+            self.stars,
+            self.satellites,
+            self.satellite_general_perturbation_data,
+            *self.convert_start_hour_and_end_hour_to_date_time_in_utc(
+                self.satellite_limit_start,
+                self.satellite_limit_end ),
+            self.comets,
             self.comet_orbital_element_data,
-            self.download_count_comet,
-            self.next_download_time_comet ) = (
-            self._update_data(
-                utc_now,
-                self.comet_orbital_element_data,
-                IndicatorLunar.COMET_CACHE_ORBITAL_ELEMENT_BASENAME,
-                self.EXTENSION_TEXT,
-                IndicatorLunar.COMET_CACHE_MAXIMUM_AGE_HOURS,
-                self.download_count_comet,
-                self.next_download_time_comet,
-                DataProviderOrbitalElement.download,
-                (
-                    IndicatorLunar.COMET_DATA_TYPE,
-                    IndicatorLunar.astro_backend.MAGNITUDE_MAXIMUM ),
-                DataProviderOrbitalElement.load,
-                ( IndicatorLunar.COMET_DATA_TYPE, ) ) )
+            self.minor_planets,
+            self.minor_planet_orbital_element_data,
+            (
+                None # Computed by the backend from the orbital elements.
+                if self.minor_planets_apparent_magnitude_from_orbital_element else
+                self.minor_planet_apparent_magnitude_data ),
+            self.magnitude,
+            self.rise_set_cache,
+            self.almanac_cache,
+            self.get_logging() )
 
-        self.comets = (
-            self._update_bodies(
-                self.comets_add_new,
-                self.comet_orbital_element_data,
-                self.comets ) )
+        calculate_keyword_arguments = { "worker_count" : self.worker_count }
 
-        # Update minor planet data.
-        (
-            self.minor_planet_orbital_element_data,
-            self.download_count_minor_planet,
-            self.next_download_time_minor_planet ) = (
-            self._update_data(
+        # Update backend.
+        self.data_previous = self.data
+        self.data = (
+            IndicatorLunar.astro_backend.calculate(
+                *calculate_arguments,
+                **calculate_keyword_arguments,
+                body_types = (
+                    IndicatorLunar.astro_backend.BodyType.MOON,
+                    IndicatorLunar.astro_backend.BodyType.SUN,
+                    IndicatorLunar.astro_backend.BodyType.PLANET ) ) )
+
+        if self.data_previous is None:
+            # Occurs on first run or when the user alters the satellite window.
+            self.data_previous = self.data
+
+        else:
+            background_bodies = self._get_background_bodies()
+            self.data.update( {
+                key : body_data
+                for key, body_data in self.data_previous.items()
+                if key[ 0 ] in background_bodies
+                and
+                key[ 1 ] in background_bodies[ key[ 0 ] ] } )
+
+        self._update_timeline( self.data )
+
+        self.calculation_future = (
+            self.calculation_executor.submit(
+                self._calculate_in_background,
+                calculate_arguments,
+                calculate_keyword_arguments ) )
+
+        # Called from the worker thread, so hand over to the main loop.
+        self.calculation_future.add_done_callback(
+            lambda future: GLib.idle_add(
+                self._on_calculation_done,
+                future,
                 utc_now,
-                self.minor_planet_orbital_element_data,
-                IndicatorLunar.MINOR_PLANET_CACHE_ORBITAL_ELEMENT_BASENAME,
-                self.EXTENSION_TEXT,
-                IndicatorLunar.MINOR_PLANET_CACHE_MAXIMUM_AGE_HOURS,
-                self.download_count_minor_planet,
-                self.next_download_time_minor_planet,
-                DataProviderOrbitalElement.download,
-                (
-                    IndicatorLunar.MINOR_PLANET_DATA_TYPE,
-                    IndicatorLunar.astro_backend.MAGNITUDE_MAXIMUM ),
-                DataProviderOrbitalElement.load,
-                ( IndicatorLunar.MINOR_PLANET_DATA_TYPE, ) ) )
+                rise_set_cache_previous,
+                almanac_cache_previous ) )
 
-        self.minor_planets = (
-            self._update_bodies(
-                self.minor_planets_add_new,
-                self.minor_planet_orbital_element_data,
-                self.minor_planets ) )
-
-        # Update minor planet apparent magnitudes.
-        (
-            self.minor_planet_apparent_magnitude_data,
-            self.download_count_apparent_magnitude,
-            self.next_download_time_apparent_magnitude ) = (
-            self._update_data(
+
+    def _calculate_in_background(
+        self,
+        calculate_arguments,
+        calculate_keyword_arguments ):
+        '''
+        Calculate the stars, comets, minor planets and satellites, a group at a
+        time, handing each group over to the main loop once calculated.
+        '''
+        for body_type in self._get_background_bodies():
+            data = (
+                IndicatorLunar.astro_backend.calculate(
+                    *calculate_arguments,
+                    **calculate_keyword_arguments,
+                    body_types = ( body_type, ) ) )
+
+            GLib.idle_add( self._on_calculation_group_done, body_type, data )
+
+
+    def _get_background_bodies( self ):
+        '''
+        Return a dictionary, in the order calculated in the background:
+            Key: Body type
+            Value: Set of names of the bodies selected
+        '''
+        return {
+            IndicatorLunar.astro_backend.BodyType.STAR : set( self.stars ),
+            IndicatorLunar.astro_backend.BodyType.COMET : set( self.comets ),
+            IndicatorLunar.astro_backend.BodyType.MINOR_PLANET : set( self.minor_planets ),
+            IndicatorLunar.astro_backend.BodyType.SATELLITE : set( self.satellites ) }
+
+
+    def _on_calculation_group_done(
+        self,
+        body_type,
+        data ):
+        '''
+        Replace the bodies of the group, as kept from the previous data, with
+        the data of the group calculated in the background and request an
+        update to show the data.
+        '''
+        keys_previous = [ key for key in self.data if key[ 0 ] == body_type ]
+        if keys_previous or data:
+            for key in keys_previous:
+                del self.data[ key ]
+
+            self.data.update( data )
+            self._update_timeline( data )
+            self.calculation_show_only = True
+            self.request_update()
+
+        return False
+
+
+    def _on_calculation_done(
+        self,
+        future,
+        utc_now,
+        rise_set_cache_previous,
+        almanac_cache_previous ):
+        '''
+        The background calculation is complete (all groups have been handed
+        over), so the caches may be saved.  If an update came along during the
+        background calculation, request an update to calculate again.
+
+        Any error from the background calculation is logged, rather than
+        raised into the main loop.
+        '''
+        self.calculation_future = None
+        self._save_rise_set_cache( utc_now, rise_set_cache_previous )
+        self._save_almanac_cache( almanac_cache_previous )
+        self._prune_timeline()
+
+        if self.calculation_pending:
+            self.calculation_pending = False
+            self.calculation_show_only = False
+            self.request_update()
+
+        exception = future.exception()
+        if exception is not None:
+            self.get_logging().error(
+                "Error calculating in the background",
+                exc_info = exception )
+
+        return False
+
+
+    def update_data(
+        self,
+        utc_now ):
+        '''
+        Refresh data for comets, minor planets and satellites.
+
+        Each refresh runs in the background and until complete, the current
+        data remains in use.  On completion, the fresh data is swapped in on
+        the main loop and an update is requested.
+        '''
+        self._submit_update_data(
+            utc_now,
+            "comet",
+            "comet_orbital_element_data",
+            IndicatorLunar.COMET_CACHE_ORBITAL_ELEMENT_BASENAME,
+            self.EXTENSION_TEXT,
+            IndicatorLunar.COMET_CACHE_MAXIMUM_AGE_HOURS,
+            DataProviderOrbitalElement.download,
+            (
+                IndicatorLunar.COMET_DATA_TYPE,
+                IndicatorLunar.astro_backend.MAGNITUDE_MAXIMUM ),
+            DataProviderOrbitalElement.load,
+            ( IndicatorLunar.COMET_DATA_TYPE, ) )
+
+        # Minor planets can number in the thousands, so are held in a columnar
+        # catalogue, as are the apparent magnitudes.
+        self._submit_update_data(
+            utc_now,
+            "minor_planet",
+            "minor_planet_orbital_element_data",
+            IndicatorLunar.MINOR_PLANET_CACHE_ORBITAL_ELEMENT_BASENAME,
+            self.EXTENSION_TEXT,
+            IndicatorLunar.MINOR_PLANET_CACHE_MAXIMUM_AGE_HOURS,
+            DataProviderOrbitalElement.download,
+            (
+                IndicatorLunar.MINOR_PLANET_DATA_TYPE,
+                IndicatorLunar.astro_backend.MAGNITUDE_MAXIMUM ),
+            DataProviderOrbitalElement.load,
+            ( IndicatorLunar.MINOR_PLANET_DATA_TYPE, True ) )
+
+        if not self.minor_planets_apparent_magnitude_from_orbital_element:
+            self._submit_update_data(
                 utc_now,
-                self.minor_planet_apparent_magnitude_data,
+                "apparent_magnitude",
+                "minor_planet_apparent_magnitude_data",
                 IndicatorLunar.MINOR_PLANET_CACHE_APPARENT_MAGNITUDE_BASENAME,
                 self.EXTENSION_TEXT,
                 IndicatorLunar.MINOR_PLANET_CACHE_MAXIMUM_AGE_HOURS,
-                self.download_count_apparent_magnitude,
-                self.next_download_time_apparent_magnitude,
                 DataProviderApparentMagnitude.download,
                 ( False, IndicatorLunar.astro_backend.MAGNITUDE_MAXIMUM ),
                 DataProviderApparentMagnitude.load,
-                ( ) ) )
+                ( True, ) )
 
-        # Update satellite data.
-        (
-            self.satellite_general_perturbation_data,
-            self.download_count_satellite,
-            self.next_download_time_satellite ) = (
-            self._update_data(
-                utc_now,
-                self.satellite_general_perturbation_data,
-                IndicatorLunar.SATELLITE_CACHE_BASENAME,
-                IndicatorLunar.SATELLITE_CACHE_EXTENSION,
-                IndicatorLunar.SATELLITE_CACHE_MAXIMUM_AGE_HOURS,
-                self.download_count_satellite,
-                self.next_download_time_satellite,
-                DataProviderGeneralPerturbation.download,
-                ( ),
-                DataProviderGeneralPerturbation.load,
-                ( ) ) )
-
-        self.satellites = (
-            self._update_bodies(
-                self.satellites_add_new,
-                self.satellite_general_perturbation_data,
-                self.satellites ) )
+        self._submit_update_data(
+            utc_now,
+            "satellite",
+            "satellite_general_perturbation_data",
+            IndicatorLunar.SATELLITE_CACHE_BASENAME,
+            IndicatorLunar.SATELLITE_CACHE_EXTENSION,
+            IndicatorLunar.SATELLITE_CACHE_MAXIMUM_AGE_HOURS,
+            DataProviderGeneralPerturbation.download,
+            ( ),
+            DataProviderGeneralPerturbation.load,
+            ( ) )
+
+
+    def _submit_update_data(
+        self,
+        utc_now,
+        name,
+        data_attribute,
+        cache_basename,
+        cache_extension,
+        cache_maximum_age,
+        download_data_function,
+        download_data_additional_arguments,
+        load_data_function,
+        load_data_additional_arguments ):
+        '''
+        Submit a refresh of the data to the background, unless a refresh of
+        the same name is already in progress.
+
+        The name is used to form the attributes of the download count and next
+        download time; the data attribute holds the data.
+        '''
+        if name not in self.update_data_futures:
+            future = (
+                self.update_data_executor.submit(
+                    self._update_data,
+                    utc_now,
+                    getattr( self, data_attribute ),
+                    cache_basename,
+                    cache_extension,
+                    cache_maximum_age,
+                    getattr( self, "download_count_" + name ),
+                    getattr( self, "next_download_time_" + name ),
+                    download_data_function,
+                    download_data_additional_arguments,
+                    load_data_function,
+                    load_data_additional_arguments ) )
+
+            self.update_data_futures[ name ] = future
+
+            # Called from the worker thread, so hand over to the main loop.
+            future.add_done_callback(
+                lambda future_: GLib.idle_add(
+                    self._on_update_data_done,
+                    name,
+                    data_attribute,
+                    future_ ) )
+
+
+    def _on_update_data_done(
+        self,
+        name,
+        data_attribute,
+        future ):
+        '''
+        Swap in the result of a refresh of the data and if the data changed,
+        request an update.
+
+        The bodies (comets, minor planets, satellites) of the same name are
+        updated against the fresh data, but only once data has been loaded, so
+        as to not drop the bodies selected by the user beforehand.
+        '''
+        del self.update_data_futures[ name ]
+        fresh_data, download_count, next_download_time = future.result()
+        setattr( self, "download_count_" + name, download_count )
+        setattr( self, "next_download_time_" + name, next_download_time )
+
+        current_data = getattr( self, data_attribute )
+        if fresh_data is not current_data and ( fresh_data or current_data ):
+            setattr( self, data_attribute, fresh_data )
+            self.request_update()
+
+        if fresh_data and name in { "comet", "minor_planet", "satellite" }:
+            setattr(
+                self,
+                name + "s",
+                self._update_bodies(
+                    getattr( self, name + "s_add_new" ),
+                    fresh_data,
+                    getattr( self, name + "s" ) ) )
+
+        return False
 
 
     def _update_data(
@@ -556,136 +914,206 @@ class IndicatorLunar( IndicatorBase ):
         Process text containing pairs of [ ], optionally surrounded by { },
         used for display in the indicator's label.
 
-        The text may contain tags, delimited by '[' and ']' to be processed by
-        the caller.  The caller must provide a 'process tags' function,
-        taking optional arguments.
+        The text may contain tags, delimited by '[' and ']', each of which is
+        replaced by the formatted data of the body and data tag.
 
         Free text may be associated with any number of tags, all of which are
         to be enclosed with '{' and '}'.  If all tags within '{' and '}' are
         not replaced, all text (and tags) within is removed.  This ensures a
         tag which cannot be processed does not cause the text to remain.
 
-        The 'process tags' function is passed the text along with optional
-        arguments and must then return the processed text.
+        Free text which remains is followed by the separator, other than for
+        the last such free text.
+
+        Tags which cannot be replaced (there may be tags as a result of say a
+        satellite or comet dropping out) are removed.
         '''
+        if self.indicator_text != self.indicator_text_compiled:
+            self.indicator_text_tokens = (
+                IndicatorLunar._compile_indicator_text( self.indicator_text ) )
 
-        # Handle [ ].
-        # There may still be tags left in as a result of say a satellite
-        # or comet dropping out.
-        # Remaining tags are dealt with at the end.
-        processed_text = self.indicator_text
-        for key in self.data.keys():
-            tag = (
-                "[" +
-                key[ IndicatorLunar.DATA_INDEX_BODY_NAME ] +
-                " " +
-                key[ IndicatorLunar.DATA_INDEX_DATA_NAME ] +
-                "]" )
+            self.indicator_text_compiled = self.indicator_text
 
-            if tag in processed_text:
-                data = (
-                    self._format_data(
-                        key[ IndicatorLunar.DATA_INDEX_DATA_NAME ],
-                        self.data[ key ] ) )
+        processed_text = [ ]
+        last_separator_index = -1 # Allows the last separator to be removed.
+        for token in self.indicator_text_tokens:
+            if isinstance( token, str ):
+                processed_text.append( token )
 
-                processed_text = processed_text.replace( tag, data )
+            elif isinstance( token, tuple ):
+                processed_text.append( self._process_tag( token ) or "" )
+
+            else:
+                texts = [
+                    token_ if isinstance( token_, str ) else self._process_tag( token_ )
+                    for token_ in token ]
+
+                # Keep the text if not empty and all tags are replaced.
+                if None not in texts and ''.join( texts ):
+                    processed_text.append( ''.join( texts ) )
+                    last_separator_index = len( processed_text )
+                    processed_text.append( self.indicator_text_separator )
 
-        # Handle free text enclosed by { }.
-        i = 0
-        last_separator_index = -1 # Allows the last separator to be removed.
-        tag_regular_expression = r"\[[^\[\]]*\]"
-        while i < len( processed_text ):
-            if processed_text[ i ] == '{':
-                j = i + 1
-                while j < len( processed_text ):
-                    if processed_text[ j ] == '}':
-                        text = processed_text[ i + 1 : j ] # Text between braces.
-
-                        # Text between braces with outstanding tags removed.
-                        text_minus_unknown_tags = (
-                            re.sub( tag_regular_expression, "", text ) )
-
-                        # Text is not empty and no unknown tags found,
-                        # so keep this text.
-                        if len( text ) and text == text_minus_unknown_tags:
-                            processed_text = (
-                                processed_text[ 0 : i ] +
-                                processed_text[ i + 1 : j ] +
-                                self.indicator_text_separator +
-                                processed_text[ j + 1 : ] )
-
-                            last_separator_index = j - 1
-
-                        else:
-                            # Empty text or there was one or more unknown tags,
-                            # so drop the text.
-                            processed_text = (
-                                processed_text[ 0 : i ]
-                                +
-                                processed_text[ j + 1 : ] )
-
-                        i -= 1
-                        break
-
-                    j += 1
-
-            i += 1
-
-        # Remove the last separator if present.
         if last_separator_index > -1:
-            processed_text = (
-                processed_text[ 0 : last_separator_index ]
-                +
-                processed_text[
-                    last_separator_index +
-                    len( self.indicator_text_separator ) : ] )
+            del processed_text[ last_separator_index ]
 
-        # Remove remaining tags (will not have been removed because they were
-        # not contained within { }.
-        processed_text = re.sub( tag_regular_expression, "", processed_text )
-        return processed_text
+        return ''.join( processed_text )
 
 
-    def _get_next_update_time_in_seconds( self ):
-        date_times = [ ]
-        for key in self.data:
-            data_name = key[ IndicatorLunar.DATA_INDEX_DATA_NAME ]
+    def _process_tag(
+        self,
+        tag ):
+        '''
+        Return the formatted data for the first candidate pair of body name
+        and data tag of the tag for which there is data; None otherwise.
+        '''
+        for body_name, data_tag in tag:
+            for body_type in IndicatorLunar.astro_backend.BodyType:
+                body_data = self.data.get( ( body_type, body_name ) )
+                if body_data is not None:
+                    data = body_data.get( data_tag )
+                    if data is not None:
+                        return self._format_data( data_tag, data )
+
+        return None
+
+
+    @staticmethod
+    def _compile_indicator_text(
+        indicator_text ):
+        '''
+        Compile the indicator text into a list of tokens of literal text, tags
+        and free text enclosed by { }, as per _process_tags().
 
-            is_satellite = (
-                key[ IndicatorLunar.DATA_INDEX_BODY_TYPE ]
-                ==
-                IndicatorLunar.astro_backend.BodyType.SATELLITE )
+        Free text runs from a '{' to the next '}'; a '{' without a following
+        '}' is literal text.
+        '''
+        tokens = [ ]
+        i = 0
+        while i < len( indicator_text ):
+            start = indicator_text.find( '{', i )
+            end = -1 if start == -1 else indicator_text.find( '}', start + 1 )
+            if end == -1:
+                tokens += IndicatorLunar._compile_tags( indicator_text[ i : ] )
+                break
 
-            if is_satellite:
-                if data_name == IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME:
-                    date_time = self.data[ key ]
+            tokens += IndicatorLunar._compile_tags( indicator_text[ i : start ] )
+            tokens.append(
+                IndicatorLunar._compile_tags( indicator_text[ start + 1 : end ] ) )
 
-                    # Set an earlier time for the rise to ensure the rise and
-                    # set are displayed.
-                    date_time_minus_four_minutes = (
-                        date_time - datetime.timedelta( minutes = 4 ) )
+            i = end + 1
 
-                    date_times.append( date_time_minus_four_minutes )
+        return tokens
 
-                elif data_name == IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME:
-                    date_times.append( self.data[ key ] )
 
-            else:
-                is_date_time = (
-                    data_name in {
-                        IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_DATE_TIME,
-                        IndicatorLunar.astro_backend.DATA_TAG_EQUINOX,
-                        IndicatorLunar.astro_backend.DATA_TAG_FIRST_QUARTER,
-                        IndicatorLunar.astro_backend.DATA_TAG_FULL,
-                        IndicatorLunar.astro_backend.DATA_TAG_NEW,
-                        IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME,
-                        IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME,
-                        IndicatorLunar.astro_backend.DATA_TAG_SOLSTICE,
-                        IndicatorLunar.astro_backend.DATA_TAG_THIRD_QUARTER } )
+    @staticmethod
+    def _compile_tags(
+        text ):
+        '''
+        Compile the text into a list of tokens of literal text and tags.
+
+        A tag, of the form [BODY NAME DATA TAG], is compiled into a tuple of
+        each pair of body name and data tag into which the tag can be split;
+        a data tag may itself contain a space, so there may be more than one
+        pair, or none, in which case the tag is never replaced.
+        '''
+        tokens = [ ]
+        data_tags = IndicatorLunar.astro_backend.DATA_TAGS_TRANSLATIONS
+        parts = re.split( r"(\[[^\[\]]*\])", text )
+        for i, part in enumerate( parts ):
+            if i % 2 == 1:
+                tag = part[ 1 : -1 ]
+                tokens.append( tuple(
+                    ( tag[ 0 : j ], tag[ j + 1 : ] )
+                    for j, character in enumerate( tag )
+                    if character == ' ' and tag[ j + 1 : ] in data_tags ) )
+
+            elif part:
+                tokens.append( part )
+
+        return tokens
+
+
+    def _update_timeline(
+        self,
+        data ):
+        '''
+        Add to the timeline the events of each body in the data for which the
+        events have changed.
+        '''
+        for key, body_data in data.items():
+            date_times = self._get_event_date_times( key, body_data )
+            if date_times != self.timeline_events.get( key ):
+                self.timeline_events[ key ] = date_times
+                for date_time in date_times:
+                    heapq.heappush( self.timeline, ( date_time, key ) )
+
+
+    def _prune_timeline( self ):
+        '''
+        Drop from the timeline bodies no longer in the data and if the heap is
+        mostly stale entries, rebuild the heap from the events.
+        '''
+        for key in list( self.timeline_events.keys() ):
+            if key not in self.data:
+                del self.timeline_events[ key ]
 
-                if is_date_time:
-                    date_times.append( self.data[ key ] )
+        event_count = (
+            sum( len( date_times ) for date_times in self.timeline_events.values() ) )
 
+        if len( self.timeline ) > 2 * event_count:
+            self.timeline = [
+                ( date_time, key )
+                for key, date_times in self.timeline_events.items()
+                for date_time in date_times ]
+
+            heapq.heapify( self.timeline )
+
+
+    @staticmethod
+    def _get_event_date_times(
+        key,
+        body_data ):
+        '''
+        Return a tuple of the date/times of the events of the body.
+        '''
+        is_satellite = (
+            key[ IndicatorLunar.DATA_INDEX_BODY_TYPE ]
+            ==
+            IndicatorLunar.astro_backend.BodyType.SATELLITE )
+
+        if is_satellite:
+            date_times = [ ]
+            if body_data.rise_date_time is not None:
+                # Set an earlier time for the rise to ensure the rise and
+                # set are displayed.
+                date_time_minus_four_minutes = (
+                    body_data.rise_date_time - datetime.timedelta( minutes = 4 ) )
+
+                date_times.append( date_time_minus_four_minutes )
+
+            if body_data.set_date_time is not None:
+                date_times.append( body_data.set_date_time )
+
+        else:
+            date_times = [
+                date_time
+                for date_time in (
+                    body_data.eclipse_date_time,
+                    body_data.equinox,
+                    body_data.first_quarter,
+                    body_data.full,
+                    body_data.new,
+                    body_data.rise_date_time,
+                    body_data.set_date_time,
+                    body_data.solstice,
+                    body_data.third_quarter )
+                if date_time is not None ]
+
+        return tuple( date_times )
+
+
+    def _get_next_update_time_in_seconds( self ):
         utc_now = datetime.datetime.now( datetime.timezone.utc )
 
         # Ensure updates don't happen more frequently than every minute.
@@ -694,21 +1122,19 @@ class IndicatorLunar( IndicatorBase ):
         # Do an update at most twenty minutes from now; keeps the moon icon
         # and data fresh.
         next_update_time = utc_now + datetime.timedelta( minutes = 20 )
-        next_update_in_seconds = (
-            int( math.ceil( ( next_update_time - utc_now ).total_seconds() ) ) )
 
-        for date_time in sorted( date_times ):
-            if date_time > next_update_time:
-                break
-
-            if date_time > utc_now_plus_one_minute:
-                next_update_time = date_time
-                next_update_in_seconds = (
-                    int( math.ceil( ( next_update_time - utc_now ).total_seconds() ) ) )
+        # Discard stale entries and events which have passed (or are too soon).
+        while self.timeline:
+            date_time, key = self.timeline[ 0 ]
+            is_stale = date_time not in self.timeline_events.get( key, ( ) )
+            if is_stale or date_time <= utc_now_plus_one_minute:
+                heapq.heappop( self.timeline )
 
+            else:
+                next_update_time = min( next_update_time, date_time )
                 break
 
-        return next_update_in_seconds
+        return int( math.ceil( ( next_update_time - utc_now ).total_seconds() ) )
 
 
     def update_menu(
@@ -757,51 +1183,93 @@ class IndicatorLunar( IndicatorBase ):
 
         Ideally overwrite the icon with the same name each time.
         Due to a bug, the icon name must change between calls to set the icon.
-        Therefore, on each update incorporate timestamp into the filename.
+        Therefore, the filename incorporates the phase, illumination and bright
+        limb angle, and the icon is set only when any of these change.
 
         https://bugs.launchpad.net/ubuntu/+source/libappindicator/+bug/1337620
         https://askubuntu.com/q/490634/67335
         '''
-        key = (
-            IndicatorLunar.astro_backend.BodyType.MOON,
-            IndicatorLunar.astro_backend.NAME_TAG_MOON )
+        body_data = (
+            self.data[ (
+                IndicatorLunar.astro_backend.BodyType.MOON,
+                IndicatorLunar.astro_backend.NAME_TAG_MOON ) ] )
+
+        icon_key = (
+            IndicatorLunar._get_icon_key(
+                body_data.phase,
+                int( round( body_data.illumination ) ),
+                int( math.degrees( body_data.bright_limb ) ) ) )
+
+        if icon_key != self.icon_key:
+            self.set_icon( str( self._get_icon( icon_key ) ) )
+            self.icon_key = icon_key
+
+
+    @staticmethod
+    def _get_icon_key(
+        phase,
+        illumination_percentage,
+        bright_limb_angle_in_degrees ):
+        '''
+        Returns the key for the icon, being the phase, illumination and bright
+        limb angle, where those ignored by the phase are None.
+        '''
+        is_full_or_new = (
+            phase in {
+                IndicatorLunar.astro_backend.LUNAR_PHASE_FULL_MOON,
+                IndicatorLunar.astro_backend.LUNAR_PHASE_NEW_MOON } )
+
+        is_first_quarter_or_third_quarter = (
+            phase in {
+                IndicatorLunar.astro_backend.LUNAR_PHASE_FIRST_QUARTER,
+                IndicatorLunar.astro_backend.LUNAR_PHASE_THIRD_QUARTER } )
+
+        if is_full_or_new:
+            illumination_percentage = None
+            bright_limb_angle_in_degrees = None
+
+        elif is_first_quarter_or_third_quarter:
+            illumination_percentage = None
 
-        key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_PHASE, )
-        phase = self.data[ key_ ]
+        return (
+            phase,
+            illumination_percentage,
+            bright_limb_angle_in_degrees )
 
-        key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_ILLUMINATION, )
-        illumination_percentage = int( round( float( self.data[ key_ ] ) ) )
 
-        key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_BRIGHT_LIMB, )
-        bright_limb_angle_in_degrees = (
-            int( math.degrees( float( self.data[ key_ ] ) ) ) )
+    def _get_icon(
+        self,
+        icon_key ):
+        '''
+        Returns the full path to the icon for the icon key, reusing the icon in
+        the cache if present, otherwise writing the icon to the cache.
+        '''
+        filename = (
+            IndicatorLunar.ICON_CACHE_BASENAME +
+            '_'.join( str( component ) for component in icon_key ) +
+            self.EXTENSION_SVG_SYMBOLIC )
 
-        svg_icon_text = (
-            self.get_svg_icon_text(
-                phase,
-                illumination_percentage,
-                bright_limb_angle_in_degrees ) )
+        icon = self.get_cache_directory() / filename
+        if icon.exists():
+            icon.touch() # Mark as in use to avoid being flushed.
 
-        icon_path = (
-            self.write_cache_text(
-                svg_icon_text,
-                IndicatorLunar.ICON_CACHE_BASENAME,
-                self.EXTENSION_SVG_SYMBOLIC ) )
+        else:
+            self.write_cache_text_without_timestamp(
+                self.get_svg_icon_text( *icon_key ),
+                filename )
 
-        self.set_icon( str( icon_path ) )
+        return icon
 
 
     def _notification_full_moon( self ):
         utc_now = datetime.datetime.now( datetime.timezone.utc )
-        key = (
-            IndicatorLunar.astro_backend.BodyType.MOON,
-            IndicatorLunar.astro_backend.NAME_TAG_MOON )
-
-        key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_PHASE, )
-        phase = self.data[ key_ ]
+        body_data = (
+            self.data[ (
+                IndicatorLunar.astro_backend.BodyType.MOON,
+                IndicatorLunar.astro_backend.NAME_TAG_MOON ) ] )
 
-        key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_ILLUMINATION, )
-        illumination_percentage = int( round( float( self.data[ key_ ] ) ) )
+        phase = body_data.phase
+        illumination_percentage = int( round( body_data.illumination ) )
 
         is_waxing_gibbous_or_full = (
             phase in {
@@ -842,13 +1310,11 @@ class IndicatorLunar( IndicatorBase ):
 
     def _create_full_moon_icon( self ):
         return (
-            self.write_cache_text(
-                self.get_svg_icon_text(
+            self._get_icon(
+                IndicatorLunar._get_icon_key(
                     IndicatorLunar.astro_backend.LUNAR_PHASE_FULL_MOON,
                     None,
-                    None ),
-                IndicatorLunar.ICON_CACHE_BASENAME,
-                self.EXTENSION_SVG_SYMBOLIC ) )
+                    None ) ) )
 
 
     def notification_satellites( self ):
@@ -862,21 +1328,22 @@ class IndicatorLunar( IndicatorBase ):
 
         utc_now = datetime.datetime.now( datetime.timezone.utc )
         for number in self.satellites:
-            key = ( IndicatorLunar.astro_backend.BodyType.SATELLITE, number )
-            key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_AZIMUTH, )
-            if key_ in self.data and number not in self.satellite_previous_notifications:
-                # About to rise and no notification already sent.
-                rise_time = (
-                    self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ] )
+            body_data = (
+                self.data.get(
+                    ( IndicatorLunar.astro_backend.BodyType.SATELLITE, number ) ) )
+
+            if body_data is None:
+                continue
 
+            if body_data.rise_azimuth is not None and number not in self.satellite_previous_notifications:
+                # About to rise and no notification already sent.
+                rise_time = body_data.rise_date_time
                 if ( rise_time - datetime.timedelta( minutes = 2 ) ) <= utc_now: # Two minute buffer.
                     satellite_current_notifications.append( [ number, rise_time ] )
                     self.satellite_previous_notifications.append( number )
 
-            if key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) in self.data:
-                set_time = (
-                    self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) ] )
-
+            if body_data.set_date_time is not None:
+                set_time = body_data.set_date_time
                 if number in self.satellite_previous_notifications and set_time < utc_now:
                     # Notification has been sent and satellite has now set.
                     self.satellite_previous_notifications.remove( number )
@@ -894,34 +1361,31 @@ class IndicatorLunar( IndicatorBase ):
         self,
         number ):
 
-        key = ( IndicatorLunar.astro_backend.BodyType.SATELLITE, number )
+        body_data = (
+            self.data[ ( IndicatorLunar.astro_backend.BodyType.SATELLITE, number ) ] )
 
         rise_time = (
             self._format_data(
                 IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME,
-                self.data[
-                    key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ],
+                body_data.rise_date_time,
                 IndicatorLunar.DATE_TIME_FORMAT_HHcolonMM ) )
 
         rise_azimuth = (
             self._format_data(
                 IndicatorLunar.astro_backend.DATA_TAG_RISE_AZIMUTH,
-                self.data[
-                    key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_AZIMUTH, ) ],
+                body_data.rise_azimuth,
                 IndicatorLunar.DATE_TIME_FORMAT_HHcolonMM ) )
 
         set_time = (
             self._format_data(
                 IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME,
-                self.data[
-                    key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) ],
+                body_data.set_date_time,
                 IndicatorLunar.DATE_TIME_FORMAT_HHcolonMM ) )
 
         set_azimuth = (
             self._format_data(
                 IndicatorLunar.astro_backend.DATA_TAG_SET_AZIMUTH,
-                self.data[
-                    key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_AZIMUTH, ) ],
+                body_data.set_azimuth,
                 IndicatorLunar.DATE_TIME_FORMAT_HHcolonMM ) )
 
         satellite_data = (
@@ -997,16 +1461,17 @@ class IndicatorLunar( IndicatorBase ):
                 menu, _( "Moon" ) ).set_submenu( submenu )
 
             submenu.append( Gtk.SeparatorMenuItem() )
-            key = (
-                IndicatorLunar.astro_backend.BodyType.MOON,
-                IndicatorLunar.astro_backend.NAME_TAG_MOON )
+            body_data = (
+                self.data[ (
+                    IndicatorLunar.astro_backend.BodyType.MOON,
+                    IndicatorLunar.astro_backend.NAME_TAG_MOON ) ] )
 
             self.create_and_append_menuitem(
                 submenu,
                 _( "Phase: " ) +
                 self._format_data(
                     IndicatorLunar.astro_backend.DATA_TAG_PHASE,
-                    self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_PHASE, ) ] ),
+                    body_data.phase ),
                 name = IndicatorLunar.SEARCH_URL_MOON,
                 activate_functionandarguments = (
                     self.get_on_click_menuitem_open_browser_function(), ),
@@ -1022,29 +1487,30 @@ class IndicatorLunar( IndicatorBase ):
 
             # The phase (illumination) is rounded and so a given phase is
             # entered earlier than what occurs in reality.
-            next_phases = [ ]
-
-            key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_FIRST_QUARTER, )
-            next_phases.append( [ self.data[ key_ ], _( "First Quarter: " ), key_ ] )
-
-            key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_FULL, )
-            next_phases.append( [ self.data[ key_ ], _( "Full: " ), key_ ] )
-
-            key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_NEW, )
-            next_phases.append( [ self.data[ key_ ], _( "New: " ), key_ ] )
-
-            key_ = key + ( IndicatorLunar.astro_backend.DATA_TAG_THIRD_QUARTER, )
-            next_phases.append( [ self.data[ key_ ], _( "Third Quarter: " ), key_ ] )
+            next_phases = [
+                [
+                    body_data.first_quarter,
+                    _( "First Quarter: " ),
+                    IndicatorLunar.astro_backend.DATA_TAG_FIRST_QUARTER ],
+                [
+                    body_data.full,
+                    _( "Full: " ),
+                    IndicatorLunar.astro_backend.DATA_TAG_FULL ],
+                [
+                    body_data.new,
+                    _( "New: " ),
+                    IndicatorLunar.astro_backend.DATA_TAG_NEW ],
+                [
+                    body_data.third_quarter,
+                    _( "Third Quarter: " ),
+                    IndicatorLunar.astro_backend.DATA_TAG_THIRD_QUARTER ] ]
 
             # Sort phases by date.
             phases_sorted_by_date = (
                 sorted( next_phases, key = lambda pair: pair[ 0 ] ) )
 
-            for date_time, display_text, key in phases_sorted_by_date:
-                formatted_data = (
-                    self._format_data(
-                        key[ IndicatorLunar.DATA_INDEX_DATA_NAME ],
-                        self.data[ key ] ) )
+            for date_time, display_text, data_tag in phases_sorted_by_date:
+                formatted_data = self._format_data( data_tag, date_time )
 
                 label = display_text + formatted_data
 
@@ -1081,30 +1547,24 @@ class IndicatorLunar( IndicatorBase ):
                 menu, _( "Sun" ) ).set_submenu( submenu )
 
             submenu.append( Gtk.SeparatorMenuItem() )
-            key = (
-                IndicatorLunar.astro_backend.BodyType.SUN,
-                IndicatorLunar.astro_backend.NAME_TAG_SUN )
+            body_data = (
+                self.data[ (
+                    IndicatorLunar.astro_backend.BodyType.SUN,
+                    IndicatorLunar.astro_backend.NAME_TAG_SUN ) ] )
 
             equinox_label = (
                 _( "Equinox: " ) +
                 self._format_data(
                     IndicatorLunar.astro_backend.DATA_TAG_EQUINOX,
-                    self.data[
-                        key +
-                        ( IndicatorLunar.astro_backend.DATA_TAG_EQUINOX, ) ] ) )
+                    body_data.equinox ) )
 
             solstice_label = (
                 _( "Solstice: " ) +
                 self._format_data(
                     IndicatorLunar.astro_backend.DATA_TAG_SOLSTICE,
-                    self.data[
-                        key +
-                        ( IndicatorLunar.astro_backend.DATA_TAG_SOLSTICE, ) ] ) )
+                    body_data.solstice ) )
 
-            equinox_before_solsitce = (
-                self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_EQUINOX, ) ]
-                <
-                self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_SOLSTICE, ) ] )
+            equinox_before_solsitce = body_data.equinox < body_data.solstice
 
             if equinox_before_solsitce:
                 self.create_and_append_menuitem(
@@ -1155,7 +1615,7 @@ class IndicatorLunar( IndicatorBase ):
         url ):
 
         menu.append( Gtk.SeparatorMenuItem() )
-        key = ( body_type, name_tag )
+        body_data = self.data[ ( body_type, name_tag ) ]
 
         self.create_and_append_menuitem(
             menu,
@@ -1170,9 +1630,7 @@ class IndicatorLunar( IndicatorBase ):
             _( "Date/Time: " ) +
             self._format_data(
                 IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_DATE_TIME,
-                self.data[
-                    key +
-                    ( IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_DATE_TIME, ) ] ),
+                body_data.eclipse_date_time ),
             name = url,
             activate_functionandarguments = (
                 self.get_on_click_menuitem_open_browser_function(), ),
@@ -1183,9 +1641,7 @@ class IndicatorLunar( IndicatorBase ):
             _( "Type: " ) +
             self._format_data(
                 IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_TYPE,
-                self.data[
-                    key +
-                    ( IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_TYPE, ) ] ),
+                body_data.eclipse_type ),
             name = url,
             activate_functionandarguments = (
                 self.get_on_click_menuitem_open_browser_function(), ),
@@ -1196,20 +1652,16 @@ class IndicatorLunar( IndicatorBase ):
         # For lunar eclipses, Skyfield implements its own function,
         # which does not provide latitude/longitude.
         # For solar eclipses, Skyfield uses the same NASA Eclipse data.
-        if key + ( IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_LATITUDE, ) in self.data:
+        if body_data.eclipse_latitude is not None:
             latitude = (
                 self._format_data(
                     IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_LATITUDE,
-                    self.data[
-                        key +
-                        ( IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_LATITUDE, ) ] ) )
+                    body_data.eclipse_latitude ) )
 
             longitude = (
                 self._format_data(
                     IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_LONGITUDE,
-                    self.data[
-                        key +
-                        ( IndicatorLunar.astro_backend.DATA_TAG_ECLIPSE_LONGITUDE, ) ] ) )
+                    body_data.eclipse_longitude ) )
 
             self.create_and_append_menuitem(
                 menu,
@@ -1462,12 +1914,10 @@ class IndicatorLunar( IndicatorBase ):
         rise/set/azimuth/altitude.
         '''
         key = ( body_type, name_tag )
+        body_data = self.data.get( key, IndicatorLunar.astro_backend.BodyData() )
         appended = False
-        if key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) in self.data:
-            body_will_rise = (
-                self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ]
-                <
-                self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) ] )
+        if body_data.rise_date_time is not None:
+            body_will_rise = body_data.rise_date_time < body_data.set_date_time
 
             if body_will_rise:
                 if not self.hide_bodies_below_horizon:
@@ -1490,24 +1940,14 @@ class IndicatorLunar( IndicatorBase ):
                             IndicatorLunar.astro_backend.BodyType.PLANET,
                             IndicatorLunar.astro_backend.BodyType.STAR } )
 
-                    key_sun = (
-                        IndicatorLunar.astro_backend.BodyType.SUN,
-                        IndicatorLunar.astro_backend.NAME_TAG_SUN )
-
-                    sun_rise = (
-                        self.data[
-                            key_sun +
-                            ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ] )
+                    body_data_sun = (
+                        self.data[ (
+                            IndicatorLunar.astro_backend.BodyType.SUN,
+                            IndicatorLunar.astro_backend.NAME_TAG_SUN ) ] )
 
-                    sun_set = (
-                        self.data[
-                            key_sun +
-                            ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) ] )
-
-                    body_set_date_time = (
-                        self.data[
-                            key +
-                            ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) ] )
+                    sun_rise = body_data_sun.rise_date_time
+                    sun_set = body_data_sun.set_date_time
+                    body_set_date_time = body_data.set_date_time
 
                     if target_body_type and body_set_date_time < sun_set < sun_rise:
                         if not self.hide_bodies_below_horizon:
@@ -1543,7 +1983,7 @@ class IndicatorLunar( IndicatorBase ):
 
                     appended = True
 
-        elif key + ( IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH, ) in self.data:
+        elif body_data.azimuth is not None:
             # Body is 'always up'.
             self._update_menuitems_rise_azimuth_altitude_set(
                 menu,
@@ -1577,13 +2017,14 @@ class IndicatorLunar( IndicatorBase ):
         else:
             indent = ( 2, 1 )
 
+        body_data = self.data[ key ]
         if is_rise:
             self.create_and_append_menuitem(
                 menu,
                 _( "Rise: " ) +
                 self._format_data(
                     IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME,
-                    self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ] ),
+                    body_data.rise_date_time ),
                 name = menuitem_name,
                 activate_functionandarguments = on_click_function_and_arguments,
                 indent = indent )
@@ -1594,7 +2035,7 @@ class IndicatorLunar( IndicatorBase ):
                 _( "Azimuth: " ) +
                 self._format_data(
                     IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH,
-                    self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH, ) ] ),
+                    body_data.azimuth ),
                 name = menuitem_name,
                 activate_functionandarguments = on_click_function_and_arguments,
                 indent = indent )
@@ -1604,7 +2045,7 @@ class IndicatorLunar( IndicatorBase ):
                 _( "Altitude: " ) +
                 self._format_data(
                     IndicatorLunar.astro_backend.DATA_TAG_ALTITUDE,
-                    self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_ALTITUDE, ) ] ),
+                    body_data.altitude ),
                 name = menuitem_name,
                 activate_functionandarguments = on_click_function_and_arguments,
                 indent = indent )
@@ -1615,7 +2056,7 @@ class IndicatorLunar( IndicatorBase ):
                     _( "Set: " ) +
                     self._format_data(
                         IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME,
-                        self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) ] ),
+                        body_data.set_date_time ),
                     name = menuitem_name,
                     activate_functionandarguments = on_click_function_and_arguments,
                 indent = indent )
@@ -1659,64 +2100,60 @@ class IndicatorLunar( IndicatorBase ):
         satellites_polar = [ ]
         utc_now_plus_five_minutes = utc_now + datetime.timedelta( minutes = 5 )
 
+        no_body_data = IndicatorLunar.astro_backend.BodyData()
         for number in self.satellites:
             key = ( IndicatorLunar.astro_backend.BodyType.SATELLITE, number )
-            if key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) in self.data:
+            body_data = self.data.get( key, no_body_data )
+            if body_data.rise_date_time is not None:
                 satellite_will_rise_within_next_five_minutes = (
-                    self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ]
-                    <
-                    utc_now_plus_five_minutes )
+                    body_data.rise_date_time < utc_now_plus_five_minutes )
 
                 if satellite_will_rise_within_next_five_minutes:
                     satellites.append( [
                         number,
                         self.satellite_general_perturbation_data[ number ].get_name(),
-                        self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ],
-                        self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_AZIMUTH, ) ],
-                        self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) ],
-                        self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_AZIMUTH, ) ] ] )
+                        body_data.rise_date_time,
+                        body_data.rise_azimuth,
+                        body_data.set_date_time,
+                        body_data.set_azimuth ] )
 
                 else:
                     # Satellite will rise more than five minutes from now;
                     # look at previous transit.
-                    rise_date_time_in_previous_data = (
-                        key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, )
-                        in
-                        self.data_previous )
-
-                    if rise_date_time_in_previous_data:
+                    body_data_previous = self.data_previous.get( key, no_body_data )
+                    if body_data_previous.rise_date_time is not None:
                         in_transit = (
-                            self.data_previous[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ] < utc_now_plus_five_minutes and \
-                            self.data_previous[ key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) ] > utc_now )
+                            body_data_previous.rise_date_time < utc_now_plus_five_minutes and \
+                            body_data_previous.set_date_time > utc_now )
 
                         if in_transit:
                             satellites.append( [
                                 number,
                                 self.satellite_general_perturbation_data[ number ].get_name(),
-                                self.data_previous[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ],
-                                self.data_previous[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_AZIMUTH, ) ],
-                                self.data_previous[ key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_DATE_TIME, ) ],
-                                self.data_previous[ key + ( IndicatorLunar.astro_backend.DATA_TAG_SET_AZIMUTH, ) ] ] )
+                                body_data_previous.rise_date_time,
+                                body_data_previous.rise_azimuth,
+                                body_data_previous.set_date_time,
+                                body_data_previous.set_azimuth ] )
 
                         else: # Previous transit is complete (and too far back in the past to be applicable), so show next pass.
                             satellites.append( [
                                 number,
                                 self.satellite_general_perturbation_data[ number ].get_name(),
-                                self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ] ] )
+                                body_data.rise_date_time ] )
 
                     else: # No previous transit, show next pass.
                         satellites.append( [
                             number,
                             self.satellite_general_perturbation_data[ number ].get_name(),
-                            self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_RISE_DATE_TIME, ) ] ] )
+                            body_data.rise_date_time ] )
 
-            elif key + ( IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH, ) in self.data:
+            elif body_data.azimuth is not None:
                 # Satellite is polar (always up).
                 satellites_polar.append( [
                     number,
                     self.satellite_general_perturbation_data[ number ].get_name(),
-                    self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH, ) ],
-                    self.data[ key + ( IndicatorLunar.astro_backend.DATA_TAG_ALTITUDE, ) ] ] )
+                    body_data.azimuth,
+                    body_data.altitude ] )
 
         if satellites:
             if self.satellites_sort_by_date_time:
@@ -1902,6 +2339,35 @@ class IndicatorLunar( IndicatorBase ):
         data_tag,
         data,
         date_time_format = None ):
+        '''
+        Format the data for display.
+
+        The same data is formatted for the label, menu and notifications, and
+        much of the data, such as rise/set date/times, is unchanged from one
+        update to the next, so the formatted data is cached.
+        '''
+        key = ( data_tag, data, date_time_format )
+        if key in self.format_data_cache:
+            display_data = self.format_data_cache[ key ]
+
+        elif key in self.format_data_cache_previous:
+            display_data = self.format_data_cache_previous[ key ]
+            self.format_data_cache[ key ] = display_data
+
+        else:
+            display_data = (
+                self._format_data_uncached( data_tag, data, date_time_format ) )
+
+            self.format_data_cache[ key ] = display_data
+
+        return display_data
+
+
+    def _format_data_uncached(
+        self,
+        data_tag,
+        data,
+        date_time_format ):
 
         display_data = ""
 
@@ -1925,10 +2391,10 @@ class IndicatorLunar( IndicatorBase ):
                 IndicatorLunar.astro_backend.DATA_TAG_THIRD_QUARTER } )
 
         if is_altitude_or_azimuth:
-            display_data = str( round( math.degrees( float( data ) ) ) ) + "°"
+            display_data = str( round( math.degrees( data ) ) ) + "°"
 
         elif data_tag == IndicatorLunar.astro_backend.DATA_TAG_BRIGHT_LIMB:
-            display_data = str( int( float( data ) ) ) + "°"
+            display_data = str( int( data ) ) + "°"
 
         elif is_date_time:
             if date_time_format is None:
@@ -1961,7 +2427,7 @@ class IndicatorLunar( IndicatorBase ):
             display_data = eclipse.get_eclipse_type_as_text( data )
 
         elif data_tag == IndicatorLunar.astro_backend.DATA_TAG_ILLUMINATION:
-            display_data = data + "%"
+            display_data = str( data ) + "%"
 
         elif data_tag == IndicatorLunar.astro_backend.DATA_TAG_PHASE:
             display_data = (
@@ -2159,16 +2625,30 @@ class IndicatorLunar( IndicatorBase ):
         column_view_tag = 0
         column_view_value = 1
 
-        # Tag, translated tag, value.
-        display_tags_store = Gtk.ListStore( str, str, str )
-        self._initialise_display_tags_store( display_tags_store )
+        # Original tag, translated tag, data tag, data.
+        display_tags = self._get_display_tags()
+
+        tags_original_to_translated = { }
+        tags_translated_to_original = { }
+        for tag, translated_tag, data_tag, data in display_tags:
+            tags_original_to_translated[ tag ] = translated_tag
+            tags_translated_to_original[ translated_tag ] = tag
 
         indicator_text.set_text(
             self._translate_text_using_tags(
-                display_tags_store,
-                True,
+                tags_original_to_translated,
                 self.indicator_text ) ) # Translate tags into local language.
 
+        # Tag, translated tag, value.
+        # Values are formatted only as rows are appended.
+        display_tags_store = Gtk.ListStore( str, str, str )
+        self._fill_store_on_idle(
+            dialog,
+            display_tags_store,
+            (
+                [ tag, translated_tag, self._format_data( data_tag, data ) ]
+                for tag, translated_tag, data_tag, data in display_tags ) )
+
         treeview, scrolledwindow = (
             self.create_treeview_within_scrolledwindow(
                 display_tags_store,
@@ -2253,6 +2733,22 @@ class IndicatorLunar( IndicatorBase ):
 
         grid.attach( minor_planets_add_new_checkbutton, 0, 3, 1, 1 )
 
+        minor_planets_apparent_magnitude_from_orbital_element_checkbutton = (
+            self.create_checkbutton(
+                _( "Calculate minor planet magnitudes" ),
+                tooltip_text = _(
+                    "If checked, the apparent magnitude\n" +
+                    "of each minor planet is calculated\n" +
+                    "from the orbital elements.\n\n" +
+                    "Otherwise, apparent magnitudes\n" +
+                    "are downloaded daily from Lowell." ),
+                margin_top = self.INDENT_WIDGET_TOP / 2,
+                active = self.minor_planets_apparent_magnitude_from_orbital_element ) )
+
+        grid.attach(
+            minor_planets_apparent_magnitude_from_orbital_element_checkbutton,
+            0, 4, 1, 1 )
+
         comets_add_new_checkbutton = (
             self.create_checkbutton(
                 _( "Add new comets" ),
@@ -2260,7 +2756,7 @@ class IndicatorLunar( IndicatorBase ):
                 margin_top = self.INDENT_WIDGET_TOP / 2,
                 active = self.comets_add_new ) )
 
-        grid.attach( comets_add_new_checkbutton, 0, 4, 1, 1 )
+        grid.attach( comets_add_new_checkbutton, 0, 5, 1, 1 )
 
         satellites_add_new_checkbox = (
             self.create_checkbutton(
@@ -2269,7 +2765,7 @@ class IndicatorLunar( IndicatorBase ):
                 margin_top = self.INDENT_WIDGET_TOP / 2,
                 active = self.satellites_add_new ) )
 
-        grid.attach( satellites_add_new_checkbox, 0, 5, 1, 1 )
+        grid.attach( satellites_add_new_checkbox, 0, 6, 1, 1 )
 
         sort_satellites_by_date_time_checkbutton = (
             self.create_checkbutton(
@@ -2282,7 +2778,7 @@ class IndicatorLunar( IndicatorBase ):
                 margin_top = self.INDENT_WIDGET_TOP / 2,
                 active = self.satellites_sort_by_date_time ) )
 
-        grid.attach( sort_satellites_by_date_time_checkbutton, 0, 6, 1, 1 )
+        grid.attach( sort_satellites_by_date_time_checkbutton, 0, 7, 1, 1 )
 
         spinner_satellite_limit_start = (
             self.create_spinbutton(
@@ -2319,7 +2815,41 @@ class IndicatorLunar( IndicatorBase ):
                         False ) ),
                 margin_top = self.INDENT_WIDGET_TOP / 2,
                 margin_left = 5 ),
-            0, 7, 1, 1 )
+            0, 8, 1, 1 )
+
+        is_worker_count_supported = (
+            IndicatorLunar.astro_backend_name
+            ==
+            IndicatorLunar.astro_backend_pyephem )
+
+        spinner_worker_count = (
+            self.create_spinbutton(
+                self.worker_count,
+                1,
+                max( os.cpu_count() or 1, self.worker_count ),
+                page_increment = 2,
+                tooltip_text = _(
+                    "The number of processes across which\n" +
+                    "comets, minor planets and satellites\n" +
+                    "are calculated.\n\n" +
+                    "A value of 1 calculates all bodies\n" +
+                    "within the indicator itself.\n\n" +
+                    "Worthwhile only for many hundreds\n" +
+                    "of comets, minor planets or satellites." ),
+                sensitive = is_worker_count_supported ) )
+
+        grid.attach(
+            self.create_box(
+                (
+                    (
+                        Gtk.Label.new( _( "Calculation processes" ) ),
+                        False ),
+                    (
+                        spinner_worker_count,
+                        False ) ),
+                margin_top = self.INDENT_WIDGET_TOP / 2,
+                margin_left = 5 ),
+            0, 9, 1, 1 )
 
         notebook.append_page( grid, Gtk.Label.new( _( "Menu" ) ) )
 
@@ -2332,16 +2862,19 @@ class IndicatorLunar( IndicatorBase ):
         natural_body_view_column_translated_name = 1
 
         # Show/hide, planet name, translated planet name.
-        planet_store = Gtk.ListStore( bool, str, str )
+        planets = [ ]
         for planet_name in IndicatorLunar.astro_backend.PLANETS:
-            planet_store.append( [
+            planets.append( [
                 planet_name in self.planets,
                 planet_name,
                 IndicatorLunar.astro_backend.PLANET_NAMES_TRANSLATIONS[ planet_name ] ] )
 
-        scrolledwindow_planets = (
+        planet_store = Gtk.ListStore( bool, str, str )
+        box_planets, fill_planet_store = (
             self._create_natural_body_treeview_within_scrolledwindow(
+                dialog,
                 planet_store,
+                planets,
                 _( "Planets" ),
                 _(
                     "Check a planet to display in the menu.\n\n" +
@@ -2352,9 +2885,9 @@ class IndicatorLunar( IndicatorBase ):
                 natural_body_view_column_hide_show ) )
 
         # Show/hide, minor planet designation, human readable name.
-        minor_planet_store = Gtk.ListStore( bool, str, str )
+        minor_planets = [ ]
         for minor_planet in sorted( self.minor_planet_orbital_element_data.keys() ):
-            minor_planet_store.append( [
+            minor_planets.append( [
                 minor_planet in self.minor_planets,
                 minor_planet,
                 self.minor_planet_orbital_element_data[ minor_planet ].get_name() ] )
@@ -2362,7 +2895,10 @@ class IndicatorLunar( IndicatorBase ):
         minor_planet_data_available = (
             self.minor_planet_orbital_element_data
             and
-            self.minor_planet_apparent_magnitude_data )
+            (
+                self.minor_planets_apparent_magnitude_from_orbital_element
+                or
+                self.minor_planet_apparent_magnitude_data ) )
 
         tooltip = (
             _(
@@ -2375,9 +2911,12 @@ class IndicatorLunar( IndicatorBase ):
                 "or no data was available, or the data\n" +
                 "was completely filtered by magnitude." ) )
 
-        scrolledwindow_minor_planets = (
+        minor_planet_store = Gtk.ListStore( bool, str, str )
+        box_minor_planets, fill_minor_planet_store = (
             self._create_natural_body_treeview_within_scrolledwindow(
+                dialog,
                 minor_planet_store,
+                minor_planets,
                 _( "Minor Planets" ),
                 tooltip,
                 natural_body_model_column_hide_show,
@@ -2385,16 +2924,19 @@ class IndicatorLunar( IndicatorBase ):
                 natural_body_view_column_hide_show ) )
 
         # Show/hide, comet designation, human readable name.
-        comet_store = Gtk.ListStore( bool, str, str )
+        comets = [ ]
         for comet in sorted( self.comet_orbital_element_data.keys() ):
-            comet_store.append( [
+            comets.append( [
                 comet in self.comets,
                 comet,
                 self.comet_orbital_element_data[ comet ].get_name() ] )
 
-        scrolledwindow_comets = (
+        comet_store = Gtk.ListStore( bool, str, str )
+        box_comets, fill_comet_store = (
             self._create_natural_body_treeview_within_scrolledwindow(
+                dialog,
                 comet_store,
+                comets,
                 _( "Comets" ),
                 _(
                     "Check a comet to display in the menu.\n\n" +
@@ -2418,12 +2960,11 @@ class IndicatorLunar( IndicatorBase ):
 
         # Show/hide, star name, star translated name.
         star_store = Gtk.ListStore( bool, str, str )
-        for star in sorted( stars, key = lambda x: ( x[ 2 ] ) ):
-            star_store.append( star )
-
-        scrolledwindow_stars = (
+        box_stars, fill_star_store = (
             self._create_natural_body_treeview_within_scrolledwindow(
+                dialog,
                 star_store,
+                sorted( stars, key = lambda x: ( x[ 2 ] ) ),
                 _( "Stars" ),
                 _(
                     "Check a star to display in the menu.\n\n" +
@@ -2436,10 +2977,10 @@ class IndicatorLunar( IndicatorBase ):
         notebook.append_page(
             self.create_box(
                 (
-                    ( scrolledwindow_planets, True ),
-                    ( scrolledwindow_minor_planets, True ),
-                    ( scrolledwindow_comets, True ),
-                    ( scrolledwindow_stars, True ) ),
+                    ( box_planets, True ),
+                    ( box_minor_planets, True ),
+                    ( box_comets, True ),
+                    ( box_stars, True ) ),
                 spacing = 20 ),
             Gtk.Label.new( _( "Natural Bodies" ) ) )
 
@@ -2455,17 +2996,22 @@ class IndicatorLunar( IndicatorBase ):
         satellite_view_column_international_designator = 3
 
         # Show/hide, name, number, international designator.
-        satellite_store = Gtk.ListStore( bool, str, str, str )
-        for satellite in self.satellite_general_perturbation_data:
-            satellite_object = (
-                self.satellite_general_perturbation_data[ satellite ] )
+        satellites = [ ]
+        for satellite, satellite_object in (
+            self.satellite_general_perturbation_data.items() ):
 
-            satellite_store.append( [
+            satellites.append( [
                 satellite in self.satellites,
                 satellite_object.get_name(),
                 satellite,
                 satellite_object.get_international_designator() ] )
 
+        satellite_store = Gtk.ListStore( bool, str, str, str )
+        satellite_iters = [ ]
+        fill_satellite_store = (
+            self._fill_store_on_idle(
+                dialog, satellite_store, satellites, satellite_iters ) )
+
         treeview, scrolledwindow = (
             self.create_treeview_within_scrolledwindow(
                 satellite_store,
@@ -2518,10 +3064,22 @@ class IndicatorLunar( IndicatorBase ):
                     (
                         self._on_columnheader,
                         satellite_store,
-                        satellite_model_column_hide_show ), ), ) ) )
+                        satellite_model_column_hide_show,
+                        fill_satellite_store ), ), ) ) )
+
+        search_entry = (
+            IndicatorLunar._create_treeview_search_entry(
+                treeview,
+                [ satellite[ satellite_model_column_name ] for satellite in satellites ],
+                satellite_iters,
+                fill_satellite_store ) )
 
         notebook.append_page(
-            self.create_box( ( ( scrolledwindow, True ), ) ),
+            self.create_box(
+                (
+                    ( search_entry, False ),
+                    ( scrolledwindow, True ) ),
+                orientation = Gtk.Orientation.VERTICAL ),
             Gtk.Label.new( _( "Satellites" ) ) )
 
         # Notifications.
@@ -2530,26 +3088,22 @@ class IndicatorLunar( IndicatorBase ):
 
         grid = self.create_grid()
 
-        # Convert from list of lists to a Gtk ListStore.
-        types = [ ]
-        for item in IndicatorLunar.astro_backend.SATELLITE_TAG_TRANSLATIONS[ 0 ]:
-            types.append( type( item[ 0 ] ) )
+        satellite_tags_original_to_translated = { }
+        satellite_tags_translated_to_original = { }
+        for tag, translated_tag in (
+            IndicatorLunar.astro_backend.SATELLITE_TAG_TRANSLATIONS ):
 
-        satellite_tag_translations = Gtk.ListStore()
-        satellite_tag_translations.set_column_types( types )
-        for item in IndicatorLunar.astro_backend.SATELLITE_TAG_TRANSLATIONS:
-            satellite_tag_translations.append( item )
+            satellite_tags_original_to_translated[ tag ] = translated_tag
+            satellite_tags_translated_to_original[ translated_tag ] = tag
 
         message_text = (
             self._translate_text_using_tags(
-                satellite_tag_translations,
-                True,
+                satellite_tags_original_to_translated,
                 self.satellite_notification_message ) )
 
         summary_text = (
             self._translate_text_using_tags(
-                satellite_tag_translations,
-                True,
+                satellite_tags_original_to_translated,
                 self.satellite_notification_summary ) )
 
         tooltip_common = (
@@ -2789,7 +3343,7 @@ class IndicatorLunar( IndicatorBase ):
 
             self.indicator_text = (
                 self._translate_text_using_tags(
-                    display_tags_store, False, indicator_text.get_text() ) )
+                    tags_translated_to_original, indicator_text.get_text() ) )
 
             self.indicator_text_separator = indicator_text_separator.get_text()
             self.show_rise_when_set_before_sunset = (
@@ -2803,6 +3357,9 @@ class IndicatorLunar( IndicatorBase ):
             self.minor_planets_add_new = (
                 minor_planets_add_new_checkbutton.get_active() )
 
+            self.minor_planets_apparent_magnitude_from_orbital_element = (
+                minor_planets_apparent_magnitude_from_orbital_element_checkbutton.get_active() )
+
             self.satellites_sort_by_date_time = (
                 sort_satellites_by_date_time_checkbutton.get_active() )
 
@@ -2831,6 +3388,15 @@ class IndicatorLunar( IndicatorBase ):
             self.satellite_limit_end = (
                 spinner_satellite_limit_end.get_value_as_int() )
 
+            self.worker_count = spinner_worker_count.get_value_as_int()
+
+            # Any rows yet to be appended must be present before reading.
+            fill_planet_store()
+            fill_star_store()
+            fill_comet_store()
+            fill_minor_planet_store()
+            fill_satellite_store()
+
             self.planets = [ ]
             for row in planet_store:
                 if row[ natural_body_model_column_hide_show ]:
@@ -2842,24 +3408,32 @@ class IndicatorLunar( IndicatorBase ):
                     self.stars.append( row[ natural_body_model_column_name ] )
 
             # If the option to add new comets is checked,
-            # this will be handled out in the main update loop.
-            # Otherwise, update the list of checked comets;
+            # this will be handled once the comet data is refreshed.
+            # Otherwise, update the list of checked comets, unless the data
+            # was yet to load when the dialog was opened, in which case keep
+            # the checked comets as is;
             # similarly for minor planets and satellites.
-            self.comets = [ ]
+            if self.comets_add_new or comets:
+                self.comets = [ ]
+
             if not self.comets_add_new:
                 for comet in comet_store:
                     if comet[ natural_body_model_column_hide_show ]:
                         self.comets.append(
                             comet[ natural_body_model_column_name ] )
 
-            self.minor_planets = [ ]
+            if self.minor_planets_add_new or minor_planets:
+                self.minor_planets = [ ]
+
             if not self.minor_planets_add_new:
                 for minor_planet in minor_planet_store:
                     if minor_planet[ natural_body_model_column_hide_show ]:
                         self.minor_planets.append(
                             minor_planet[ natural_body_model_column_name ] )
 
-            self.satellites = [ ]
+            if self.satellites_add_new or satellites:
+                self.satellites = [ ]
+
             if not self.satellites_add_new:
                 for satellite in satellite_store:
                     if satellite[ satellite_model_column_hide_show ]:
@@ -2874,14 +3448,12 @@ class IndicatorLunar( IndicatorBase ):
 
             self.satellite_notification_summary = (
                 self._translate_text_using_tags(
-                    satellite_tag_translations,
-                    False,
+                    satellite_tags_translated_to_original,
                     satellite_notification_summary_text.get_text() ) )
 
             self.satellite_notification_message = (
                 self._translate_text_using_tags(
-                    satellite_tag_translations,
-                    False,
+                    satellite_tags_translated_to_original,
                     self.get_textview_text(
                         satellite_notification_message_text ) ) )
 
@@ -2909,10 +3481,12 @@ class IndicatorLunar( IndicatorBase ):
         return response_type
 
 
-    def _initialise_display_tags_store(
-        self,
-        display_tags_store ):
-
+    def _get_display_tags( self ):
+        '''
+        Returns a list of the tags of those bodies having data, each being the
+        original tag, translated tag, data tag and data.
+        '''
+        display_tags = [ ]
         items = [
             [
                 IndicatorLunar.astro_backend.BodyType.MOON,
@@ -2928,10 +3502,9 @@ class IndicatorLunar( IndicatorBase ):
             body_tag = item[ IndicatorLunar.DATA_INDEX_BODY_NAME ]
             data_tags = item[ IndicatorLunar.DATA_INDEX_DATA_NAME ]
 
+            body_data = self.data.get( ( body_type, body_tag ) )
             azimuth_in_data = (
-                ( body_type, body_tag, IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH )
-                in
-                self.data )
+                body_data is not None and body_data.azimuth is not None )
 
             if azimuth_in_data:
                 # Only add this body's attributes if there is data present.
@@ -2941,12 +3514,12 @@ class IndicatorLunar( IndicatorBase ):
                         " " +
                         IndicatorLunar.astro_backend.DATA_TAGS_TRANSLATIONS[ data_tag ] )
 
-                    value = ""
-                    key = ( body_type, body_tag, data_tag )
-                    if key in self.data:
-                        value = self._format_data( data_tag, self.data[ key ] )
-                        display_tags_store.append( [
-                            body_tag + " " + data_tag, translated_tag, value ] )
+                    if body_data.get( data_tag ) is not None:
+                        display_tags.append( [
+                            body_tag + " " + data_tag,
+                            translated_tag,
+                            data_tag,
+                            body_data.get( data_tag ) ] )
 
         items = [
             [
@@ -2963,10 +3536,10 @@ class IndicatorLunar( IndicatorBase ):
             body_tags = item[ IndicatorLunar.DATA_INDEX_BODY_NAME ]
             data_tags = item[ IndicatorLunar.DATA_INDEX_DATA_NAME ]
             for body_tag in body_tags:
+                body_data = self.data.get( ( body_type, body_tag ) )
                 azimuth_in_data = (
-                    ( body_type, body_tag, IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH )
-                    in
-                    self.data )
+                    body_data is not None and body_data.azimuth is not None )
+
                 if azimuth_in_data:
                     # Only add this body's attributes if there is data present.
 
@@ -2976,13 +3549,12 @@ class IndicatorLunar( IndicatorBase ):
                             " " +
                             IndicatorLunar.astro_backend.DATA_TAGS_TRANSLATIONS[ data_tag ] )
 
-                        value = ""
-                        key = ( body_type, body_tag, data_tag )
-                        if key in self.data:
-                            value = (
-                                self._format_data( data_tag, self.data[ key ] ) )
-                            display_tags_store.append( [
-                                body_tag + " " + data_tag, translated_tag, value ] )
+                        if body_data.get( data_tag ) is not None:
+                            display_tags.append( [
+                                body_tag + " " + data_tag,
+                                translated_tag,
+                                data_tag,
+                                body_data.get( data_tag ) ] )
 
         items = [
             [
@@ -2999,10 +3571,9 @@ class IndicatorLunar( IndicatorBase ):
             body_tags = item[ IndicatorLunar.DATA_INDEX_BODY_NAME ]
             data_tags = item[ IndicatorLunar.DATA_INDEX_DATA_NAME ]
             for body_tag in body_tags:
+                body_data = self.data.get( ( body_type, body_tag ) )
                 azimuth_in_data = (
-                    ( body_type, body_tag, IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH )
-                    in
-                    self.data )
+                    body_data is not None and body_data.azimuth is not None )
 
                 if azimuth_in_data:
                     # Only add this body's attributes if there is data present.
@@ -3012,37 +3583,30 @@ class IndicatorLunar( IndicatorBase ):
                             " " +
                             IndicatorLunar.astro_backend.DATA_TAGS_TRANSLATIONS[ data_tag ] )
 
-                        value = ""
-                        key = ( body_type, body_tag, data_tag )
-                        if key in self.data:
-                            value = (
-                                self._format_data( data_tag, self.data[ key ] ) )
-                            display_tags_store.append( [
-                                body_tag + " " + data_tag, translated_tag, value ] )
+                        if body_data.get( data_tag ) is not None:
+                            display_tags.append( [
+                                body_tag + " " + data_tag,
+                                translated_tag,
+                                data_tag,
+                                body_data.get( data_tag ) ] )
 
         body_type = IndicatorLunar.astro_backend.BodyType.SATELLITE
-        for body_tag in self.satellite_general_perturbation_data:
+        for body_tag, satellite_object in (
+            self.satellite_general_perturbation_data.items() ):
+
+            body_data = self.data.get( ( body_type, body_tag ) )
             azimuth_in_data = (
-                ( body_type, body_tag, IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH )
-                in
-                self.data )
+                body_data is not None and body_data.azimuth is not None )
 
             rise_azimuth_in_data = (
-                ( body_type, body_tag, IndicatorLunar.astro_backend.DATA_TAG_AZIMUTH )
-                in
-                self.data )
+                body_data is not None and body_data.azimuth is not None )
 
             if azimuth_in_data or rise_azimuth_in_data:
                 # Add this body's attributes ONLY if data is present.
                 for data_tag in IndicatorLunar.astro_backend.DATA_TAGS_SATELLITE:
-                    value = ""
-                    name = (
-                        self.satellite_general_perturbation_data[
-                            body_tag ].get_name()  )
-
+                    name = satellite_object.get_name()
                     international_designator = (
-                        self.satellite_general_perturbation_data[
-                            body_tag ].get_international_designator() )
+                        satellite_object.get_international_designator() )
 
                     translated_tag = (
                         name + " : " +
@@ -3050,55 +3614,37 @@ class IndicatorLunar( IndicatorBase ):
                         international_designator + " " +
                         IndicatorLunar.astro_backend.DATA_TAGS_TRANSLATIONS[ data_tag ] )
 
-                    key = (
-                        IndicatorLunar.astro_backend.BodyType.SATELLITE,
-                        body_tag,
-                        data_tag )
+                    if body_data.get( data_tag ) is not None:
+                        display_tags.append( [
+                            body_tag + " " + data_tag,
+                            translated_tag,
+                            data_tag,
+                            body_data.get( data_tag ) ] )
 
-                    if key in self.data:
-                        value = self._format_data( data_tag, self.data[ key ] )
-                        display_tags_store.append( [
-                            body_tag + " " + data_tag, translated_tag, value ] )
+        return display_tags
 
 
+    @staticmethod
     def _translate_text_using_tags(
-        self,
-        tags_list_store,
-        original_to_local,
+        tags,
         text ):
+        '''
+        Translate the tags within the text, either from original to local text
+        or from local to original text.
 
-        # The tags list store contains at three columns.
-        #   First column contains the original/untranslated tags.
-        #   Second column contains the translated tags.
-        #   Third column contains the tag's corresponding value.
-        # Translate the tags within the indicator label back/forth original
-        # text and local text.
-        if original_to_local:
-            i = 0
-            j = 1
-
-        else:
-            i = 1
-            j = 0
-
-        translated_text = text
-        tags = re.findall( r"\[([^\[^\]]+)\]", translated_text )
-        for tag in tags:
-            iterator = tags_list_store.get_iter_first()
-            while iterator:
-                row = tags_list_store[ iterator ]
-                if row[ i ] == tag:
-                    translated_text = (
-                        translated_text.replace(
-                            "[" + tag + "]",
-                            "[" + row[ j ] + "]" ) )
-
-                    iterator = None # Break and move on to next tag.
-
-                else:
-                    iterator = tags_list_store.iter_next( iterator )
+        tags
+            Dictionary of tags to translate.
+            Key: tag (original or translated);
+            Value: tag in the other language.
 
-        return translated_text
+        Returns the text with each tag found in the dictionary translated;
+        any other tag is left as is.
+        '''
+        return (
+            re.sub(
+                r"\[([^\[^\]]+)\]",
+                lambda match: "[" + tags.get( match.group( 1 ), match.group( 1 ) ) + "]",
+                text ) )
 
 
     def _on_tags_values_double_click(
@@ -3118,12 +3664,20 @@ class IndicatorLunar( IndicatorBase ):
 
     def _create_natural_body_treeview_within_scrolledwindow(
         self,
+        dialog,
         treemodel,
+        rows,
         title,
         tooltip_text,
         natural_body_model_column_hide_show,
         natural_body_model_column_translated_name,
         natural_body_view_column_hide_show ):
+        '''
+        Returns a tuple of a box, containing a search entry above the treeview
+        within a scrolled window, and the function to fill the store.
+        '''
+        iters = [ ]
+        fill_store = self._fill_store_on_idle( dialog, treemodel, rows, iters )
 
         treeview, scrolledwindow = (
             self.create_treeview_within_scrolledwindow(
@@ -3151,16 +3705,144 @@ class IndicatorLunar( IndicatorBase ):
                     (
                         self._on_columnheader,
                         treemodel,
-                        natural_body_model_column_hide_show ), ), ) ) )
+                        natural_body_model_column_hide_show,
+                        fill_store ), ), ) ) )
 
-        return scrolledwindow
+        search_entry = (
+            IndicatorLunar._create_treeview_search_entry(
+                treeview,
+                [ row[ natural_body_model_column_translated_name ] for row in rows ],
+                iters,
+                fill_store ) )
+
+        box = (
+            self.create_box(
+                (
+                    ( search_entry, False ),
+                    ( scrolledwindow, True ) ),
+                orientation = Gtk.Orientation.VERTICAL ) )
+
+        return box, fill_store
+
+
+    def _fill_store_on_idle(
+        self,
+        dialog,
+        store,
+        rows,
+        iters = None ):
+        '''
+        Append the rows to the store, the first chunk of rows immediately and
+        the remaining rows in chunks when idle, until the dialog is closed.
+
+        rows
+            An iterable of rows, each row being a list of values for the store.
+
+        iters
+            If not None, a list to which the iter of each row is appended, in
+            the order of the rows, as the row is appended to the store.
+
+        Returns a function which when called, appends any remaining rows at
+        once, such as when the rows are to be read.
+        '''
+        rows = iter( rows )
+        source_id = None
+
+        def append_rows( count ):
+            # Returns True if there may be further rows to append.
+            appended = 0
+            for row in islice( rows, count ):
+                iter_ = store.append( row )
+                if iters is not None:
+                    iters.append( iter_ )
+
+                appended += 1
+
+            return appended == count
+
+
+        def on_idle():
+            nonlocal source_id
+            if not dialog.get_visible():
+                source_id = None
+
+            elif not append_rows( IndicatorLunar.PREFERENCES_STORE_CHUNK_SIZE ):
+                source_id = None
+
+            return source_id is not None
+
+
+        def fill_store():
+            nonlocal source_id
+            if source_id is not None:
+                GLib.source_remove( source_id )
+                source_id = None
+
+            append_rows( None )
+
+
+        if append_rows( IndicatorLunar.PREFERENCES_STORE_CHUNK_SIZE ):
+            source_id = GLib.idle_add( on_idle )
+
+        return fill_store
+
+
+    @staticmethod
+    def _create_treeview_search_entry(
+        treeview,
+        names,
+        iters,
+        fill_store ):
+        '''
+        Return an entry which, as text is typed, selects and scrolls to the
+        first row (in alphabetical order) of the treeview whose name starts
+        with the text, ignoring case.
+
+        names
+            The name of each row, in the order the rows are appended.
+
+        iters
+            The list of iters, as filled by _fill_store_on_idle().
+
+        The built-in search of the treeview, which compares the text against
+        each row in turn for each character typed, is disabled.  Instead the
+        names are indexed in lower case and sorted, so that the first match is
+        found by a binary search and the row of the match is found from the
+        list of iters (which remain valid when the store is sorted).
+        '''
+        index = sorted(
+            ( name.lower(), i )
+            for i, name in enumerate( names ) )
+
+        def on_changed( entry ):
+            key = entry.get_text().lower()
+            i = bisect_left( index, ( key, ) )
+            if key and i < len( index ) and index[ i ][ 0 ].startswith( key ):
+                fill_store() # The row of the match must be present.
+                path = treeview.get_model().get_path( iters[ index[ i ][ 1 ] ] )
+                treeview.set_cursor( path, None, False )
+                treeview.scroll_to_cell( path, None, True, 0.5, 0.0 )
+
+
+        treeview.set_enable_search( False )
+
+        entry = (
+            IndicatorLunar.create_entry(
+                "",
+                tooltip_text = _( "Type a name to find in the list." ) ) )
+
+        entry.connect( "changed", on_changed )
+        return entry
 
 
     def _on_columnheader(
         self,
         treeviewcolumn,
         datastore,
-        datastore_column_hide_show ):
+        datastore_column_hide_show,
+        fill_store ):
+
+        fill_store() # All rows must be present to toggle.
 
         all_items_checked = True
         for i, row in enumerate( datastore ):
@@ -3404,6 +4086,15 @@ class IndicatorLunar( IndicatorBase ):
         self.minor_planets_add_new = (
             config.get( IndicatorLunar.CONFIG_MINOR_PLANETS_ADD_NEW, False ) )
 
+        # Apparent magnitudes of minor planets are either downloaded separately,
+        # for the current day, or computed by the backend from the absolute
+        # magnitude and slope parameter in the orbital elements, for the
+        # current time.
+        self.minor_planets_apparent_magnitude_from_orbital_element = (
+            config.get(
+                IndicatorLunar.CONFIG_MINOR_PLANETS_APPARENT_MAGNITUDE_FROM_ORBITAL_ELEMENT,
+                False ) )
+
         # Although a value of 6 is visible with the naked eye,
         # that gives too many minor planets initially.
         self.magnitude = (
@@ -3462,6 +4153,8 @@ class IndicatorLunar( IndicatorBase ):
                 IndicatorLunar.CONFIG_WEREWOLF_WARNING_SUMMARY,
                 IndicatorLunar.WEREWOLF_WARNING_SUMMARY_DEFAULT ) )
 
+        self.worker_count = config.get( IndicatorLunar.CONFIG_WORKER_COUNT, 1 )
+
 
     def save_config( self ):
         '''
@@ -3522,6 +4215,9 @@ class IndicatorLunar( IndicatorBase ):
             IndicatorLunar.CONFIG_MINOR_PLANETS_ADD_NEW:
                 self.minor_planets_add_new,
 
+            IndicatorLunar.CONFIG_MINOR_PLANETS_APPARENT_MAGNITUDE_FROM_ORBITAL_ELEMENT:
+                self.minor_planets_apparent_magnitude_from_orbital_element,
+
             IndicatorLunar.CONFIG_MAGNITUDE:
                 self.magnitude,
 
@@ -3565,8 +4261,14 @@ class IndicatorLunar( IndicatorBase ):
                 self.werewolf_warning_message,
 
             IndicatorLunar.CONFIG_WEREWOLF_WARNING_SUMMARY:
-                self.werewolf_warning_summary
+                self.werewolf_warning_summary,
+
+            IndicatorLunar.CONFIG_WORKER_COUNT:
+                self.worker_count
         }
 
 
-IndicatorLunar().main()
+# Guarded, as worker processes (calculating bodies in parallel) import this
+# module afresh, under a name other than "__main__".
+if __name__ == "__main__":
+    IndicatorLunar().main()
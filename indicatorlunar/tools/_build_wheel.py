@@ -17,7 +17,7 @@
 
 
 '''
-Called by the build wheel process to create the planets.bsp and stars.dat
+Called by the build wheel process to create the planets.bsp and stars.bin
 used in astroskyfield.
 
 It is assumed this script is called from within a Python3 virtual environment.
@@ -28,6 +28,8 @@ will continue without failing.
 
 
 import gettext
+import math
+import struct
 import sys
 
 from datetime import date, timedelta
@@ -127,23 +129,43 @@ def _create_ephemeris_stars(
     data_path ):
     '''
     Create a star ephemeris for astroskyfield.
+
+    The star ephemeris is binary, being for each star, seven little endian
+    doubles:
+        HIP, magnitude, RA (degrees), Dec (degrees), parallax (mas),
+        proper motion in RA (mas/year), proper motion in Dec (mas/year)
+
+    which astroskyfield loads without the need for pandas.
     '''
     message = ""
     hip_main_dat = data_path / HIP_MAIN_DAT
     if hip_main_dat.exists():
-        content = ""
+        content = b""
         hips = [ star[ 1 ] for star in AstroBase.STARS ]
         with open( hip_main_dat, 'r', encoding = "utf-8" ) as f:
             for line in f:
-                # HIP is located at bytes 9 - 14
+                # Fields are separated by '|'; those used are
+                #    1: HIP
+                #    5: Vmag
+                #    8: RAdeg
+                #    9: DEdeg
+                #   11: Plx
+                #   12: pmRA
+                #   13: pmDE
                 #    http://cdsarc.u-strasbg.fr/ftp/cats/I/239/ReadMe
-                hip = int( line[ 9 - 1 : 14 - 1 + 1 ].strip() )
+                fields = line.split( '|' )
+                hip = int( fields[ 1 ].strip() )
                 if hip in hips:
-                    content += line
+                    content += (
+                        struct.pack(
+                            "<7d",
+                            hip,
+                            *[
+                                float( fields[ i ] ) if fields[ i ].strip() else math.nan
+                                for i in ( 5, 8, 9, 11, 12, 13 ) ] ) )
 
-        indicatorbase.IndicatorBase.write_text_file(
-            data_path / "stars.dat",
-            content )
+        with open( data_path / "stars.bin", 'wb' ) as f:
+            f.write( content )
 
     else:
         message = f"Cannot locate { hip_main_dat }"
@@ -153,18 +175,17 @@ def _create_ephemeris_stars(
 
 def build( out_path ):
     '''
-    Called by the build wheel process to build planets.bsp and stars.dat for use
+    Called by the build wheel process to build planets.bsp and stars.bin for use
     by astroskyfield.
 
     Only do the build if astroskyfield is part of the release; otherwise skip.
 
     Further, the build will only work on 64 bit (based on current understanding)
     because the package numpy, which is used by
-        skyfield to create stars.dat
         jplephem to create planets.bsp
     will not install on 32 bit.
 
-    When running on 32 bit, skip building planets.bsp / stars.dat and return
+    When running on 32 bit, skip building planets.bsp / stars.bin and return
     an empty message so that the build wheel process continues.
     However, emit a warning to the console!
     '''
@@ -190,6 +211,6 @@ def build( out_path ):
         else:
             print(
                 "\n\nWARNING: THIS IS A 32 BIT OPERATING SYSTEM,\n"
-                "NEITHER PLANETS.BSP NOR STARS.DAT HAVE BEEN BUILT!\n\n" )
+                "NEITHER PLANETS.BSP NOR STARS.BIN HAVE BEEN BUILT!\n\n" )
 
     return message
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+'''
+Benchmark AstroPyEphem.calculate() for an increasing number of comets and
+minor planets, comparing serial calculation against calculation split across
+worker processes.
+
+Comets and minor planets are synthesised (random elliptical orbits, all bright
+enough to pass the apparent magnitude filter) so that no download is required.
+
+Run from the top level of the source tree, after the indicator has been run
+from source at least once (so that indicatorbase.py is linked into the
+indicatorlunar source), for example:
+
+    python3 -m indicatorlunar.tools.benchmark_astropyephem_workers \
+        --bodies 100 1000 5000 --workers 1 2 4
+'''
+
+
+import argparse
+import datetime
+import gettext
+import logging
+import random
+import sys
+import time
+
+if '../../' not in sys.path:
+    sys.path.insert( 0, '../../' )
+
+# Needed otherwise '_' will be undefined when importing AstroBase.
+gettext.install( "indicatorlunar.tools.benchmark_astropyephem_workers" )
+from indicatorlunar.src.indicatorlunar.astropyephem import AstroPyEphem
+from indicatorlunar.src.indicatorlunar.dataproviderapparentmagnitude import ApparentMagnitude
+from indicatorlunar.src.indicatorlunar.dataproviderorbitalelement import OrbitalElement
+
+
+def _create_orbital_element_data(
+    number_of_bodies,
+    name_prefix,
+    magnitude_model,
+    data_type,
+    random_ ):
+    '''
+    Create orbital element data in XEphem format for elliptical orbits.
+    '''
+    orbital_element_data = { }
+    for i in range( number_of_bodies ):
+        name = f"{ name_prefix } { i }"
+        data = (
+            f"{ name },e,"
+            f"{ random_.uniform( 0, 30 ):.4f},"
+            f"{ random_.uniform( 0, 360 ):.4f},"
+            f"{ random_.uniform( 0, 360 ):.4f},"
+            f"{ random_.uniform( 1.5, 4 ):.6f},0,"
+            f"{ random_.uniform( 0, 0.3 ):.5f},"
+            f"{ random_.uniform( 0, 360 ):.4f},"
+            f"10/01/2025,2000,{ magnitude_model }" )
+
+        orbital_element_data[ name.upper() ] = (
+            OrbitalElement( name, data, data_type ) )
+
+    return orbital_element_data
+
+
+def _calculate(
+    utc_now,
+    comets,
+    comet_data,
+    minor_planets,
+    minor_planet_data,
+    minor_planet_apparent_magnitude_data,
+    worker_count ):
+    '''
+    Calculate the comets and minor planets, returning the elapsed time.
+    '''
+    start = time.perf_counter()
+    AstroPyEphem.calculate(
+        utc_now,
+        51.5, -0.1, 15.0,
+        [ ], [ ], [ ], { },
+        utc_now, utc_now,
+        comets, comet_data,
+        minor_planets, minor_planet_data,
+        minor_planet_apparent_magnitude_data,
+        AstroPyEphem.MAGNITUDE_MAXIMUM,
+        { }, # Empty rise/set cache, so everything is calculated.
+        { }, # Empty almanac cache, likewise.
+        logging.getLogger(),
+        worker_count = worker_count )
+
+    return time.perf_counter() - start
+
+
+def _benchmark(
+    number_of_bodies,
+    workers ):
+    '''
+    Return the time to calculate the given number of comets and of minor
+    planets, for each number of workers.
+    '''
+    random_ = random.Random( number_of_bodies )
+
+    comet_data = (
+        _create_orbital_element_data(
+            number_of_bodies,
+            "C/Benchmark",
+            "g3.0,4.0",
+            OrbitalElement.DataType.XEPHEM_COMET,
+            random_ ) )
+
+    minor_planet_data = (
+        _create_orbital_element_data(
+            number_of_bodies,
+            "Benchmark",
+            "H3.0,0.15",
+            OrbitalElement.DataType.XEPHEM_MINOR_PLANET,
+            random_ ) )
+
+    minor_planet_apparent_magnitude_data = {
+        key : ApparentMagnitude( minor_planet.get_name(), "5.0" )
+        for key, minor_planet in minor_planet_data.items() }
+
+    comets = list( comet_data.keys() )
+    minor_planets = list( minor_planet_data.keys() )
+    utc_now = datetime.datetime.now( datetime.timezone.utc )
+    timings = [ ]
+    for worker_count in workers:
+        # The pool of workers is kept between calls, so start the pool ahead
+        # of timing, as the indicator would have done on a previous update,
+        # by calculating one comet per worker.
+        if worker_count > 1:
+            _calculate(
+                utc_now,
+                comets[ : worker_count ],
+                comet_data,
+                [ ],
+                minor_planet_data,
+                minor_planet_apparent_magnitude_data,
+                worker_count )
+
+        timings.append(
+            _calculate(
+                utc_now,
+                comets,
+                comet_data,
+                minor_planets,
+                minor_planet_data,
+                minor_planet_apparent_magnitude_data,
+                worker_count ) )
+
+    return timings
+
+
+def main():
+    '''
+    Parse the arguments and print the timings for each number of bodies.
+    '''
+    argument_parser = (
+        argparse.ArgumentParser(
+            description = "Benchmark AstroPyEphem serial versus parallel." ) )
+
+    argument_parser.add_argument(
+        "--bodies",
+        nargs = '+',
+        type = int,
+        default = [ 100, 1000, 5000 ],
+        help = "Number of comets (and also of minor planets) to calculate." )
+
+    argument_parser.add_argument(
+        "--workers",
+        nargs = '+',
+        type = int,
+        default = [ 1, 2, 4 ],
+        help = "Number of worker processes (1 is serial)." )
+
+    arguments = argument_parser.parse_args()
+
+    print(
+        f"{ 'Bodies':>8}" +
+        ''.join( f"{ f'{ w } worker(s)':>14}" for w in arguments.workers ) +
+        f"{ 'Speedup':>10}" )
+
+    for number_of_bodies in arguments.bodies:
+        timings = _benchmark( number_of_bodies, arguments.workers )
+        print(
+            f"{ number_of_bodies * 2:>8}" +
+            ''.join( f"{ t:>13.2f}s" for t in timings ) +
+            f"{ timings[ 0 ] / min( timings ):>9.1f}x" )
+
+
+if __name__ == "__main__":
+    main()
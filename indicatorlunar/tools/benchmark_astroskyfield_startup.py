@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+'''
+Benchmark the startup time and peak resident memory of astroskyfield.
+
+Each scenario is run in a fresh Python process so that nothing is shared
+between scenarios:
+    import: import AstroSkyfield only; the ephemerides are not loaded.
+    load: import AstroSkyfield and load both the planet and star ephemerides.
+    pandas: load the stars from hip_main.dat using pandas, as was done before
+        stars.bin (only if data/hip_main.dat is present).
+
+Run from the top level of the source tree, after the indicator has been run
+from source at least once (so that indicatorbase.py is linked into the
+indicatorlunar source) and with planets.bsp / stars.bin present in
+indicatorlunar/src/indicatorlunar/data, for example:
+
+    python3 -m indicatorlunar.tools.benchmark_astroskyfield_startup --runs 5
+'''
+
+
+import argparse
+import subprocess
+import sys
+
+
+_PREAMBLE = '''
+import gettext
+import resource
+import sys
+import time
+
+start = time.perf_counter()
+gettext.install( "indicatorlunar.tools.benchmark_astroskyfield_startup" )
+from indicatorlunar.src.indicatorlunar.astroskyfield import AstroSkyfield
+'''
+
+_POSTAMBLE = '''
+print(
+    time.perf_counter() - start,
+    resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss )
+'''
+
+_SCENARIOS = {
+    "import" : "",
+
+    "load" : '''
+AstroSkyfield._get_ephemeris_planets()
+AstroSkyfield._get_ephemeris_stars()
+''',
+
+    "pandas" : '''
+import io
+from pathlib import Path
+from skyfield.data import hipparcos
+from indicatorlunar.src.indicatorlunar.astrobase import AstroBase
+hips = { star[ 1 ] for star in AstroBase.STARS }
+hip_main_dat = (
+    Path( "indicatorlunar/src/indicatorlunar/data/hip_main.dat" ) )
+
+with open( hip_main_dat, 'rb' ) as f:
+    lines = [ line for line in f if int( line.split( b'|' )[ 1 ] ) in hips ]
+
+hipparcos.load_dataframe( io.BytesIO( b"".join( lines ) ) )
+''' }
+
+
+def _run( scenario ):
+    '''
+    Run the scenario in a fresh process, returning the elapsed time in seconds
+    and the peak resident memory in kilobytes.
+    '''
+    result = (
+        subprocess.run(
+            [ sys.executable, "-c", _PREAMBLE + _SCENARIOS[ scenario ] + _POSTAMBLE ],
+            capture_output = True,
+            text = True,
+            check = True ) )
+
+    elapsed, maximum_resident_set_size = result.stdout.split()
+    return float( elapsed ), int( maximum_resident_set_size )
+
+
+def main():
+    '''
+    Parse the arguments and print the best time and memory of each scenario.
+    '''
+    argument_parser = (
+        argparse.ArgumentParser(
+            description = "Benchmark astroskyfield startup time and memory." ) )
+
+    argument_parser.add_argument(
+        "--runs",
+        type = int,
+        default = 3,
+        help = "Number of runs of each scenario (the best is reported)." )
+
+    argument_parser.add_argument(
+        "--scenarios",
+        nargs = '+',
+        choices = list( _SCENARIOS.keys() ),
+        default = list( _SCENARIOS.keys() ),
+        help = "Scenarios to run." )
+
+    arguments = argument_parser.parse_args()
+
+    print( f"{ 'Scenario':<10}{ 'Time':>10}{ 'Max RSS':>14}" )
+    for scenario in arguments.scenarios:
+        try:
+            results = [ _run( scenario ) for run in range( arguments.runs ) ]
+            print(
+                f"{ scenario:<10}"
+                f"{ min( r[ 0 ] for r in results ):>9.2f}s"
+                f"{ min( r[ 1 ] for r in results ) / 1024:>11.1f} MB" )
+
+        except subprocess.CalledProcessError as e:
+            print( f"{ scenario:<10}failed: { e.stderr.strip().splitlines()[ -1 ] }" )
+
+
+if __name__ == "__main__":
+    main()
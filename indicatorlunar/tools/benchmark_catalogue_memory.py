@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+'''
+Benchmark the memory held by minor planet orbital element and apparent
+magnitude data once loaded, comparing a dictionary of objects against a
+columnar catalogue.
+
+Files of the form written by a download from Lowell Minor Planet Services are
+synthesised for the given number of minor planets.  Each load is run in a fresh
+Python process, after a first load has written the sidecar, so as to measure
+the load as at startup.
+
+Run from the top level of the source tree, after the indicator has been run
+from source at least once (so that indicatorbase.py is linked into the
+indicatorlunar source), for example:
+
+    python3 -m indicatorlunar.tools.benchmark_catalogue_memory \
+        --minor-planets 10000 40000
+'''
+
+
+# The files are synthesised using the functions which convert each minor
+# planet, which are internal to the data providers.
+# pylint: disable=protected-access
+
+
+import argparse
+import gettext
+import random
+import subprocess
+import sys
+import tempfile
+
+from pathlib import Path
+
+if '../../' not in sys.path:
+    sys.path.insert( 0, '../../' )
+
+# Needed otherwise '_' will be undefined when importing AstroBase.
+gettext.install( "indicatorlunar.tools.benchmark_catalogue_memory" )
+from indicatorlunar.src.indicatorlunar.dataproviderapparentmagnitude import DataProviderApparentMagnitude
+from indicatorlunar.src.indicatorlunar.dataproviderorbitalelement import DataProviderOrbitalElement
+
+
+_PREAMBLE = '''
+import gc
+import gettext
+import os
+import sys
+import tracemalloc
+
+gettext.install( "indicatorlunar.tools.benchmark_catalogue_memory" )
+from indicatorlunar.src.indicatorlunar.dataproviderapparentmagnitude import DataProviderApparentMagnitude
+from indicatorlunar.src.indicatorlunar.dataproviderorbitalelement import DataProviderOrbitalElement, OrbitalElement
+
+def get_resident_set_size():
+    with open( "/proc/self/statm" ) as f:
+        return int( f.read().split()[ 1 ] ) * os.sysconf( "SC_PAGE_SIZE" )
+
+gc.collect()
+resident_set_size = get_resident_set_size()
+tracemalloc.start()
+'''
+
+_LOAD = '''
+orbital_element_data = (
+    DataProviderOrbitalElement.load(
+        sys.argv[ 1 ],
+        OrbitalElement.DataType.SKYFIELD_MINOR_PLANET,
+        columnar = sys.argv[ 3 ] == "True" ) )
+
+apparent_magnitude_data = (
+    DataProviderApparentMagnitude.load(
+        sys.argv[ 2 ],
+        columnar = sys.argv[ 3 ] == "True" ) )
+'''
+
+_POSTAMBLE = '''
+gc.collect()
+print(
+    tracemalloc.get_traced_memory()[ 0 ],
+    get_resident_set_size() - resident_set_size )
+'''
+
+
+def _create_files(
+    directory,
+    number_of_minor_planets ):
+    '''
+    Write files of orbital elements and apparent magnitudes for the given
+    number of minor planets, returning the filenames.
+    '''
+    random_ = random.Random( number_of_minor_planets )
+    filename_orbital_element = Path( directory ) / "oe-20250101000000.txt"
+    filename_apparent_magnitude = Path( directory ) / "am-20250101000000.txt"
+    with open( filename_orbital_element, 'w', encoding = "utf-8" ) as f_orbital_element, \
+         open( filename_apparent_magnitude, 'w', encoding = "utf-8" ) as f_apparent_magnitude:
+
+        for i in range( 1, number_of_minor_planets + 1 ):
+            minor_planet = {
+                "ast_number" : i,
+                "designameByIdDesignationPrimary" : {
+                    "str_designame" : f"2025 B{ i }" },
+                "designameByIdDesignationName" : {
+                    "str_designame" : f"Benchmark{ i }" },
+                'h' : round( random_.uniform( 3, 20 ), 2 ),
+                "ephemeris" : [ { "v_mag" : round( random_.uniform( 6, 20 ), 2 ) } ] }
+
+            f_orbital_element.write(
+                DataProviderOrbitalElement._get_minor_planet(
+                    {
+                        "minorplanet" : minor_planet,
+                        "epoch" : "2025-10-01",
+                        'm' : random_.uniform( 0, 360 ),
+                        "peri" : random_.uniform( 0, 360 ),
+                        "node" : random_.uniform( 0, 360 ),
+                        'i' : random_.uniform( 0, 30 ),
+                        'e' : random_.uniform( 0, 0.3 ),
+                        'a' : random_.uniform( 1.5, 4 ) },
+                    DataProviderOrbitalElement._append_minor_planet_skyfield ) )
+
+            f_apparent_magnitude.write(
+                DataProviderApparentMagnitude._get_minor_planet( minor_planet ) )
+
+    return filename_orbital_element, filename_apparent_magnitude
+
+
+def _run(
+    filename_orbital_element,
+    filename_apparent_magnitude,
+    columnar ):
+    '''
+    Load in a fresh process, returning the memory held by the loaded data as
+    traced by Python and as resident, both in megabytes.
+    '''
+    result = (
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                _PREAMBLE + _LOAD + _POSTAMBLE,
+                str( filename_orbital_element ),
+                str( filename_apparent_magnitude ),
+                str( columnar ) ],
+            capture_output = True,
+            text = True,
+            check = True ) )
+
+    traced, resident_set_size = result.stdout.split()
+    return int( traced ) / 1024 / 1024, int( resident_set_size ) / 1024 / 1024
+
+
+def main():
+    '''
+    Parse the arguments and print the memory held for each number of minor
+    planets.
+    '''
+    argument_parser = (
+        argparse.ArgumentParser(
+            description = "Benchmark memory of loaded minor planet data, dictionary versus columnar." ) )
+
+    argument_parser.add_argument(
+        "--minor-planets",
+        nargs = '+',
+        type = int,
+        default = [ 10000, 40000 ],
+        help = "Number of minor planets in each synthesised download." )
+
+    arguments = argument_parser.parse_args()
+
+    print(
+        f"{ 'Minor planets':>14}"
+        f"{ 'Dictionary':>12}{ 'RSS':>10}"
+        f"{ 'Columnar':>12}{ 'RSS':>10}" )
+
+    for number_of_minor_planets in arguments.minor_planets:
+        with tempfile.TemporaryDirectory() as directory:
+            filenames = _create_files( directory, number_of_minor_planets )
+            _run( *filenames, False ) # Write the sidecars.
+            traced_dictionary, resident_set_size_dictionary = _run( *filenames, False )
+            traced_columnar, resident_set_size_columnar = _run( *filenames, True )
+
+        print(
+            f"{ number_of_minor_planets:>14}"
+            f"{ traced_dictionary:>10.1f}MB{ resident_set_size_dictionary:>8.1f}MB"
+            f"{ traced_columnar:>10.1f}MB{ resident_set_size_columnar:>8.1f}MB" )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+'''
+Benchmark the download of minor planet orbital elements from Lowell Minor
+Planet Services, comparing reading the whole of the JSON response and then
+building the file content, against reading the JSON response as a stream and
+writing each minor planet as read.
+
+The response is served from a local HTTP server.  Either a response recorded
+from Lowell is given, or a response is synthesised for the given number of
+minor planets.
+
+Run from the top level of the source tree, after the indicator has been run
+from source at least once (so that indicatorbase.py is linked into the
+indicatorlunar source), for example:
+
+    python3 -m indicatorlunar.tools.benchmark_lowell_download \
+        --minor-planets 10000 100000
+'''
+
+
+# The benchmark compares two ways of assembling the download from the
+# functions which convert each minor planet, which are internal to
+# DataProviderOrbitalElement.
+# pylint: disable=protected-access
+
+
+import argparse
+import gettext
+import json
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+if '../../' not in sys.path:
+    sys.path.insert( 0, '../../' )
+
+# Needed otherwise '_' will be undefined when importing AstroBase.
+gettext.install( "indicatorlunar.tools.benchmark_lowell_download" )
+from indicatorlunar.src.indicatorlunar.dataproviderorbitalelement import DataProviderOrbitalElement
+from indicatorlunar.src.indicatorlunar.indicatorbase import IndicatorBase
+
+
+_KEY = "query_closest_orbelements"
+
+
+def _create_response(
+    number_of_minor_planets ):
+    '''
+    Create a response of the form returned by Lowell, as bytes.
+    '''
+    random_ = random.Random( number_of_minor_planets )
+    minor_planets = [ ]
+    for i in range( 1, number_of_minor_planets + 1 ):
+        minor_planets.append( {
+            "minorplanet" : {
+                "ast_number" : i,
+                "designameByIdDesignationPrimary" : {
+                    "str_designame" : f"2025 B{ i }" },
+                "designameByIdDesignationName" : {
+                    "str_designame" : f"Benchmark{ i }" },
+                'h' : round( random_.uniform( 3, 20 ), 2 ),
+                "ephemeris" : [ { "v_mag" : round( random_.uniform( 6, 20 ), 2 ) } ] },
+            "epoch" : "2025-10-01",
+            'm' : random_.uniform( 0, 360 ),
+            "peri" : random_.uniform( 0, 360 ),
+            "node" : random_.uniform( 0, 360 ),
+            'i' : random_.uniform( 0, 30 ),
+            'e' : random_.uniform( 0, 0.3 ),
+            'a' : random_.uniform( 1.5, 4 ) } )
+
+    return json.dumps( { "data" : { _KEY : minor_planets } } ).encode( "utf-8" )
+
+
+def _serve(
+    response ):
+    '''
+    Serve the response, to any POST, from a local HTTP server.
+
+    Returns the server and the URL.
+    '''
+    class Handler( BaseHTTPRequestHandler ):
+        ''' Respond to each POST with the response. '''
+
+        def do_POST( self ): # pylint: disable=invalid-name
+            ''' Read and discard the request, then send the response. '''
+            self.rfile.read( int( self.headers[ "Content-Length" ] ) )
+            self.send_response( 200 )
+            self.send_header( "Content-Type", "application/json" )
+            self.send_header( "Content-Length", str( len( response ) ) )
+            self.end_headers()
+            self.wfile.write( response )
+
+
+        def log_message( self, format, *args ):
+            ''' Keep the output of the benchmark free of requests. '''
+
+
+    server = ThreadingHTTPServer( ( "127.0.0.1", 0 ), Handler )
+    threading.Thread( target = server.serve_forever, daemon = True ).start()
+    return server, f"http://127.0.0.1:{ server.server_address[ 1 ] }"
+
+
+def _download_whole(
+    url,
+    filename,
+    append_function ):
+    '''
+    Read the whole of the JSON, then build and write the content.
+    '''
+    json_, error_network, error_timeout = (
+        IndicatorBase.get_json( url, data = { "query" : "" } ) )
+
+    content = ""
+    for minor_planet in json_[ "data" ][ _KEY ]:
+        content += (
+            DataProviderOrbitalElement._get_minor_planet(
+                minor_planet,
+                append_function ) )
+
+    IndicatorBase.write_text_file( filename, content )
+
+
+def _download_stream(
+    url,
+    filename,
+    append_function ):
+    '''
+    Read the JSON as a stream, writing each minor planet as read.
+    '''
+    with open( filename, 'w', encoding = "utf-8" ) as f:
+        IndicatorBase.get_json_array(
+            url,
+            _KEY,
+            lambda minor_planet: f.write(
+                DataProviderOrbitalElement._get_minor_planet(
+                    minor_planet,
+                    append_function ) ),
+            data = { "query" : "" } )
+
+
+def _benchmark(
+    response,
+    append_function ):
+    '''
+    Return for each of whole and stream, the time in seconds and peak memory
+    in megabytes, and whether the files written are identical.
+    '''
+    server, url = _serve( response )
+    results = [ ]
+    contents = [ ]
+    with tempfile.TemporaryDirectory() as directory:
+        for download_function in ( _download_whole, _download_stream ):
+            filename = Path( directory ) / download_function.__name__
+            tracemalloc.start()
+            start = time.perf_counter()
+            download_function( url, filename, append_function )
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[ 1 ]
+            tracemalloc.stop()
+            results.append( ( elapsed, peak / 1024 / 1024 ) )
+            contents.append( filename.read_text( encoding = "utf-8" ) )
+
+    server.shutdown()
+    return results, contents[ 0 ] == contents[ 1 ]
+
+
+def main():
+    '''
+    Parse the arguments and print the results for each response.
+    '''
+    argument_parser = (
+        argparse.ArgumentParser(
+            description = "Benchmark Lowell download, whole versus stream." ) )
+
+    argument_parser.add_argument(
+        "--minor-planets",
+        nargs = '+',
+        type = int,
+        default = [ 10000, 100000 ],
+        help = "Number of minor planets in each synthesised response." )
+
+    argument_parser.add_argument(
+        "--response",
+        type = Path,
+        help = "A response recorded from Lowell (replaces synthesised responses)." )
+
+    argument_parser.add_argument(
+        "--xephem",
+        action = "store_true",
+        help = "Write XEphem format (Skyfield/MPC format otherwise)." )
+
+    arguments = argument_parser.parse_args()
+
+    append_function = (
+        DataProviderOrbitalElement._append_minor_planet_xephem
+        if arguments.xephem else
+        DataProviderOrbitalElement._append_minor_planet_skyfield )
+
+    if arguments.response:
+        responses = { arguments.response.name : arguments.response.read_bytes() }
+
+    else:
+        responses = {
+            str( number_of_minor_planets ) : _create_response( number_of_minor_planets )
+            for number_of_minor_planets in arguments.minor_planets }
+
+    print(
+        f"{ 'Response':>12}{ 'Size':>10}"
+        f"{ 'Whole':>10}{ 'Peak':>10}"
+        f"{ 'Stream':>10}{ 'Peak':>10}"
+        f"{ 'Same':>6}" )
+
+    for name, response in responses.items():
+        ( ( time_whole, peak_whole ), ( time_stream, peak_stream ) ), same = (
+            _benchmark( response, append_function ) )
+
+        print(
+            f"{ name:>12}{ len( response ) / 1024 / 1024:>8.1f}MB"
+            f"{ time_whole:>9.2f}s{ peak_whole:>8.1f}MB"
+            f"{ time_stream:>9.2f}s{ peak_stream:>8.1f}MB"
+            f"{ str( same ):>6}" )
+
+
+if __name__ == "__main__":
+    main()
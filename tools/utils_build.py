@@ -920,7 +920,7 @@ def _package_source(
         # that function will be called now.
         #
         # For example, indicatorlunar's astroskyfield requires planets.bsp
-        # and stars.dat to be built and included as part of the wheel which
+        # and stars.bin to be built and included as part of the wheel which
         # can be done in the indicator's build script.
         #
         # Note that any messages written to stdout by the indicator's build